@@ -10,12 +10,10 @@ MIDDLEWARE = [
 ]
 """
 
-import asyncio
-import traceback
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
-from observability_client import init_observability, track_event, track_service_error
+from observability_client import init_observability, track_event_nowait, track_service_error_nowait
 
 # Initialize in your Django app's __init__.py or settings.py
 # init_observability(
@@ -46,13 +44,11 @@ def create_item(request):
         # Extract user_id if authenticated
         user_id = request.user.id if request.user.is_authenticated else None
 
-        asyncio.create_task(
-            track_event(
-                "item_created",
-                user_id=user_id,
-                metadata={"name": data.get("name")},
-                category="business_event",
-            )
+        track_event_nowait(
+            "item_created",
+            user_id=user_id,
+            metadata={"name": data.get("name")},
+            category="business_event",
         )
 
         return JsonResponse(result, status=201)
@@ -74,15 +70,13 @@ def get_item(request, item_id):
         # Manual error tracking
         user_id = request.user.id if request.user.is_authenticated else None
 
-        asyncio.create_task(
-            track_service_error(
-                error_type=type(e).__name__,
-                error_message=str(e),
-                stack_trace=traceback.format_exc(),
-                request_path=request.path,
-                request_method=request.method,
-                user_id=user_id,
-            )
+        track_service_error_nowait(
+            error_type=type(e).__name__,
+            error_message=str(e),
+            stack_trace=e,
+            request_path=request.path,
+            request_method=request.method,
+            user_id=user_id,
         )
 
         return JsonResponse({"error": str(e)}, status=400)
@@ -1,9 +1,7 @@
 """Example Flask application with observability."""
 
-import asyncio
-import traceback
 from flask import Flask, request, jsonify
-from observability_client import init_observability, track_event, track_service_error
+from observability_client import init_observability, track_event_nowait, track_service_error_nowait
 from observability_client.middleware.flask import ObservabilityMiddleware
 
 # Initialize observability
@@ -43,12 +41,10 @@ def create_item():
     result = create_item_in_db(data)
 
     # Manual event tracking
-    asyncio.create_task(
-        track_event(
-            "item_created",
-            metadata={"name": data.get("name")},
-            category="business_event",
-        )
+    track_event_nowait(
+        "item_created",
+        metadata={"name": data.get("name")},
+        category="business_event",
     )
 
     return jsonify(result), 201
@@ -65,14 +61,12 @@ def get_item(item_id):
 
     except ValueError as e:
         # Manual error tracking
-        asyncio.create_task(
-            track_service_error(
-                error_type=type(e).__name__,
-                error_message=str(e),
-                stack_trace=traceback.format_exc(),
-                request_path=request.path,
-                request_method=request.method,
-            )
+        track_service_error_nowait(
+            error_type=type(e).__name__,
+            error_message=str(e),
+            stack_trace=e,
+            request_path=request.path,
+            request_method=request.method,
         )
 
         return jsonify({"error": str(e)}), 400
@@ -1,10 +1,7 @@
 """Observability client for Python applications."""
 
-from .client import ObservabilityClient, get_client, reset_client
-from .config import ObservabilityConfig, get_config, set_config, reset_config
-from .tracking import track_event, track_service_error
-from .decorators import track_event as track_event_decorator
-from .decorators import track_error
+import importlib
+from typing import Any, List, Optional
 
 __version__ = "1.0.0"
 
@@ -12,7 +9,9 @@ __all__ = [
     # Client
     "ObservabilityClient",
     "get_client",
+    "get_client_sync",
     "reset_client",
+    "warmup_client",
     # Config
     "ObservabilityConfig",
     "get_config",
@@ -20,16 +19,54 @@ __all__ = [
     "reset_config",
     # Tracking
     "track_event",
+    "track_event_nowait",
     "track_service_error",
+    "track_service_error_nowait",
     # Decorators
     "track_event_decorator",
     "track_error",
 ]
 
+# Public name -> (submodule, attribute). Submodules are imported on first
+# access (PEP 562), so ``import observability_client`` stays cheap.
+_LAZY_ATTRS = {
+    "ObservabilityClient": (".client", "ObservabilityClient"),
+    "get_client": (".client", "get_client"),
+    "get_client_sync": (".client", "get_client_sync"),
+    "reset_client": (".client", "reset_client"),
+    "warmup_client": (".client", "warmup_client"),
+    "ObservabilityConfig": (".config", "ObservabilityConfig"),
+    "get_config": (".config", "get_config"),
+    "set_config": (".config", "set_config"),
+    "reset_config": (".config", "reset_config"),
+    "track_event": (".tracking", "track_event"),
+    "track_event_nowait": (".tracking", "track_event_nowait"),
+    "track_service_error": (".tracking", "track_service_error"),
+    "track_service_error_nowait": (".tracking", "track_service_error_nowait"),
+    "track_event_decorator": (".decorators", "track_event"),
+    "track_error": (".decorators", "track_error"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
+
 
 def init_observability(
-    service_url: str = None,
-    service_name: str = None,
+    service_url: Optional[str] = None,
+    service_name: Optional[str] = None,
     timeout: float = 10.0,
     max_retries: int = 3,
     dev_mode: bool = False,
@@ -59,6 +96,8 @@ def init_observability(
         )
         ```
     """
+    from .config import ObservabilityConfig, set_config
+
     config = ObservabilityConfig(
         service_url=service_url or "http://localhost:8006",
         service_name=service_name or "python-service",
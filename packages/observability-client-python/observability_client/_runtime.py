@@ -0,0 +1,102 @@
+"""Background event loop for applications without one (Flask, Django/WSGI)."""
+
+import asyncio
+import concurrent.futures
+import os
+import threading
+from typing import Any, Callable, Coroutine, Optional
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, preferring uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
+    return loop
+
+
+class TelemetryRuntime:
+    """Event loop running in a daemon thread.
+
+    Synchronous code hands work to the loop with ``submit``, which only
+    schedules a callback and returns immediately. The thread is started on
+    first use and restarted after a fork, so pre-forking servers such as
+    gunicorn get one loop per worker process.
+    """
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The background loop, started on first access."""
+        loop = self._loop
+        if loop is None or self._pid != os.getpid():
+            loop = self._start()
+        return loop
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and self._pid == os.getpid():
+                return self._loop
+
+            loop = _new_event_loop()
+            thread = threading.Thread(
+                target=self._run_loop,
+                args=(loop,),
+                name="observability-telemetry",
+                daemon=True,
+            )
+            thread.start()
+
+            self._loop = loop
+            self._thread = thread
+            self._pid = os.getpid()
+            return loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def submit(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Schedule ``callback(*args)`` on the background loop."""
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    def run_coroutine(self, coro: Coroutine[Any, Any, Any]) -> "concurrent.futures.Future[Any]":
+        """Run a coroutine on the background loop and return its future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self) -> None:
+        """Stop the background loop and wait for the thread to exit."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or self._pid != os.getpid():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+
+
+_runtime: Optional[TelemetryRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> TelemetryRuntime:
+    """Get the process-wide telemetry runtime."""
+    global _runtime
+    if _runtime is None:
+        with _runtime_lock:
+            if _runtime is None:
+                _runtime = TelemetryRuntime()
+    return _runtime
@@ -1,30 +1,135 @@
 """Core observability client implementation."""
 
 import asyncio
+import atexit
+import gzip
 import logging
-from typing import Optional, Dict, Any
-from datetime import datetime
+import time
+import traceback
+from typing import Optional, Dict, Any, List, Tuple, Union
 
 import httpx
-from pydantic import BaseModel
+import orjson
 
+from ._runtime import get_runtime
 from .config import ObservabilityConfig, get_config
+from .utils.async_utils import spawn
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"content-type": "application/json"}
+_GZIP_JSON_HEADERS = {"content-type": "application/json", "content-encoding": "gzip"}
+
+# Endpoints the client posts to; full URLs are joined once per client
+_ENDPOINTS = ("/events", "/errors/services", "/events/bulk", "/errors/services/bulk")
+
+# Single-payload endpoint for each bulk endpoint. Services older than the bulk
+# endpoints answer them with 404; payloads are then posted one at a time.
+_SINGLE_ENDPOINTS = {"/events/bulk": "/events", "/errors/services/bulk": "/errors/services"}
+
+# How long a health check result is trusted before asking the service again.
+# After a failure, requests are skipped for this long, then tried again.
+_HEALTH_CHECK_TTL = 10.0
+
+# Shared default for payloads without metadata; never mutated
+_EMPTY_DICT: Dict[str, Any] = {}
+
+# Connection pool shared by every request made through a client instance
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=100,
+    max_connections=200,
+    keepalive_expiry=30.0,
+)
+
+
+# Formatted tracebacks keyed by the frames they cover, so errors raised
+# repeatedly from the same place are formatted once
+_STACK_CACHE: Dict[Tuple[Any, ...], str] = {}
+_STACK_CACHE_SIZE = 256
+
+
+def _format_exception(error: BaseException, limit: Optional[int] = None) -> str:
+    """Format an exception and its traceback like ``traceback.format_exc()``.
+
+    Args:
+        error: Exception to format
+        limit: Keep only the innermost ``limit`` frames; None keeps all of them
+
+    Returns:
+        The formatted traceback
+    """
+    if limit is not None:
+        # Negative limits keep the frames closest to where the error was raised
+        limit = -limit
+
+    tb = error.__traceback__
+    if tb is None or error.__cause__ is not None or error.__context__ is not None:
+        # Chained exceptions are rare enough to format in full every time
+        return "".join(traceback.format_exception(type(error), error, tb, limit=limit))
+
+    frames = []
+    while tb is not None:
+        frames.append((tb.tb_frame.f_code, tb.tb_lineno))
+        tb = tb.tb_next
+    key = (limit, *frames)
+
+    stack = _STACK_CACHE.get(key)
+    if stack is None:
+        stack = "Traceback (most recent call last):\n" + "".join(
+            traceback.format_tb(error.__traceback__, limit=limit)
+        )
+        if len(_STACK_CACHE) >= _STACK_CACHE_SIZE:
+            _STACK_CACHE.pop(next(iter(_STACK_CACHE)), None)
+        _STACK_CACHE[key] = stack
+
+    # The message differs between errors raised from the same frames
+    return stack + "".join(traceback.format_exception_only(type(error), error))
+
 
 class ObservabilityClient:
     """Async HTTP client for the observability service.
 
     This client handles all communication with the observability service,
     including automatic retries, health checks, and graceful degradation.
+    Events and errors are buffered in bounded queues and sent in batches by a
+    background flusher task, either when a batch fills up or every
+    ``flush_interval`` seconds. Settings are read from the config when the
+    client is created, so changing the config afterwards has no effect.
 
     Attributes:
         config: Configuration for the client
         _http_client: Internal httpx client for making requests
         _service_healthy: Flag indicating if service is available
+        _event_queue: Buffer of pending event payloads
+        _error_queue: Buffer of pending service error payloads
+        _flusher_task: Background task draining the queues
+        _dropped_events: Number of payloads dropped because a queue was full
     """
 
+    # Attributes are read on every tracked call; slots skip the instance dict
+    __slots__ = (
+        "config",
+        "_dev",
+        "_test",
+        "_svc_url",
+        "_retries",
+        "_backoff",
+        "_gzip_min_size",
+        "_urls",
+        "_url_health",
+        "_http_client",
+        "_service_healthy",
+        "_health_checked_at",
+        "_bulk_supported",
+        "_event_queue",
+        "_error_queue",
+        "_flush_requested",
+        "_flusher_task",
+        "_dropped_events",
+        "_event_template",
+        "_error_template",
+    )
+
     def __init__(self, config: Optional[ObservabilityConfig] = None):
         """Initialize the observability client.
 
@@ -32,10 +137,51 @@ class ObservabilityClient:
             config: Optional configuration. If not provided, uses global config.
         """
         self.config = config or get_config()
+
+        # Settings read on every call, cached to skip the config lookup
+        self._dev = self.config.dev_mode
+        self._test = self.config.test_mode
+        self._svc_url = self.config.service_url
+        self._retries = self.config.max_retries
+        self._backoff = self.config.retry_backoff
+        self._gzip_min_size = self.config.gzip_min_size
+        self._urls = {endpoint: f"{self._svc_url}{endpoint}" for endpoint in _ENDPOINTS}
+        self._url_health = f"{self._svc_url}/health"
+
         self._http_client: Optional[httpx.AsyncClient] = None
         self._service_healthy = True
+        self._health_checked_at = 0.0
+        self._bulk_supported = True
+        # Since Python 3.10 these bind to an event loop on first use, not here,
+        # so a client can be created in any thread and run on the telemetry loop
+        self._event_queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(
+            maxsize=self.config.queue_max_size
+        )
+        self._error_queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(
+            maxsize=self.config.queue_max_size
+        )
+        self._flush_requested = asyncio.Event()
+        self._flusher_task: Optional["asyncio.Task[None]"] = None
+        self._dropped_events = 0
+
+        # Payload skeletons with the fields that never change per call; keys
+        # are the service's EventCreate / ServiceErrorCreate fields
+        self._event_template: Dict[str, Any] = {
+            "event_type": None,
+            "service_name": self.config.service_name,
+            "event_metadata": _EMPTY_DICT,
+            "event_category": "user_action",
+        }
+        self._error_template: Dict[str, Any] = {
+            "error_type": None,
+            "error_message": None,
+            "service_name": self.config.service_name,
+            "endpoint": None,
+            "request_method": None,
+            "error_metadata": _EMPTY_DICT,
+        }
 
-        if self.config.dev_mode:
+        if self._dev:
             logging.basicConfig(level=logging.DEBUG)
             logger.debug("Observability client initialized in dev mode")
 
@@ -47,106 +193,395 @@ class ObservabilityClient:
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
+        await self.flush()
         await self.close()
 
-    async def _ensure_client(self) -> None:
-        """Ensure the HTTP client is initialized."""
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """Ensure the HTTP client is initialized and return it."""
         if self._http_client is None:
             self._http_client = httpx.AsyncClient(
-                timeout=self.config.timeout,
+                http2=self.config.http2,
+                timeout=httpx.Timeout(
+                    self.config.timeout,
+                    connect=min(self.config.timeout, 2.0),
+                ),
+                limits=_POOL_LIMITS,
                 follow_redirects=True,
             )
+        return self._http_client
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flusher task if it is not running.
+
+        Must be called from a running event loop.
+        """
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flush_loop())
+
+    def _put(self, queue: "asyncio.Queue[Dict[str, Any]]", data: Dict[str, Any]) -> bool:
+        """Queue a payload on the running loop, starting the flusher if needed."""
+        self._ensure_flusher()
+        return self._enqueue(queue, data)
+
+    def _put_nowait(self, queue: "asyncio.Queue[Dict[str, Any]]", data: Dict[str, Any]) -> bool:
+        """Queue a payload from any thread.
+
+        Inside a running event loop (e.g. FastAPI) the payload is queued
+        directly. Without one (Flask, Django/WSGI) it is handed to the
+        background telemetry loop, which owns the queue and the flusher.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            get_runtime().submit(self._put, queue, data)
+            return True
+        return self._put(queue, data)
 
     async def close(self) -> None:
-        """Close the HTTP client and cleanup resources."""
+        """Stop the background flusher and close the HTTP client."""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+            self._flusher_task = None
+
         if self._http_client is not None:
             await self._http_client.aclose()
             self._http_client = None
 
+    def _has_pending(self) -> bool:
+        """Whether anything is buffered or waiting to be reported."""
+        return bool(
+            self._dropped_events
+            or not self._event_queue.empty()
+            or not self._error_queue.empty()
+        )
+
+    async def _flush_detached(self) -> None:
+        """Flush on a new event loop after the one owning the HTTP client is gone."""
+        # Both are bound to the old loop and must not be awaited from this one
+        self._http_client = None
+        self._flusher_task = None
+        try:
+            await asyncio.wait_for(self.flush(), timeout=self.config.timeout)
+        finally:
+            await self.close()
+
+    def _enqueue(self, queue: "asyncio.Queue[Dict[str, Any]]", data: Dict[str, Any]) -> bool:
+        """Buffer a payload for the background flusher.
+
+        Args:
+            queue: Queue to put the payload on
+            data: Payload to buffer
+
+        When the queue is full, ``config.on_full`` decides whether the new
+        payload or the oldest buffered one is discarded. Either way the drop
+        is counted and reported on the next flush.
+
+        Returns:
+            True if the payload was queued, False if it was dropped
+        """
+        try:
+            queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self._dropped_events += 1
+            if self.config.on_full != "drop_old":
+                return False
+            queue.get_nowait()
+            queue.put_nowait(data)
+
+        if queue.qsize() >= self.config.batch_size:
+            self._flush_requested.set()
+        return True
+
+    async def _flush_loop(self) -> None:
+        """Flush queued payloads when a batch fills up or the interval elapses."""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(),
+                    timeout=self.config.flush_interval,
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                if self._dev:
+                    logger.error(f"Background flush failed: {e}")
+
+    async def _drain(
+        self,
+        queue: "asyncio.Queue[Dict[str, Any]]",
+        endpoint: str,
+        key: str,
+        extra: Optional[Dict[str, Any]] = None,
+        format_traces: bool = False,
+    ) -> None:
+        """Send everything currently in a queue as bulk requests.
+
+        If the service has no bulk endpoints, each payload is sent on its own
+        to the matching single-payload endpoint instead.
+
+        Args:
+            queue: Queue to drain
+            endpoint: Bulk API endpoint (e.g., '/events/bulk')
+            key: Request body key holding the list of payloads
+            extra: Optional payload to prepend to the first batch
+            format_traces: Format exceptions queued as stack traces before sending
+        """
+        while extra is not None or not queue.empty():
+            batch = [] if extra is None else [extra]
+            extra = None
+            while len(batch) < self.config.batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            if format_traces and not self._service_unavailable():
+                self._format_stack_traces(batch)
+            if self._bulk_supported:
+                await self._send_request(endpoint, {key: batch})
+                if self._bulk_supported:
+                    continue
+            single_endpoint = _SINGLE_ENDPOINTS[endpoint]
+            for data in batch:
+                await self._send_request(single_endpoint, data)
+
+    def _format_stack_traces(self, batch: List[Dict[str, Any]]) -> None:
+        """Replace exceptions queued as stack traces with their formatted text."""
+        limit = self.config.stack_trace_limit
+        for data in batch:
+            # Errors queued with a stack trace have their own metadata dict
+            metadata = data["error_metadata"]
+            stack_trace = metadata.get("stack_trace")
+            if isinstance(stack_trace, BaseException):
+                metadata["stack_trace"] = _format_exception(stack_trace, limit)
+
+    def _take_dropped_event(self) -> Optional[Dict[str, Any]]:
+        """Build a meta-event reporting payloads dropped since the last flush."""
+        dropped = self._dropped_events
+        if not dropped:
+            return None
+        self._dropped_events = 0
+
+        if self._dev:
+            logger.warning(f"Observability queue full, dropped {dropped} payloads since last flush")
+
+        return self._build_event(
+            "observability_events_dropped",
+            None,
+            None,
+            {"_dropped_since_last_flush": dropped},
+            "system",
+        )
+
+    async def flush(self) -> None:
+        """Send all buffered events and errors to the service immediately."""
+        await self._drain(
+            self._event_queue, "/events/bulk", "events", self._take_dropped_event()
+        )
+        await self._drain(
+            self._error_queue, "/errors/services/bulk", "errors", format_traces=True
+        )
+
     async def check_health(self) -> bool:
         """Check if the observability service is available.
 
+        A healthy result is cached for a few seconds so repeated checks don't
+        hit the network. A failed request marks the service unhealthy, which
+        also invalidates the cache.
+
         Returns:
             True if service is healthy, False otherwise
         """
-        if self.config.test_mode:
+        if self._test:
+            return True
+
+        if (
+            self._service_healthy
+            and time.monotonic() - self._health_checked_at < _HEALTH_CHECK_TTL
+        ):
             return True
 
         try:
-            await self._ensure_client()
-            response = await self._http_client.get(f"{self.config.service_url}/health")
+            http_client = await self._ensure_client()
+            response = await http_client.get(self._url_health)
             self._service_healthy = response.status_code == 200
+            self._health_checked_at = time.monotonic()
 
-            if self.config.dev_mode:
+            if self._dev:
                 logger.debug(f"Health check: {'healthy' if self._service_healthy else 'unhealthy'}")
 
             return self._service_healthy
         except Exception as e:
-            self._service_healthy = False
-            if self.config.dev_mode:
+            self._mark_unhealthy()
+            if self._dev:
                 logger.warning(f"Health check failed: {e}")
             return False
 
+    def _mark_unhealthy(self) -> None:
+        """Record that the service just failed a request or health check."""
+        self._service_healthy = False
+        self._health_checked_at = time.monotonic()
+
+    def _service_unavailable(self) -> bool:
+        """Whether the service failed recently enough that requests are skipped.
+
+        Once ``_HEALTH_CHECK_TTL`` has passed since the failure, the next
+        request is attempted again, and marks the service healthy if it goes
+        through.
+        """
+        return (
+            not self._service_healthy
+            and time.monotonic() - self._health_checked_at < _HEALTH_CHECK_TTL
+        )
+
     async def _send_request(
         self,
         endpoint: str,
         data: Dict[str, Any],
-        retry_count: int = 0,
     ) -> Optional[Dict[str, Any]]:
         """Send a request to the observability service with retry logic.
 
+        Failed attempts are retried up to ``max_retries`` times with
+        exponential backoff. Client errors (4xx) are not retried since
+        resending the same payload will not succeed.
+
         Args:
             endpoint: API endpoint (e.g., '/events')
             data: Data to send in the request body
-            retry_count: Current retry attempt number
 
         Returns:
             Response data as dict if successful, None otherwise
         """
-        if self.config.test_mode:
-            if self.config.dev_mode:
+        if self._test:
+            if self._dev:
                 logger.debug(f"Test mode: Would send to {endpoint}: {data}")
             return {"status": "test_mode", "data": data}
 
-        if not self._service_healthy and retry_count == 0:
-            # Skip first attempt if service is known to be unhealthy
-            if self.config.dev_mode:
+        if self._service_unavailable():
+            # Skip requests while the service is known to be unhealthy
+            if self._dev:
                 logger.warning("Service unhealthy, skipping request")
             return None
 
         try:
-            await self._ensure_client()
-            url = f"{self.config.service_url}{endpoint}"
+            http_client = await self._ensure_client()
+            url = self._urls.get(endpoint) or f"{self._svc_url}{endpoint}"
 
-            if self.config.dev_mode:
+            if self._dev:
                 logger.debug(f"Sending request to {url}: {data}")
 
-            response = await self._http_client.post(url, json=data)
-            response.raise_for_status()
+            # Encoded once and reused by every retry
+            body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            headers = _JSON_HEADERS
+            if self._gzip_min_size is not None and len(body) > self._gzip_min_size:
+                # Level 1: repetitive JSON keys compress well even at the fastest level
+                body = gzip.compress(body, compresslevel=1)
+                headers = _GZIP_JSON_HEADERS
+
+            for attempt in range(self._retries + 1):
+                try:
+                    response = await http_client.post(
+                        url, content=body, headers=headers
+                    )
+                    response.raise_for_status()
+
+                    self._service_healthy = True
+                    result: Dict[str, Any] = response.json()
+                    return result
+
+                except httpx.HTTPStatusError as e:
+                    if 400 <= e.response.status_code < 500:
+                        if e.response.status_code == 404 and endpoint in _SINGLE_ENDPOINTS:
+                            # An older service without the bulk endpoints
+                            self._bulk_supported = False
+                        if self._dev:
+                            logger.error(f"Request rejected, not retrying: {e}")
+                        return None
+                    error: httpx.HTTPError = e
+
+                except httpx.HTTPError as e:
+                    error = e
+
+                self._mark_unhealthy()
+
+                if attempt < self._retries:
+                    # Exponential backoff
+                    wait_time = self._backoff ** attempt
+                    if self._dev:
+                        logger.warning(f"Request failed, retrying in {wait_time}s: {error}")
+                    await asyncio.sleep(wait_time)
+
+            if self._dev:
+                logger.error(f"Request failed after {self._retries} retries: {error}")
+            return None
+
+        except Exception as e:
+            if self._dev:
+                logger.error(f"Unexpected error sending request: {e}")
+            return None
+
+    def _build_event(
+        self,
+        event_type: str,
+        user_id: Optional[int],
+        session_id: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        category: str,
+    ) -> Dict[str, Any]:
+        """Build the request payload for a user event."""
+        data = self._event_template.copy()
+        data["event_type"] = event_type
+        data["event_metadata"] = metadata or _EMPTY_DICT
+        data["event_category"] = category
+
+        if user_id is not None:
+            data["user_id"] = user_id
+
+        if session_id is not None:
+            data["session_id"] = session_id
 
-            self._service_healthy = True
-            return response.json()
+        return data
 
-        except httpx.HTTPError as e:
-            self._service_healthy = False
+    def _build_error(
+        self,
+        error_type: str,
+        error_message: str,
+        stack_trace: Optional[Union[str, BaseException]],
+        request_path: Optional[str],
+        request_method: Optional[str],
+        user_id: Optional[int],
+        session_id: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the request payload for a service error.
+
+        The service has no stack trace field; it is sent as
+        ``error_metadata["stack_trace"]``.
+        """
+        data = self._error_template.copy()
+        data["error_type"] = error_type
+        data["error_message"] = error_message
+        data["endpoint"] = request_path
+        data["request_method"] = request_method
+        if stack_trace is None:
+            data["error_metadata"] = metadata or _EMPTY_DICT
+        else:
+            data["error_metadata"] = {**(metadata or _EMPTY_DICT), "stack_trace": stack_trace}
 
-            if retry_count < self.config.max_retries:
-                # Exponential backoff
-                wait_time = (self.config.retry_backoff ** retry_count)
-                if self.config.dev_mode:
-                    logger.warning(f"Request failed, retrying in {wait_time}s: {e}")
+        if user_id is not None:
+            data["user_id"] = user_id
 
-                await asyncio.sleep(wait_time)
-                return await self._send_request(endpoint, data, retry_count + 1)
-            else:
-                if self.config.dev_mode:
-                    logger.error(f"Request failed after {self.config.max_retries} retries: {e}")
-                return None
+        if session_id is not None:
+            data["session_id"] = session_id
 
-        except Exception as e:
-            if self.config.dev_mode:
-                logger.error(f"Unexpected error sending request: {e}")
-            return None
+        return data
 
     async def track_event(
         self,
@@ -166,28 +601,57 @@ class ObservabilityClient:
             category: Event category (default: 'user_action')
 
         Returns:
-            Response data if successful, None otherwise
+            ``{"status": "queued"}`` once buffered for the next flush, the test
+            mode response in test mode, or None if the event was dropped
         """
-        data = {
-            "event_type": event_type,
-            "service_name": self.config.service_name,
-            "event_metadata": metadata or {},
-            "category": category,
-        }
+        data = self._build_event(event_type, user_id, session_id, metadata, category)
 
-        if user_id is not None:
-            data["user_id"] = user_id
+        if self._test:
+            return await self._send_request("/events", data)
 
-        if session_id is not None:
-            data["session_id"] = session_id
+        if not self._put(self._event_queue, data):
+            return None
+        return {"status": "queued"}
 
-        return await self._send_request("/events", data)
+    def track_event_nowait(
+        self,
+        event_type: str,
+        user_id: Optional[int] = None,
+        session_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        category: str = "user_action",
+    ) -> bool:
+        """Queue a user event without awaiting anything.
+
+        Safe to call from synchronous code. Without a running event loop the
+        event is handed to a background telemetry thread. It is sent by the
+        background flusher on its next run.
+
+        Args:
+            event_type: Type of event (e.g., 'user_action', 'page_view')
+            user_id: ID of the user performing the action
+            session_id: Session ID
+            metadata: Additional event metadata
+            category: Event category (default: 'user_action')
+
+        Returns:
+            True if the event was queued (or handed to the telemetry thread),
+            False if it was dropped
+        """
+        data = self._build_event(event_type, user_id, session_id, metadata, category)
+
+        if self._test:
+            if self._dev:
+                logger.debug(f"Test mode: Would queue event: {data}")
+            return True
+
+        return self._put_nowait(self._event_queue, data)
 
     async def track_service_error(
         self,
         error_type: str,
         error_message: str,
-        stack_trace: Optional[str] = None,
+        stack_trace: Optional[Union[str, BaseException]] = None,
         request_path: Optional[str] = None,
         request_method: Optional[str] = None,
         user_id: Optional[int] = None,
@@ -199,7 +663,8 @@ class ObservabilityClient:
         Args:
             error_type: Type of error (e.g., exception class name)
             error_message: Error message
-            stack_trace: Full stack trace
+            stack_trace: Full stack trace, or the exception itself to format it only
+                when the error is actually sent
             request_path: Request path where error occurred
             request_method: HTTP method (GET, POST, etc.)
             user_id: ID of the user (if applicable)
@@ -207,25 +672,66 @@ class ObservabilityClient:
             metadata: Additional error metadata
 
         Returns:
-            Response data if successful, None otherwise
+            ``{"status": "queued"}`` once buffered for the next flush, the test
+            mode response in test mode, or None if the error was dropped
         """
-        data = {
-            "error_type": error_type,
-            "error_message": error_message,
-            "service_name": self.config.service_name,
-            "stack_trace": stack_trace,
-            "request_path": request_path,
-            "request_method": request_method,
-            "error_metadata": metadata or {},
-        }
+        data = self._build_error(
+            error_type, error_message, stack_trace, request_path,
+            request_method, user_id, session_id, metadata,
+        )
 
-        if user_id is not None:
-            data["user_id"] = user_id
+        if self._test:
+            if isinstance(stack_trace, BaseException):
+                data["error_metadata"]["stack_trace"] = None
+            return await self._send_request("/errors/services", data)
 
-        if session_id is not None:
-            data["session_id"] = session_id
+        if not self._put(self._error_queue, data):
+            return None
+        return {"status": "queued"}
 
-        return await self._send_request("/service-errors", data)
+    def track_service_error_nowait(
+        self,
+        error_type: str,
+        error_message: str,
+        stack_trace: Optional[Union[str, BaseException]] = None,
+        request_path: Optional[str] = None,
+        request_method: Optional[str] = None,
+        user_id: Optional[int] = None,
+        session_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Queue a service error without awaiting anything.
+
+        Safe to call from synchronous code. Without a running event loop the
+        error is handed to a background telemetry thread. It is sent by the
+        background flusher on its next run.
+
+        Args:
+            error_type: Type of error (e.g., exception class name)
+            error_message: Error message
+            stack_trace: Full stack trace, or the exception itself to format it only
+                when the error is actually sent
+            request_path: Request path where error occurred
+            request_method: HTTP method (GET, POST, etc.)
+            user_id: ID of the user (if applicable)
+            session_id: Session ID (if applicable)
+            metadata: Additional error metadata
+
+        Returns:
+            True if the error was queued (or handed to the telemetry thread),
+            False if it was dropped
+        """
+        data = self._build_error(
+            error_type, error_message, stack_trace, request_path,
+            request_method, user_id, session_id, metadata,
+        )
+
+        if self._test:
+            if self._dev:
+                logger.debug(f"Test mode: Would queue service error: {data}")
+            return True
+
+        return self._put_nowait(self._error_queue, data)
 
 
 # Global client instance
@@ -235,6 +741,9 @@ _client: Optional[ObservabilityClient] = None
 async def get_client() -> ObservabilityClient:
     """Get or create the global client instance.
 
+    The client is created on first use and its connection pool is warmed
+    with a health check, so later calls reuse an established connection.
+
     Returns:
         The global ObservabilityClient instance
     """
@@ -242,9 +751,82 @@ async def get_client() -> ObservabilityClient:
     if _client is None:
         _client = ObservabilityClient()
         await _client._ensure_client()
+        # Establish the pooled connection up front so the first event doesn't pay for it
+        await _client.check_health()
+    return _client
+
+
+async def warmup_client() -> None:
+    """Create the global client and open its pooled connection.
+
+    Call this at application startup so the first tracked event doesn't
+    pay for the TCP/TLS handshake. Does nothing in test mode.
+    """
+    if get_config().test_mode:
+        return
+    await get_client()
+
+
+def _schedule_warmup(use_runtime: bool = True) -> None:
+    """Run ``warmup_client()`` in the background without blocking the caller.
+
+    Args:
+        use_runtime: Without a running event loop, warm up on the telemetry
+            thread. Async apps pass False so the client isn't bound to a
+            loop other than their own.
+    """
+    if _client is not None or get_config().test_mode:
+        return
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        if use_runtime:
+            get_runtime().run_coroutine(warmup_client())
+        return
+
+    spawn(warmup_client())
+
+
+def get_client_sync() -> ObservabilityClient:
+    """Get or create the global client instance without awaiting.
+
+    Used by the synchronous ``*_nowait`` tracking functions. The HTTP
+    client itself is created lazily on the first request.
+
+    Returns:
+        The global ObservabilityClient instance
+    """
+    global _client
+    if _client is None:
+        _client = ObservabilityClient()
     return _client
 
 
+def _flush_at_exit() -> None:
+    """Send whatever the global client still has buffered when the process exits."""
+    client = _client
+    if client is None or not client._has_pending():
+        return
+
+    task = client._flusher_task
+    loop = task.get_loop() if task is not None else None
+    try:
+        if loop is not None and loop.is_running():
+            # Still running in another thread (e.g. the telemetry runtime)
+            asyncio.run_coroutine_threadsafe(
+                asyncio.wait_for(client.flush(), timeout=client.config.timeout), loop
+            ).result()
+        else:
+            asyncio.run(client._flush_detached())
+    except Exception as e:
+        if client._dev:
+            logger.warning(f"Failed to flush observability events at exit: {e}")
+
+
+atexit.register(_flush_at_exit)
+
+
 def reset_client() -> None:
     """Reset the global client instance."""
     global _client
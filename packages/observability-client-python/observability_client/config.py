@@ -1,11 +1,26 @@
 """Configuration for the observability client."""
 
 import os
-from typing import Optional
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from typing import Any, Literal, Optional
 
+_ON_FULL_POLICIES = ("drop_new", "drop_old")
 
-class ObservabilityConfig(BaseModel):
+
+def _env_service_url() -> str:
+    return os.getenv("OBSERVABILITY_SERVICE_URL", "http://localhost:8006")
+
+
+def _env_service_name() -> str:
+    return os.getenv("OBSERVABILITY_SERVICE_NAME", "python-service")
+
+
+def _env_dev_mode() -> bool:
+    return os.getenv("OBSERVABILITY_DEV_MODE", "").lower() == "true"
+
+
+@dataclass(slots=True)
+class ObservabilityConfig:
     """Configuration for the observability client.
 
     Attributes:
@@ -14,28 +29,61 @@ class ObservabilityConfig(BaseModel):
         timeout: Request timeout in seconds (default: 10)
         max_retries: Maximum number of retry attempts (default: 3)
         retry_backoff: Exponential backoff multiplier for retries (default: 2)
+        batch_size: Maximum number of events sent per bulk request (default: 50)
+        flush_interval: Seconds between background flushes of queued events (default: 5)
+        queue_max_size: Maximum number of events buffered before dropping (default: 2048)
+        on_full: Which payload to drop when the queue is full, 'drop_new' or 'drop_old'
+            (default: 'drop_new')
+        stack_trace_limit: Maximum number of innermost frames kept when formatting an
+            exception passed as ``stack_trace``; None keeps every frame (default: 20)
+        http2: Use HTTP/2 so concurrent requests share one connection (default: True)
+        gzip_min_size: Gzip request bodies larger than this many bytes; None disables
+            compression (default: 1024)
         dev_mode: Enable development mode with verbose logging (default: False)
         test_mode: Enable test mode (disables actual API calls) (default: False)
     """
 
-    service_url: str = Field(
-        default_factory=lambda: os.getenv("OBSERVABILITY_SERVICE_URL", "http://localhost:8006")
-    )
-    service_name: str = Field(
-        default_factory=lambda: os.getenv("OBSERVABILITY_SERVICE_NAME", "python-service")
-    )
+    service_url: str = field(default_factory=_env_service_url)
+    service_name: str = field(default_factory=_env_service_name)
     timeout: float = 10.0
     max_retries: int = 3
     retry_backoff: float = 2.0
-    dev_mode: bool = Field(
-        default_factory=lambda: os.getenv("OBSERVABILITY_DEV_MODE", "").lower() == "true"
-    )
+    batch_size: int = 50
+    flush_interval: float = 5.0
+    queue_max_size: int = 2048
+    on_full: Literal["drop_new", "drop_old"] = "drop_new"
+    stack_trace_limit: Optional[int] = 20
+    http2: bool = True
+    gzip_min_size: Optional[int] = 1024
+    dev_mode: bool = field(default_factory=_env_dev_mode)
     test_mode: bool = False
 
-    model_config = {
-        "frozen": False,
-        "arbitrary_types_allowed": True,
-    }
+    def __post_init__(self) -> None:
+        if self.on_full not in _ON_FULL_POLICIES:
+            raise ValueError(
+                f"on_full must be one of {_ON_FULL_POLICIES}, got {self.on_full!r}"
+            )
+
+    @classmethod
+    def from_env(cls, **overrides: Any) -> "ObservabilityConfig":
+        """Create a configuration from environment variables.
+
+        Reads OBSERVABILITY_SERVICE_URL, OBSERVABILITY_SERVICE_NAME and
+        OBSERVABILITY_DEV_MODE; any keyword argument takes precedence.
+
+        Args:
+            **overrides: Field values to use instead of the environment
+
+        Returns:
+            A new ObservabilityConfig instance
+        """
+        values: dict = {
+            "service_url": _env_service_url(),
+            "service_name": _env_service_name(),
+            "dev_mode": _env_dev_mode(),
+        }
+        values.update(overrides)
+        return cls(**values)
 
 
 # Global configuration instance
@@ -0,0 +1,28 @@
+"""Wrapper metadata helpers shared by the decorators."""
+
+from typing import Any, Callable, TypeVar
+
+W = TypeVar("W", bound=Callable[..., Any])
+
+
+def copy_meta(wrapper: W, func: Callable[..., Any]) -> W:
+    """Make ``wrapper`` look like ``func``.
+
+    A lighter ``functools.wraps``: copies the name, qualified name, module
+    and docstring and sets ``__wrapped__`` (so ``inspect.signature`` and
+    frameworks like FastAPI still see the original parameters), but skips
+    merging ``func.__dict__``.
+
+    Args:
+        wrapper: The wrapper function
+        func: The wrapped function
+
+    Returns:
+        ``wrapper``, updated in place
+    """
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__module__ = func.__module__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func  # type: ignore[attr-defined]
+    return wrapper
@@ -2,19 +2,29 @@
 
 import asyncio
 import functools
-import traceback
-from typing import Callable, Optional, Dict, Any, TypeVar, cast
+import logging
+from typing import Callable, Optional, Dict, Any, Hashable, Tuple, TypeVar, cast
 
-from ..client import get_client
+from ..tracking.events import track_service_error_nowait
 from ..config import get_config
+from ._meta import copy_meta
 
 T = TypeVar("T", bound=Callable[..., Any])
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of extractor results kept per decorated function
+_EXTRACT_CACHE_SIZE = 128
+
+# Exception class -> name, shared by every decorated function
+_ERROR_TYPE_NAMES: Dict[type, str] = {}
+
 
 def track_error(
     extract_metadata: Optional[Callable[..., Dict[str, Any]]] = None,
     extract_user_id: Optional[Callable[..., Optional[int]]] = None,
     reraise: bool = True,
+    cache_key: Optional[Callable[..., Hashable]] = None,
 ) -> Callable[[T], T]:
     """Decorator to automatically track exceptions in functions.
 
@@ -22,6 +32,9 @@ def track_error(
         extract_metadata: Optional function to extract metadata from function arguments
         extract_user_id: Optional function to extract user ID from function arguments
         reraise: Whether to re-raise the exception after tracking (default: True)
+        cache_key: Optional function mapping the function arguments to a hashable key.
+            When given, ``extract_metadata`` and ``extract_user_id`` results are
+            cached per key, so repeated errors with the same key skip extraction.
 
     Returns:
         Decorated function
@@ -43,102 +56,163 @@ def track_error(
             pass
         ```
     """
+    if cache_key is not None:
+        if extract_metadata is not None:
+            extract_metadata = _memoize(extract_metadata, cache_key)
+        if extract_user_id is not None:
+            extract_user_id = _memoize(extract_user_id, cache_key)
 
     def decorator(func: T) -> T:
-        @functools.wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:
-                # Extract metadata and user_id
-                metadata: Dict[str, Any] = {}
-                user_id: Optional[int] = None
-
-                if extract_metadata is not None:
-                    try:
-                        metadata = extract_metadata(*args, **kwargs)
-                    except Exception as extract_error:
-                        config = get_config()
-                        if config.dev_mode:
-                            print(f"Failed to extract metadata: {extract_error}")
-
-                if extract_user_id is not None:
-                    try:
-                        user_id = extract_user_id(*args, **kwargs)
-                    except Exception as extract_error:
-                        config = get_config()
-                        if config.dev_mode:
-                            print(f"Failed to extract user_id: {extract_error}")
-
-                # Track the error (non-blocking)
-                asyncio.create_task(
-                    _track_error_async(
-                        error=e,
-                        metadata=metadata,
-                        user_id=user_id,
-                        function_name=func.__name__,
-                    )
-                )
-
-                # Re-raise if configured
-                if reraise:
-                    raise
-
-        @functools.wraps(func)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            try:
-                return func(*args, **kwargs)
-            except Exception as e:
-                # Extract metadata and user_id
-                metadata: Dict[str, Any] = {}
-                user_id: Optional[int] = None
-
-                if extract_metadata is not None:
-                    try:
-                        metadata = extract_metadata(*args, **kwargs)
-                    except Exception as extract_error:
-                        config = get_config()
-                        if config.dev_mode:
-                            print(f"Failed to extract metadata: {extract_error}")
-
-                if extract_user_id is not None:
-                    try:
-                        user_id = extract_user_id(*args, **kwargs)
-                    except Exception as extract_error:
-                        config = get_config()
-                        if config.dev_mode:
-                            print(f"Failed to extract user_id: {extract_error}")
-
-                # Track the error (non-blocking)
-                asyncio.create_task(
-                    _track_error_async(
-                        error=e,
-                        metadata=metadata,
-                        user_id=user_id,
-                        function_name=func.__name__,
-                    )
-                )
-
-                # Re-raise if configured
-                if reraise:
-                    raise
-
-        # Return appropriate wrapper based on whether function is async
+        # Only the wrapper matching the function kind is built
         if asyncio.iscoroutinefunction(func):
-            return cast(T, async_wrapper)
+            build = _build_async_wrapper
         else:
-            return cast(T, sync_wrapper)
+            build = _build_sync_wrapper
+        wrapper = build(func, extract_metadata, extract_user_id, reraise)
+        return cast(T, copy_meta(wrapper, func))
 
     return decorator
 
 
-async def _track_error_async(
+def _build_async_wrapper(
+    func: Callable[..., Any],
+    extract_metadata: Optional[Callable[..., Dict[str, Any]]],
+    extract_user_id: Optional[Callable[..., Optional[int]]],
+    reraise: bool,
+) -> Callable[..., Any]:
+    """Wrap a coroutine function to track the exceptions it raises."""
+    function_name = func.__name__
+
+    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            _extract_and_enqueue(
+                e, args, kwargs, extract_metadata, extract_user_id, function_name
+            )
+            if reraise:
+                raise
+
+    return async_wrapper
+
+
+def _build_sync_wrapper(
+    func: Callable[..., Any],
+    extract_metadata: Optional[Callable[..., Dict[str, Any]]],
+    extract_user_id: Optional[Callable[..., Optional[int]]],
+    reraise: bool,
+) -> Callable[..., Any]:
+    """Wrap a regular function to track the exceptions it raises."""
+    function_name = func.__name__
+
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            _extract_and_enqueue(
+                e, args, kwargs, extract_metadata, extract_user_id, function_name
+            )
+            if reraise:
+                raise
+
+    return sync_wrapper
+
+
+def _extract_and_enqueue(
+    error: Exception,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    extract_metadata: Optional[Callable[..., Dict[str, Any]]],
+    extract_user_id: Optional[Callable[..., Optional[int]]],
+    function_name: str,
+) -> None:
+    """Extract metadata and user_id from the call arguments and queue the error.
+
+    Shared by the sync and async wrappers.
+
+    Args:
+        error: The exception that occurred
+        args: Positional arguments of the failed call
+        kwargs: Keyword arguments of the failed call
+        extract_metadata: Optional function to extract metadata from the arguments
+        extract_user_id: Optional function to extract user ID from the arguments
+        function_name: Name of the function where error occurred
+    """
+    metadata: Dict[str, Any] = {}
+    user_id: Optional[int] = None
+
+    if extract_metadata is not None:
+        try:
+            metadata = extract_metadata(*args, **kwargs)
+        except Exception as extract_error:
+            # Read here: decorators usually run before init_observability()
+            if get_config().dev_mode:
+                logger.warning(f"Failed to extract metadata: {extract_error}")
+
+    if extract_user_id is not None:
+        try:
+            user_id = extract_user_id(*args, **kwargs)
+        except Exception as extract_error:
+            if get_config().dev_mode:
+                logger.warning(f"Failed to extract user_id: {extract_error}")
+
+    # Track the error (non-blocking)
+    _track_error_nowait(
+        error=error,
+        metadata=metadata,
+        user_id=user_id,
+        function_name=function_name,
+    )
+
+
+def _memoize(func: Callable[..., Any], cache_key: Callable[..., Hashable]) -> Callable[..., Any]:
+    """Cache ``func`` results by ``cache_key(*args, **kwargs)``.
+
+    Args:
+        func: Extractor to cache
+        cache_key: Function computing the cache key from the same arguments
+
+    Returns:
+        Wrapped extractor keeping at most ``_EXTRACT_CACHE_SIZE`` results
+    """
+    cache: Dict[Hashable, Any] = {}
+
+    @functools.wraps(func)
+    def cached(*args: Any, **kwargs: Any) -> Any:
+        key = cache_key(*args, **kwargs)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        value = func(*args, **kwargs)
+        if len(cache) >= _EXTRACT_CACHE_SIZE:
+            # Evict the oldest entry
+            cache.pop(next(iter(cache)), None)
+        cache[key] = value
+        return value
+
+    return cached
+
+
+def _error_type_name(error_type: type) -> str:
+    """Get the tracked name of an exception class."""
+    name = _ERROR_TYPE_NAMES.get(error_type)
+    if name is None:
+        name = _ERROR_TYPE_NAMES.setdefault(error_type, error_type.__name__)
+    return name
+
+
+def _track_error_nowait(
     error: Exception,
     metadata: Dict[str, Any],
     user_id: Optional[int],
     function_name: str,
 ) -> None:
-    """Internal helper to track errors asynchronously.
+    """Internal helper to queue an error for the background flusher.
+
+    The exception is queued as is; its traceback is only formatted if the
+    error is actually sent.
 
     Args:
         error: The exception that occurred
@@ -147,19 +221,16 @@ async def _track_error_async(
         function_name: Name of the function where error occurred
     """
     try:
-        client = await get_client()
-
         # Add function name to metadata
         full_metadata = {**metadata, "function": function_name}
 
-        await client.track_service_error(
-            error_type=type(error).__name__,
+        track_service_error_nowait(
+            error_type=_error_type_name(type(error)),
             error_message=str(error),
-            stack_trace=traceback.format_exc(),
+            stack_trace=error,
             user_id=user_id,
             metadata=full_metadata,
         )
     except Exception as e:
-        config = get_config()
-        if config.dev_mode:
-            print(f"Failed to track error: {e}")
+        if get_config().dev_mode:
+            logger.warning(f"Failed to track error: {e}")
@@ -1,20 +1,24 @@
 """Decorator for automatic event tracking."""
 
 import asyncio
-import functools
-from typing import Callable, Optional, Dict, Any, TypeVar, cast
+import logging
+from typing import Callable, Optional, Dict, Any, Tuple, TypeVar, cast
 
-from ..client import get_client
+from ..tracking.events import track_event_nowait
 from ..config import get_config
+from ._meta import copy_meta
 
 T = TypeVar("T", bound=Callable[..., Any])
 
+logger = logging.getLogger(__name__)
+
 
 def track_event(
     event_type: str,
     category: str = "user_action",
     extract_metadata: Optional[Callable[..., Dict[str, Any]]] = None,
     extract_user_id: Optional[Callable[..., Optional[int]]] = None,
+    extract: Optional[Callable[..., Tuple[Optional[Dict[str, Any]], Optional[int]]]] = None,
 ) -> Callable[[T], T]:
     """Decorator to automatically track function calls as events.
 
@@ -23,6 +27,9 @@ def track_event(
         category: Event category (default: 'user_action')
         extract_metadata: Optional function to extract metadata from function arguments
         extract_user_id: Optional function to extract user ID from function arguments
+        extract: Optional function returning ``(metadata, user_id)`` from the function
+            arguments in one call; takes precedence over ``extract_metadata`` and
+            ``extract_user_id``
 
     Returns:
         Decorated function
@@ -40,102 +47,132 @@ def track_event(
             extract_metadata=lambda item_data, **kwargs: {"item_type": item_data.get("type")},
             extract_user_id=lambda user_id, **kwargs: user_id
         )
+        async def create_item(item_data: dict, user_id: int):
+            return item
+
+        # Or both from a single extractor
+        @track_event(
+            "item_created",
+            extract=lambda item_data, user_id, **kwargs: ({"item_type": item_data.get("type")}, user_id)
+        )
         async def create_item(item_data: dict, user_id: int):
             return item
         ```
     """
+    if extract is None:
+        extract = _combine_extractors(extract_metadata, extract_user_id)
+
+    track = _make_tracker(event_type, category, extract)
 
     def decorator(func: T) -> T:
-        @functools.wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Execute the function first
-            result = await func(*args, **kwargs)
-
-            # Extract metadata and user_id
-            metadata: Dict[str, Any] = {}
-            user_id: Optional[int] = None
-
-            if extract_metadata is not None:
-                try:
-                    metadata = extract_metadata(*args, **kwargs)
-                except Exception as e:
-                    config = get_config()
-                    if config.dev_mode:
-                        print(f"Failed to extract metadata: {e}")
-
-            if extract_user_id is not None:
-                try:
-                    user_id = extract_user_id(*args, **kwargs)
-                except Exception as e:
-                    config = get_config()
-                    if config.dev_mode:
-                        print(f"Failed to extract user_id: {e}")
-
-            # Track the event (non-blocking)
-            asyncio.create_task(
-                _track_event_async(
-                    event_type=event_type,
-                    category=category,
-                    metadata=metadata,
-                    user_id=user_id,
-                )
-            )
-
-            return result
-
-        @functools.wraps(func)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Execute the function first
-            result = func(*args, **kwargs)
-
-            # Extract metadata and user_id
-            metadata: Dict[str, Any] = {}
-            user_id: Optional[int] = None
-
-            if extract_metadata is not None:
-                try:
-                    metadata = extract_metadata(*args, **kwargs)
-                except Exception as e:
-                    config = get_config()
-                    if config.dev_mode:
-                        print(f"Failed to extract metadata: {e}")
-
-            if extract_user_id is not None:
-                try:
-                    user_id = extract_user_id(*args, **kwargs)
-                except Exception as e:
-                    config = get_config()
-                    if config.dev_mode:
-                        print(f"Failed to extract user_id: {e}")
-
-            # Track the event (non-blocking)
-            asyncio.create_task(
-                _track_event_async(
-                    event_type=event_type,
-                    category=category,
-                    metadata=metadata,
-                    user_id=user_id,
-                )
-            )
-
-            return result
-
-        # Return appropriate wrapper based on whether function is async
+        # Only the wrapper matching the function kind is built
         if asyncio.iscoroutinefunction(func):
-            return cast(T, async_wrapper)
-        else:
-            return cast(T, sync_wrapper)
+            return cast(T, copy_meta(_build_async_wrapper(func, track), func))
+        return cast(T, copy_meta(_build_sync_wrapper(func, track), func))
 
     return decorator
 
 
-async def _track_event_async(
+def _build_async_wrapper(
+    func: Callable[..., Any],
+    track: Callable[[Tuple[Any, ...], Dict[str, Any]], None],
+) -> Callable[..., Any]:
+    """Wrap a coroutine function to track an event after each call."""
+    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Execute the function first
+        result = await func(*args, **kwargs)
+        track(args, kwargs)
+        return result
+
+    return async_wrapper
+
+
+def _build_sync_wrapper(
+    func: Callable[..., Any],
+    track: Callable[[Tuple[Any, ...], Dict[str, Any]], None],
+) -> Callable[..., Any]:
+    """Wrap a regular function to track an event after each call."""
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Execute the function first
+        result = func(*args, **kwargs)
+        track(args, kwargs)
+        return result
+
+    return sync_wrapper
+
+
+def _combine_extractors(
+    extract_metadata: Optional[Callable[..., Dict[str, Any]]],
+    extract_user_id: Optional[Callable[..., Optional[int]]],
+) -> Optional[Callable[..., Tuple[Optional[Dict[str, Any]], Optional[int]]]]:
+    """Compose the separate extractors into a single ``(metadata, user_id)`` extractor.
+
+    Args:
+        extract_metadata: Optional function to extract metadata from function arguments
+        extract_user_id: Optional function to extract user ID from function arguments
+
+    Returns:
+        Combined extractor, or None when neither extractor is given
+    """
+    if extract_metadata is None and extract_user_id is None:
+        return None
+
+    def combined(*args: Any, **kwargs: Any) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        return (
+            extract_metadata(*args, **kwargs) if extract_metadata is not None else None,
+            extract_user_id(*args, **kwargs) if extract_user_id is not None else None,
+        )
+
+    return combined
+
+
+def _make_tracker(
     event_type: str,
     category: str,
-    metadata: Dict[str, Any],
+    extract: Optional[Callable[..., Tuple[Optional[Dict[str, Any]], Optional[int]]]],
+) -> Callable[[Tuple[Any, ...], Dict[str, Any]], None]:
+    """Build the per-call tracking function for a decorated function.
+
+    The variant is chosen once at decoration time, so calls without
+    an extractor (the common case) skip extraction entirely.
+
+    Args:
+        event_type: Type of event to track
+        category: Event category
+        extract: Optional function returning ``(metadata, user_id)`` from function arguments
+
+    Returns:
+        Function taking the call's ``(args, kwargs)`` and queuing the event
+    """
+    if extract is None:
+        def track(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+            _track_event_nowait(event_type, category, None, None)
+
+        return track
+
+    def track_extracted(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        try:
+            metadata, user_id = extract(*args, **kwargs)
+        except Exception as e:
+            # Read here: decorators usually run before init_observability()
+            if get_config().dev_mode:
+                logger.warning(f"Failed to extract event data: {e}")
+            metadata, user_id = None, None
+        _track_event_nowait(event_type, category, metadata, user_id)
+
+    return track_extracted
+
+
+def _track_event_nowait(
+    event_type: str,
+    category: str,
+    metadata: Optional[Dict[str, Any]],
     user_id: Optional[int],
 ) -> None:
-    """Internal helper to track events asynchronously.
+    """Internal helper to queue an event for the background flusher.
+
+    Queues the payload directly, so no coroutine or task is created and
+    sync functions work without a running event loop.
 
     Args:
         event_type: Type of event
@@ -144,14 +181,12 @@ async def _track_event_async(
         user_id: Optional user ID
     """
     try:
-        client = await get_client()
-        await client.track_event(
+        track_event_nowait(
             event_type=event_type,
             category=category,
             metadata=metadata,
             user_id=user_id,
         )
     except Exception as e:
-        config = get_config()
-        if config.dev_mode:
-            print(f"Failed to track event: {e}")
+        if get_config().dev_mode:
+            logger.warning(f"Failed to track event: {e}")
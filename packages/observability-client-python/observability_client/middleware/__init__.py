@@ -3,22 +3,29 @@
 __all__ = []
 
 try:
-    from .fastapi import ObservabilityMiddleware as FastAPIObservabilityMiddleware
+    from .fastapi import ObservabilityMiddleware as FastAPIObservabilityMiddleware  # noqa: F401
 
     __all__.append("FastAPIObservabilityMiddleware")
 except ImportError:
     pass
 
 try:
-    from .flask import ObservabilityMiddleware as FlaskObservabilityMiddleware
+    from .flask import ObservabilityMiddleware as FlaskObservabilityMiddleware  # noqa: F401
 
     __all__.append("FlaskObservabilityMiddleware")
 except ImportError:
     pass
 
 try:
-    from .django import ObservabilityMiddleware as DjangoObservabilityMiddleware
+    from .django import ObservabilityMiddleware as DjangoObservabilityMiddleware  # noqa: F401
 
     __all__.append("DjangoObservabilityMiddleware")
 except ImportError:
     pass
+
+try:
+    from .django_async import ObservabilityMiddleware as DjangoAsyncObservabilityMiddleware  # noqa: F401
+
+    __all__.append("DjangoAsyncObservabilityMiddleware")
+except ImportError:
+    pass
@@ -1,83 +1,72 @@
 """Django middleware for observability."""
 
-import traceback
+import logging
 import time
-import asyncio
 from typing import Callable
 
-from django.http import HttpRequest, HttpResponse
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed, PermissionDenied
+from django.http import Http404, HttpRequest, HttpResponse
 from django.utils.deprecation import MiddlewareMixin
 
-from ..client import get_client
+from ..client import _schedule_warmup, get_client_sync
 from ..config import get_config
 from ..utils.context import get_request_context
 
+logger = logging.getLogger(__name__)
 
-class ObservabilityMiddleware(MiddlewareMixin):
-    """Django middleware for automatic request and error tracking.
-
-    This middleware automatically tracks:
-    - All requests (optional)
-    - All errors/exceptions
-    - Request duration
 
-    Example:
-        Add to settings.py MIDDLEWARE:
-        ```python
-        MIDDLEWARE = [
-            # ... other middleware
-            'observability_client.middleware.django.ObservabilityMiddleware',
-        ]
-        ```
+class _ObservabilityTracking:
+    """Tracking shared by the Django middleware classes.
 
-    Attributes:
-        track_requests: Whether to track all requests (default: True)
-        track_errors: Whether to track all errors (default: True)
+    Reads the tracking settings, tracks errors through the
+    ``process_exception`` hook and queues the payloads. Subclasses record
+    ``request._observability_start_time`` and track responses.
     """
 
-    def __init__(self, get_response: Callable):
-        """Initialize the middleware.
+    # Read on every request; slots avoid the instance dict lookup
+    __slots__ = ("track_requests", "track_errors")
+
+    def _setup(self, use_runtime: bool = True) -> None:
+        """Read the tracking settings and warm up the client.
 
         Args:
-            get_response: The next middleware or view in the chain
+            use_runtime: Passed to the client warmup; False when requests are
+                served on an event loop of their own (Django under ASGI)
+
+        Raises:
+            MiddlewareNotUsed: If both request and error tracking are disabled
         """
-        super().__init__(get_response)
-        self.track_requests = True  # Can be configured via Django settings
-        self.track_errors = True
+        self.track_requests = getattr(settings, "OBSERVABILITY_TRACK_REQUESTS", True)
+        self.track_errors = getattr(settings, "OBSERVABILITY_TRACK_ERRORS", True)
 
-    def process_request(self, request: HttpRequest) -> None:
-        """Process the request before it reaches the view.
+        if not (self.track_requests or self.track_errors):
+            # Django drops the middleware from the chain entirely
+            raise MiddlewareNotUsed("Observability tracking is disabled")
 
-        Args:
-            request: The Django HttpRequest object
-        """
-        request._observability_start_time = time.time()
+        # Django builds middleware once per process; open the pooled
+        # connection before the first request is tracked
+        _schedule_warmup(use_runtime=use_runtime)
 
-    def process_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
-        """Process the response after the view.
+    def _track_response(self, request: HttpRequest, response: HttpResponse) -> None:
+        """Track a finished request if request tracking is enabled.
 
         Args:
             request: The Django HttpRequest object
             response: The Django HttpResponse object
-
-        Returns:
-            The response object (unmodified)
         """
-        if self.track_requests and hasattr(request, "_observability_start_time"):
-            duration = time.time() - request._observability_start_time
-            context = get_request_context(request)
-
-            # Run async tracking in background
-            asyncio.create_task(
-                self._track_request(
-                    context=context,
-                    status_code=response.status_code,
-                    duration=duration,
-                )
+        start_time = getattr(request, "_observability_start_time", None)
+        if self.track_requests and start_time is not None:
+            duration_us = (time.perf_counter_ns() - start_time) // 1000
+            context = self._get_context(request)
+
+            # Queue for the background flusher
+            self._track_request(
+                context=context,
+                status_code=response.status_code,
+                duration_us=duration_us,
             )
 
-        return response
-
     def process_exception(self, request: HttpRequest, exception: Exception) -> None:
         """Process exceptions that occur during view execution.
 
@@ -85,86 +74,161 @@ class ObservabilityMiddleware(MiddlewareMixin):
             request: The Django HttpRequest object
             exception: The exception that occurred
         """
-        if self.track_errors:
-            if hasattr(request, "_observability_start_time"):
-                duration = time.time() - request._observability_start_time
+        # Client errors (404/403) aren't worth a payload
+        if self.track_errors and not isinstance(exception, (Http404, PermissionDenied)):
+            start_time = getattr(request, "_observability_start_time", None)
+            if start_time is not None:
+                duration_us = (time.perf_counter_ns() - start_time) // 1000
             else:
-                duration = 0.0
+                duration_us = 0
 
-            context = get_request_context(request)
+            context = self._get_context(request)
 
-            # Run async tracking in background
-            asyncio.create_task(
-                self._track_error(
-                    error=exception,
-                    context=context,
-                    duration=duration,
-                )
+            # Queue for the background flusher
+            self._track_error(
+                error=exception,
+                context=context,
+                duration_us=duration_us,
             )
 
         # Return None to allow other exception handlers to work
         return None
 
-    async def _track_request(
+    @staticmethod
+    def _get_context(request: HttpRequest) -> dict:
+        """Get the request context, extracting it at most once per request.
+
+        Extracted lazily rather than in ``process_request`` so that user and
+        session data set by later middleware (e.g. authentication) is picked up.
+
+        Args:
+            request: The Django HttpRequest object
+
+        Returns:
+            The request context
+        """
+        context = getattr(request, "_observability_ctx", None)
+        if context is None:
+            context = get_request_context(request)
+            request._observability_ctx = context
+        return context
+
+    def _track_request(
         self,
         context: dict,
         status_code: int,
-        duration: float,
+        duration_us: int,
     ) -> None:
         """Track a request event.
 
         Args:
             context: Request context
             status_code: HTTP status code
-            duration: Request duration in seconds
+            duration_us: Request duration in microseconds
         """
         try:
-            client = await get_client()
-            await client.track_event(
+            get = context.get
+            get_client_sync().track_event_nowait(
                 event_type="request",
-                user_id=context.get("user_id"),
-                session_id=context.get("session_id"),
+                user_id=get("user_id"),
+                session_id=get("session_id"),
                 metadata={
-                    "request_path": context.get("request_path"),
-                    "request_method": context.get("request_method"),
+                    "request_path": get("request_path"),
+                    "request_method": get("request_method"),
                     "status_code": status_code,
-                    "duration_ms": round(duration * 1000, 2),
+                    "duration_us": duration_us,
                 },
                 category="api_request",
             )
         except Exception as e:
-            config = get_config()
-            if config.dev_mode:
-                print(f"Failed to track request: {e}")
+            if get_config().dev_mode:
+                logger.warning(f"Failed to track request: {e}")
 
-    async def _track_error(
+    def _track_error(
         self,
         error: Exception,
         context: dict,
-        duration: float,
+        duration_us: int,
     ) -> None:
         """Track an error event.
 
         Args:
             error: The exception that occurred
             context: Request context
-            duration: Request duration until error in seconds
+            duration_us: Request duration until error in microseconds
         """
         try:
-            client = await get_client()
-            await client.track_service_error(
+            get = context.get
+            get_client_sync().track_service_error_nowait(
                 error_type=type(error).__name__,
                 error_message=str(error),
-                stack_trace=traceback.format_exc(),
-                request_path=context.get("request_path"),
-                request_method=context.get("request_method"),
-                user_id=context.get("user_id"),
-                session_id=context.get("session_id"),
+                stack_trace=error,
+                request_path=get("request_path"),
+                request_method=get("request_method"),
+                user_id=get("user_id"),
+                session_id=get("session_id"),
                 metadata={
-                    "duration_ms": round(duration * 1000, 2),
+                    "duration_us": duration_us,
                 },
             )
         except Exception as e:
-            config = get_config()
-            if config.dev_mode:
-                print(f"Failed to track error: {e}")
+            if get_config().dev_mode:
+                logger.warning(f"Failed to track error: {e}")
+
+
+class ObservabilityMiddleware(_ObservabilityTracking, MiddlewareMixin):
+    """Django middleware for automatic request and error tracking.
+
+    This middleware automatically tracks:
+    - All requests (optional)
+    - All errors/exceptions
+    - Request duration
+
+    Under ASGI, ``observability_client.middleware.django_async.ObservabilityMiddleware``
+    avoids the thread hand-off ``MiddlewareMixin`` adds for each hook.
+
+    Example:
+        Add to settings.py MIDDLEWARE:
+        ```python
+        MIDDLEWARE = [
+            # ... other middleware
+            'observability_client.middleware.django.ObservabilityMiddleware',
+        ]
+        ```
+
+    Attributes:
+        track_requests: Whether to track all requests, from the
+            ``OBSERVABILITY_TRACK_REQUESTS`` setting (default: True)
+        track_errors: Whether to track all errors, from the
+            ``OBSERVABILITY_TRACK_ERRORS`` setting (default: True)
+    """
+
+    def __init__(self, get_response: Callable):
+        """Initialize the middleware.
+
+        Args:
+            get_response: The next middleware or view in the chain
+        """
+        super().__init__(get_response)
+        self._setup()
+
+    def process_request(self, request: HttpRequest) -> None:
+        """Process the request before it reaches the view.
+
+        Args:
+            request: The Django HttpRequest object
+        """
+        request._observability_start_time = time.perf_counter_ns()
+
+    def process_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        """Process the response after the view.
+
+        Args:
+            request: The Django HttpRequest object
+            response: The Django HttpResponse object
+
+        Returns:
+            The response object (unmodified)
+        """
+        self._track_response(request, response)
+        return response
@@ -0,0 +1,91 @@
+"""Native async Django middleware for observability."""
+
+import time
+from typing import Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse
+
+from .django import _ObservabilityTracking
+
+
+class ObservabilityMiddleware(_ObservabilityTracking):
+    """Django middleware for request and error tracking without ``MiddlewareMixin``.
+
+    Intended for Django served under ASGI: when the rest of the chain is
+    async, requests are handled as a coroutine and no hook is handed off to
+    a thread with ``sync_to_async``. It falls back to a plain sync call
+    under WSGI. Errors are tracked through ``process_exception``, exactly as
+    in ``observability_client.middleware.django``.
+
+    Example:
+        Add to settings.py MIDDLEWARE:
+        ```python
+        MIDDLEWARE = [
+            # ... other middleware
+            'observability_client.middleware.django_async.ObservabilityMiddleware',
+        ]
+        ```
+
+    Attributes:
+        track_requests: Whether to track all requests, from the
+            ``OBSERVABILITY_TRACK_REQUESTS`` setting (default: True)
+        track_errors: Whether to track all errors, from the
+            ``OBSERVABILITY_TRACK_ERRORS`` setting (default: True)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    # markcoroutinefunction() sets a marker attribute whose name depends on
+    # the Python version, so keep an instance dict for it
+    __slots__ = ("get_response", "_is_async", "__dict__")
+
+    def __init__(self, get_response: Callable):
+        """Initialize the middleware.
+
+        Args:
+            get_response: The next middleware or view in the chain
+        """
+        if get_response is None:
+            raise ValueError("get_response must be provided.")
+        self.get_response = get_response
+        self._is_async = iscoroutinefunction(get_response)
+        if self._is_async:
+            # Tells Django to await this middleware directly
+            markcoroutinefunction(self)
+            # Payloads are queued on the request loop, so warm up there too
+            self._setup(use_runtime=False)
+        else:
+            self._setup()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Handle a request, dispatching to the async path when Django runs async.
+
+        Args:
+            request: The Django HttpRequest object
+
+        Returns:
+            The response from the rest of the chain
+        """
+        if self._is_async:
+            return self.__acall__(request)
+
+        request._observability_start_time = time.perf_counter_ns()
+        response = self.get_response(request)
+        self._track_response(request, response)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """Handle a request on the event loop.
+
+        Args:
+            request: The Django HttpRequest object
+
+        Returns:
+            The response from the rest of the chain
+        """
+        request._observability_start_time = time.perf_counter_ns()
+        response = await self.get_response(request)
+        self._track_response(request, response)
+        return response
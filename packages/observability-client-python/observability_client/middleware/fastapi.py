@@ -1,22 +1,26 @@
 """FastAPI middleware for observability."""
 
-import traceback
+import logging
 import time
-from typing import Callable
-import asyncio
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.exceptions import HTTPException
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from ..client import get_client
+from ..client import _schedule_warmup, get_client_sync
 from ..config import get_config
 from ..utils.context import get_request_context
 
+logger = logging.getLogger(__name__)
 
-class ObservabilityMiddleware(BaseHTTPMiddleware):
+
+class ObservabilityMiddleware:
     """FastAPI/Starlette middleware for automatic request and error tracking.
 
+    Implemented as a plain ASGI middleware rather than on
+    ``BaseHTTPMiddleware``, so no task group or wrapped response is created
+    per request.
+
     This middleware automatically tracks:
     - All requests (optional)
     - All errors/exceptions
@@ -36,9 +40,12 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
         track_errors: Whether to track all errors (default: True)
     """
 
+    # Read on every request; slots avoid the instance dict lookup
+    __slots__ = ("app", "track_requests", "track_errors", "_enabled")
+
     def __init__(
         self,
-        app: Callable,
+        app: ASGIApp,
         track_requests: bool = True,
         track_errors: bool = True,
     ):
@@ -49,119 +56,127 @@ class ObservabilityMiddleware(BaseHTTPMiddleware):
             track_requests: Whether to track all requests (default: True)
             track_errors: Whether to track all errors (default: True)
         """
-        super().__init__(app)
+        self.app = app
         self.track_requests = track_requests
         self.track_errors = track_errors
-        self._client_task: asyncio.Task = None
+        self._enabled = track_requests or track_errors
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        if self._enabled:
+            # Open the pooled connection before the first request is tracked
+            _schedule_warmup(use_runtime=False)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and track observability events.
 
         Args:
-            request: The incoming request
-            call_next: Function to call the next middleware/handler
-
-        Returns:
-            The response from the application
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
         """
-        start_time = time.time()
-        
+        if not self._enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter_ns()
+
         # Safely extract context - don't let context extraction break the request
         try:
-            context = get_request_context(request)
+            context = get_request_context(Request(scope))
         except Exception as e:
             # If context extraction fails, use empty context and log in dev mode
-            config = get_config()
-            if config.dev_mode:
-                print(f"Failed to extract request context: {e}")
+            if get_config().dev_mode:
+                logger.warning(f"Failed to extract request context: {e}")
             context = {}
 
-        try:
-            response = await call_next(request)
-
-            # Track successful request
-            if self.track_requests:
-                duration = time.time() - start_time
-                asyncio.create_task(self._track_request(context, response.status_code, duration))
+        status_code = 500
 
-            return response
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            duration = time.time() - start_time
-
-            # Track error
-            if self.track_errors:
-                asyncio.create_task(
-                    self._track_error(
-                        error=e,
-                        context=context,
-                        duration=duration,
-                    )
+            duration_us = (time.perf_counter_ns() - start_time) // 1000
+
+            # Track error; client errors (4xx) aren't worth a payload
+            if self.track_errors and not (
+                isinstance(e, HTTPException) and e.status_code < 500
+            ):
+                self._track_error(
+                    error=e,
+                    context=context,
+                    duration_us=duration_us,
                 )
 
             # Re-raise the exception
             raise
 
-    async def _track_request(
+        # Track successful request
+        if self.track_requests:
+            duration_us = (time.perf_counter_ns() - start_time) // 1000
+            self._track_request(context, status_code, duration_us)
+
+    def _track_request(
         self,
         context: dict,
         status_code: int,
-        duration: float,
+        duration_us: int,
     ) -> None:
         """Track a request event.
 
         Args:
             context: Request context
             status_code: HTTP status code
-            duration: Request duration in seconds
+            duration_us: Request duration in microseconds
         """
         try:
-            client = await get_client()
-            await client.track_event(
+            get = context.get
+            get_client_sync().track_event_nowait(
                 event_type="request",
-                user_id=context.get("user_id"),
-                session_id=context.get("session_id"),
+                user_id=get("user_id"),
+                session_id=get("session_id"),
                 metadata={
-                    "request_path": context.get("request_path"),
-                    "request_method": context.get("request_method"),
+                    "request_path": get("request_path"),
+                    "request_method": get("request_method"),
                     "status_code": status_code,
-                    "duration_ms": round(duration * 1000, 2),
+                    "duration_us": duration_us,
                 },
                 category="api_request",
             )
         except Exception as e:
-            config = get_config()
-            if config.dev_mode:
-                print(f"Failed to track request: {e}")
+            if get_config().dev_mode:
+                logger.warning(f"Failed to track request: {e}")
 
-    async def _track_error(
+    def _track_error(
         self,
         error: Exception,
         context: dict,
-        duration: float,
+        duration_us: int,
     ) -> None:
         """Track an error event.
 
         Args:
             error: The exception that occurred
             context: Request context
-            duration: Request duration until error in seconds
+            duration_us: Request duration until error in microseconds
         """
         try:
-            client = await get_client()
-            await client.track_service_error(
+            get = context.get
+            get_client_sync().track_service_error_nowait(
                 error_type=type(error).__name__,
                 error_message=str(error),
-                stack_trace=traceback.format_exc(),
-                request_path=context.get("request_path"),
-                request_method=context.get("request_method"),
-                user_id=context.get("user_id"),
-                session_id=context.get("session_id"),
+                stack_trace=error,
+                request_path=get("request_path"),
+                request_method=get("request_method"),
+                user_id=get("user_id"),
+                session_id=get("session_id"),
                 metadata={
-                    "duration_ms": round(duration * 1000, 2),
+                    "duration_us": duration_us,
                 },
             )
         except Exception as e:
-            config = get_config()
-            if config.dev_mode:
-                print(f"Failed to track error: {e}")
+            if get_config().dev_mode:
+                logger.warning(f"Failed to track error: {e}")
@@ -1,18 +1,18 @@
 """Flask middleware for observability."""
 
-import traceback
+import logging
 import time
-import asyncio
-from functools import wraps
-from typing import Optional, Callable
+from typing import NoReturn, Optional
 
-from flask import Flask, request, g
-from werkzeug.exceptions import HTTPException
+from flask import Flask, Response, request, g
+from werkzeug.exceptions import HTTPException, InternalServerError
 
-from ..client import get_client
+from ..client import _schedule_warmup, get_client_sync
 from ..config import get_config
 from ..utils.context import get_request_context
 
+logger = logging.getLogger(__name__)
+
 
 class ObservabilityMiddleware:
     """Flask middleware for automatic request and error tracking.
@@ -37,6 +37,9 @@ class ObservabilityMiddleware:
         track_errors: Whether to track all errors (default: True)
     """
 
+    # Read on every request; slots avoid the instance dict lookup
+    __slots__ = ("track_requests", "track_errors")
+
     def __init__(
         self,
         app: Optional[Flask] = None,
@@ -62,17 +65,26 @@ class ObservabilityMiddleware:
         Args:
             app: The Flask application
         """
+        if not (self.track_requests or self.track_errors):
+            # Nothing to track; don't add any per-request hooks
+            return
+
+        # Open the pooled connection before the first request is tracked
+        _schedule_warmup()
+
         app.before_request(self._before_request)
-        app.after_request(self._after_request)
+
+        if self.track_requests:
+            app.after_request(self._after_request)
 
         if self.track_errors:
             app.errorhandler(Exception)(self._handle_error)
 
     def _before_request(self) -> None:
         """Hook called before each request."""
-        g.observability_start_time = time.time()
+        g.observability_start_time = time.perf_counter_ns()
 
-    def _after_request(self, response):
+    def _after_request(self, response: Response) -> Response:
         """Hook called after each request.
 
         Args:
@@ -81,113 +93,114 @@ class ObservabilityMiddleware:
         Returns:
             The response object (unmodified)
         """
-        if self.track_requests and hasattr(g, "observability_start_time"):
-            duration = time.time() - g.observability_start_time
+        start_time = g.get("observability_start_time")
+        if self.track_requests and start_time is not None:
+            duration_us = (time.perf_counter_ns() - start_time) // 1000
             context = get_request_context(request)
 
-            # Run async tracking in background
-            asyncio.create_task(
-                self._track_request(
-                    context=context,
-                    status_code=response.status_code,
-                    duration=duration,
-                )
+            # Queue for the background flusher
+            self._track_request(
+                context=context,
+                status_code=response.status_code,
+                duration_us=duration_us,
             )
 
         return response
 
-    def _handle_error(self, error: Exception):
+    def _handle_error(self, error: Exception) -> NoReturn:
         """Handle errors and track them.
 
         Args:
             error: The exception that occurred
 
-        Returns:
-            The error response (allows Flask to continue handling)
+        Raises:
+            The error again, so Flask's own error handling continues
         """
-        if hasattr(g, "observability_start_time"):
-            duration = time.time() - g.observability_start_time
+        start_time = g.get("observability_start_time")
+        if start_time is not None:
+            duration_us = (time.perf_counter_ns() - start_time) // 1000
         else:
-            duration = 0.0
+            duration_us = 0
 
         context = get_request_context(request)
 
-        # Run async tracking in background
-        asyncio.create_task(
-            self._track_error(
-                error=error,
-                context=context,
-                duration=duration,
-            )
+        # Queue for the background flusher
+        self._track_error(
+            error=error,
+            context=context,
+            duration_us=duration_us,
         )
 
         # Re-raise to allow Flask's error handlers to work
         raise error
 
-    async def _track_request(
+    def _track_request(
         self,
         context: dict,
         status_code: int,
-        duration: float,
+        duration_us: int,
     ) -> None:
         """Track a request event.
 
         Args:
             context: Request context
             status_code: HTTP status code
-            duration: Request duration in seconds
+            duration_us: Request duration in microseconds
         """
         try:
-            client = await get_client()
-            await client.track_event(
+            get = context.get
+            get_client_sync().track_event_nowait(
                 event_type="request",
-                user_id=context.get("user_id"),
-                session_id=context.get("session_id"),
+                user_id=get("user_id"),
+                session_id=get("session_id"),
                 metadata={
-                    "request_path": context.get("request_path"),
-                    "request_method": context.get("request_method"),
+                    "request_path": get("request_path"),
+                    "request_method": get("request_method"),
                     "status_code": status_code,
-                    "duration_ms": round(duration * 1000, 2),
+                    "duration_us": duration_us,
                 },
                 category="api_request",
             )
         except Exception as e:
-            config = get_config()
-            if config.dev_mode:
-                print(f"Failed to track request: {e}")
+            if get_config().dev_mode:
+                logger.warning(f"Failed to track request: {e}")
 
-    async def _track_error(
+    def _track_error(
         self,
         error: Exception,
         context: dict,
-        duration: float,
+        duration_us: int,
     ) -> None:
         """Track an error event.
 
         Args:
             error: The exception that occurred
             context: Request context
-            duration: Request duration until error in seconds
+            duration_us: Request duration until error in microseconds
         """
         try:
             # Don't track standard HTTP exceptions as errors
-            if isinstance(error, HTTPException) and error.code < 500:
+            if isinstance(error, HTTPException) and error.code is not None and error.code < 500:
+                return
+
+            # Flask wraps the error re-raised by _handle_error and calls the
+            # handler again; the original was already tracked
+            if isinstance(error, InternalServerError) and error.original_exception is not None:
                 return
 
-            client = await get_client()
-            await client.track_service_error(
+            get = context.get
+            get_client_sync().track_service_error_nowait(
                 error_type=type(error).__name__,
                 error_message=str(error),
-                stack_trace=traceback.format_exc(),
-                request_path=context.get("request_path"),
-                request_method=context.get("request_method"),
-                user_id=context.get("user_id"),
-                session_id=context.get("session_id"),
+                stack_trace=error,
+                request_path=get("request_path"),
+                request_method=get("request_method"),
+                user_id=get("user_id"),
+                session_id=get("session_id"),
                 metadata={
-                    "duration_ms": round(duration * 1000, 2),
+                    "duration_us": duration_us,
                 },
             )
         except Exception as e:
-            config = get_config()
-            if config.dev_mode:
-                print(f"Failed to track error: {e}")
+            if get_config().dev_mode:
+                logger.warning(f"Failed to track error: {e}")
@@ -1,5 +1,15 @@
 """Tracking functions for observability events."""
 
-from .events import track_event, track_service_error
+from .events import (
+    track_event,
+    track_event_nowait,
+    track_service_error,
+    track_service_error_nowait,
+)
 
-__all__ = ["track_event", "track_service_error"]
+__all__ = [
+    "track_event",
+    "track_event_nowait",
+    "track_service_error",
+    "track_service_error_nowait",
+]
@@ -1,8 +1,8 @@
 """Event tracking functions."""
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
-from ..client import get_client
+from ..client import get_client, get_client_sync
 
 
 async def track_event(
@@ -48,7 +48,7 @@ async def track_event(
 async def track_service_error(
     error_type: str,
     error_message: str,
-    stack_trace: Optional[str] = None,
+    stack_trace: Optional[Union[str, BaseException]] = None,
     request_path: Optional[str] = None,
     request_method: Optional[str] = None,
     user_id: Optional[int] = None,
@@ -62,7 +62,8 @@ async def track_service_error(
     Args:
         error_type: Type of error (e.g., exception class name)
         error_message: Error message
-        stack_trace: Full stack trace
+        stack_trace: Full stack trace, or the exception itself to format it only
+            when the error is actually sent
         request_path: Request path where error occurred
         request_method: HTTP method (GET, POST, etc.)
         user_id: ID of the user (if applicable)
@@ -81,7 +82,7 @@ async def track_service_error(
             await track_service_error(
                 error_type=type(e).__name__,
                 error_message=str(e),
-                stack_trace=traceback.format_exc(),
+                stack_trace=e,
                 request_path="/api/users",
                 request_method="POST"
             )
@@ -98,3 +99,80 @@ async def track_service_error(
         session_id=session_id,
         metadata=metadata,
     )
+
+
+def track_event_nowait(
+    event_type: str,
+    user_id: Optional[int] = None,
+    session_id: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    category: str = "user_action",
+) -> bool:
+    """Queue a user event without awaiting.
+
+    Use this from synchronous code (e.g. Flask or Django views) instead of
+    scheduling ``track_event`` with ``asyncio.create_task``.
+
+    Args:
+        event_type: Type of event (e.g., 'user_action', 'page_view')
+        user_id: ID of the user performing the action
+        session_id: Session ID
+        metadata: Additional event metadata
+        category: Event category (default: 'user_action')
+
+    Returns:
+        True if the event was queued, False if it was dropped
+
+    Example:
+        ```python
+        track_event_nowait("item_created", user_id=123, metadata={"name": "Widget"})
+        ```
+    """
+    return get_client_sync().track_event_nowait(
+        event_type=event_type,
+        user_id=user_id,
+        session_id=session_id,
+        metadata=metadata,
+        category=category,
+    )
+
+
+def track_service_error_nowait(
+    error_type: str,
+    error_message: str,
+    stack_trace: Optional[Union[str, BaseException]] = None,
+    request_path: Optional[str] = None,
+    request_method: Optional[str] = None,
+    user_id: Optional[int] = None,
+    session_id: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """Queue a service error without awaiting.
+
+    Use this from synchronous code (e.g. Flask or Django views) instead of
+    scheduling ``track_service_error`` with ``asyncio.create_task``.
+
+    Args:
+        error_type: Type of error (e.g., exception class name)
+        error_message: Error message
+        stack_trace: Full stack trace, or the exception itself to format it only
+            when the error is actually sent
+        request_path: Request path where error occurred
+        request_method: HTTP method (GET, POST, etc.)
+        user_id: ID of the user (if applicable)
+        session_id: Session ID (if applicable)
+        metadata: Additional error metadata
+
+    Returns:
+        True if the error was queued, False if it was dropped
+    """
+    return get_client_sync().track_service_error_nowait(
+        error_type=error_type,
+        error_message=error_message,
+        stack_trace=stack_trace,
+        request_path=request_path,
+        request_method=request_method,
+        user_id=user_id,
+        session_id=session_id,
+        metadata=metadata,
+    )
@@ -0,0 +1,28 @@
+"""Asyncio helpers."""
+
+import asyncio
+from typing import Any, Coroutine, Set, TypeVar
+
+T = TypeVar("T")
+
+# The event loop only keeps weak references to tasks; these keep background
+# tasks alive until they finish
+_background_tasks: Set["asyncio.Task[Any]"] = set()
+
+
+def spawn(coro: Coroutine[Any, Any, T]) -> "asyncio.Task[T]":
+    """Run a coroutine as a fire-and-forget task on the running loop.
+
+    Unlike a bare ``asyncio.create_task``, the task is referenced until it
+    completes, so it can't be garbage collected mid-flight.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The scheduled task
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
@@ -1,7 +1,15 @@
 """Context utilities for extracting request information."""
 
-from typing import Optional, Dict, Any, Union
-import re
+import functools
+import sys
+from typing import Callable, Optional, Dict, Any, Tuple, Type
+
+# Marks an attribute that is not set at all, as opposed to set to None
+_MISSING = object()
+
+# Cookie names checked for a session ID, in order
+_SESSION_COOKIE_NAMES = ("sessionid", "session_id", "session", "_session")
+_SESSION_COOKIE_NAME_SET = frozenset(_SESSION_COOKIE_NAMES)
 
 
 def get_request_context(request: Any) -> Dict[str, Any]:
@@ -9,70 +17,267 @@ def get_request_context(request: Any) -> Dict[str, Any]:
 
     This function works with FastAPI, Flask, and Django request objects.
 
+    The context is extracted once per request and cached on the request as
+    ``__observability_ctx__``; delete that attribute to extract it again
+    (e.g. after authentication has set the user).
+
     Args:
         request: Request object from any supported framework
 
     Returns:
         Dictionary containing request context (path, method, user_id, session_id)
     """
+    try:
+        cached: Dict[str, Any] = request.__observability_ctx__
+        return cached
+    except AttributeError:
+        pass
+
+    # Annotated as a plain type: mypy doesn't treat type[Any] as Hashable
+    request_cls: type = type(request)
+    context = _get_extractors(request_cls)[2](request)
+    try:
+        request.__observability_ctx__ = context
+    except (AttributeError, TypeError):
+        # Some request objects don't accept new attributes
+        pass
+    return context
+
+
+def extract_user_id(request: Any) -> Optional[int]:
+    """Extract user ID from a request object.
+
+    Checks common patterns across frameworks:
+    - request.user.id (Django, some FastAPI patterns)
+    - request.state.user_id (FastAPI/Starlette)
+    - session["user_id"] (Flask, Django)
+
+    Args:
+        request: Request object from any supported framework
+
+    Returns:
+        User ID if found, None otherwise
+    """
+    request_cls: type = type(request)
+    return _get_extractors(request_cls)[0](request)
+
+
+def extract_session_id(request: Any) -> Optional[str]:
+    """Extract session ID from a request object.
+
+    Checks common patterns across frameworks:
+    - request.session.session_key (Django)
+    - request.state.session_id (FastAPI/Starlette)
+    - session.sid (Flask)
+    - cookies
+
+    Args:
+        request: Request object from any supported framework
+
+    Returns:
+        Session ID if found, None otherwise
+    """
+    request_cls: type = type(request)
+    return _get_extractors(request_cls)[1](request)
+
+
+_Extractors = Tuple[
+    Callable[[Any], Optional[int]],
+    Callable[[Any], Optional[str]],
+    Callable[[Any], Dict[str, Any]],
+]
+
+
+@functools.lru_cache(maxsize=32)
+def _get_extractors(request_cls: type) -> _Extractors:
+    """Pick the extractors for a request class, once per class.
+
+    Starlette requests are read straight from their ASGI scope; any other
+    request type is probed for the patterns of every supported framework.
+
+    Args:
+        request_cls: Type of the request object
+
+    Returns:
+        Tuple of (user_id, session_id, context) extractor functions
+    """
+    # Only loaded if the app uses Starlette, so no import is needed here
+    starlette_requests = sys.modules.get("starlette.requests")
+    if starlette_requests is not None and issubclass(
+        request_cls, starlette_requests.HTTPConnection
+    ):
+        return _starlette_user_id, _starlette_session_id, _starlette_context
+    return _generic_user_id, _generic_session_id, _generic_context
+
+
+# The extractors below run on every tracked request; builtins they call are
+# bound as default arguments so they are looked up as locals. User IDs are
+# usually ints already, so int() is only called for other types.
+def _starlette_context(request: Any) -> Dict[str, Any]:
+    """Extract the request context of a Starlette request from its scope."""
+    scope = request.scope
+    context: Dict[str, Any] = {"request_path": scope["path"]}
+
+    # Websocket scopes have no method
+    method = scope.get("method")
+    if method is not None:
+        context["request_method"] = method
+
+    user_id = _starlette_user_id(request)
+    if user_id is not None:
+        context["user_id"] = user_id
+
+    session_id = _starlette_session_id(request)
+    if session_id is not None:
+        context["session_id"] = session_id
+
+    return context
+
+
+def _starlette_user_id(
+    request: Any,
+    _int: Type[int] = int,
+    _type: Any = type,
+) -> Optional[int]:
+    """Extract the user ID of a Starlette request from its scope.
+
+    ``request.state``, ``request.user`` and ``request.session`` are views of
+    the ``state``, ``user`` and ``session`` scope keys.
+    """
+    scope = request.scope
+
+    # IDs that aren't integers (e.g. UUIDs) are skipped, as for the cookie
+    state = scope.get("state")
+    if state:
+        user_id = state.get("user_id")
+        if user_id is not None:
+            try:
+                return user_id if _type(user_id) is _int else _int(user_id)
+            except (ValueError, TypeError):
+                pass
+
+    user = scope.get("user")
+    if user is not None:
+        try:
+            user_id = getattr(user, "id", None)
+            if user_id is not None:
+                return user_id if _type(user_id) is _int else _int(user_id)
+            user_id = getattr(user, "pk", None)
+            if user_id is not None:
+                return user_id if _type(user_id) is _int else _int(user_id)
+        except (ValueError, TypeError):
+            pass
+
+    session = scope.get("session")
+    if session:
+        try:
+            user_id = session.get("user_id")
+            if user_id is not None:
+                return user_id if _type(user_id) is _int else _int(user_id)
+            user_id = session.get("userId")
+            if user_id is not None:
+                return user_id if _type(user_id) is _int else _int(user_id)
+        except (ValueError, TypeError):
+            pass
+
+    cookie_user_id = request.cookies.get("user_id")
+    if cookie_user_id is not None:
+        try:
+            return _int(cookie_user_id)
+        except (ValueError, TypeError):
+            pass
+
+    return None
+
+
+def _starlette_session_id(
+    request: Any,
+    _str: Type[str] = str,
+) -> Optional[str]:
+    """Extract the session ID of a Starlette request from its scope."""
+    state = request.scope.get("state")
+    if state and "session_id" in state:
+        return _str(state["session_id"])
+
+    # Starlette sessions are plain dicts, without a session key
+    cookies = request.cookies
+    if _SESSION_COOKIE_NAME_SET.isdisjoint(cookies):
+        return None
+    for cookie_name in _SESSION_COOKIE_NAMES:
+        value = cookies.get(cookie_name)
+        if value:
+            return _str(value)
+
+    return None
+
+
+def _generic_context(
+    request: Any,
+    _str: Type[str] = str,
+) -> Dict[str, Any]:
+    """Extract the request context by probing each framework's attributes."""
     context: Dict[str, Any] = {}
 
-    # Extract path
-    if hasattr(request, "url"):
-        # FastAPI/Starlette
-        if hasattr(request.url, "path"):
-            context["request_path"] = str(request.url.path)
-    elif hasattr(request, "path"):
-        # Flask/Django
-        context["request_path"] = str(request.path)
+    # Extract path: FastAPI/Starlette expose request.url.path, Flask/Django
+    # request.path (Flask's request.url is a plain string)
+    try:
+        context["request_path"] = _str(request.url.path)
+    except AttributeError:
+        try:
+            context["request_path"] = _str(request.path)
+        except AttributeError:
+            pass
 
     # Extract method
-    if hasattr(request, "method"):
-        context["request_method"] = str(request.method)
+    try:
+        context["request_method"] = _str(request.method)
+    except AttributeError:
+        pass
 
     # Extract user ID
-    user_id = extract_user_id(request)
+    user_id = _generic_user_id(request)
     if user_id is not None:
         context["user_id"] = user_id
 
     # Extract session ID
-    session_id = extract_session_id(request)
+    session_id = _generic_session_id(request)
     if session_id is not None:
         context["session_id"] = session_id
 
     return context
 
 
-def extract_user_id(request: Any) -> Optional[int]:
-    """Extract user ID from a request object.
-
-    Checks common patterns across frameworks:
-    - request.user.id (Django, some FastAPI patterns)
-    - request.state.user_id (FastAPI/Starlette)
-    - session['user_id'] (Flask)
-
-    Args:
-        request: Request object from any supported framework
+def _generic_user_id(
+    request: Any,
+    _int: Type[int] = int,
+    _type: Any = type,
+) -> Optional[int]:
+    """Extract the user ID by probing each framework's attributes.
 
-    Returns:
-        User ID if found, None otherwise
+    IDs that aren't integers (e.g. UUIDs) are skipped, as for the cookie.
     """
     # FastAPI/Starlette state
-    if hasattr(request, "state") and hasattr(request.state, "user_id"):
-        user_id = request.state.user_id
+    state = getattr(request, "state", None)
+    if state is not None:
+        user_id = getattr(state, "user_id", None)
         if user_id is not None:
-            return int(user_id)
+            try:
+                return user_id if _type(user_id) is _int else _int(user_id)
+            except (ValueError, TypeError):
+                pass
 
     # Django/FastAPI user object
     # Use try-except to safely access request.user (Starlette requires AuthenticationMiddleware)
     # Note: hasattr() can trigger the property getter in Starlette, so we try directly
     try:
         user = request.user
-        if hasattr(user, "id") and user.id is not None:
-            return int(user.id)
-        if hasattr(user, "pk") and user.pk is not None:
-            return int(user.pk)
-    except (AssertionError, AttributeError):
+        user_id = getattr(user, "id", None)
+        if user_id is not None:
+            return user_id if _type(user_id) is _int else _int(user_id)
+        user_id = getattr(user, "pk", None)
+        if user_id is not None:
+            return user_id if _type(user_id) is _int else _int(user_id)
+    except (AssertionError, AttributeError, ValueError, TypeError):
         # request.user requires AuthenticationMiddleware in Starlette/FastAPI
         # Skip if not available
         pass
@@ -80,67 +285,70 @@ def extract_user_id(request: Any) -> Optional[int]:
     # Flask session
     # Use try-except to safely access request.session (Starlette requires SessionMiddleware)
     try:
+        # Any mapping-like session (Flask, Django); objects without .get are skipped
         session = request.session
-        if isinstance(session, dict):
-            if "user_id" in session and session["user_id"] is not None:
-                return int(session["user_id"])
-            if "userId" in session and session["userId"] is not None:
-                return int(session["userId"])
-    except (AssertionError, AttributeError):
+        user_id = session.get("user_id")
+        if user_id is not None:
+            return user_id if _type(user_id) is _int else _int(user_id)
+        user_id = session.get("userId")
+        if user_id is not None:
+            return user_id if _type(user_id) is _int else _int(user_id)
+    except (AssertionError, AttributeError, ValueError, TypeError):
         # request.session requires SessionMiddleware in Starlette/FastAPI
         # Skip if not available
         pass
 
     # Check cookies
-    if hasattr(request, "cookies"):
-        cookies = request.cookies
-        if "user_id" in cookies:
-            try:
-                return int(cookies["user_id"])
-            except (ValueError, TypeError):
-                pass
+    try:
+        cookie_user_id = request.cookies.get("user_id")
+    except AttributeError:
+        return None
+    if cookie_user_id is not None:
+        try:
+            return _int(cookie_user_id)
+        except (ValueError, TypeError):
+            pass
 
     return None
 
 
-def extract_session_id(request: Any) -> Optional[str]:
-    """Extract session ID from a request object.
-
-    Checks common patterns across frameworks:
-    - request.session.session_key (Django)
-    - request.state.session_id (FastAPI/Starlette)
-    - session.sid (Flask)
-    - cookies
-
-    Args:
-        request: Request object from any supported framework
-
-    Returns:
-        Session ID if found, None otherwise
-    """
+def _generic_session_id(
+    request: Any,
+    _str: Type[str] = str,
+) -> Optional[str]:
+    """Extract the session ID by probing each framework's attributes."""
     # FastAPI/Starlette state
-    if hasattr(request, "state") and hasattr(request.state, "session_id"):
-        return str(request.state.session_id)
+    state = getattr(request, "state", None)
+    if state is not None:
+        session_id = getattr(state, "session_id", _MISSING)
+        if session_id is not _MISSING:
+            return _str(session_id)
 
     # Django session
     # Use try-except to safely access request.session (Starlette requires SessionMiddleware)
     try:
         session = request.session
         if hasattr(session, "session_key") and session.session_key:
-            return str(session.session_key)
+            return _str(session.session_key)
         # Flask-Session
         if hasattr(session, "sid") and session.sid:
-            return str(session.sid)
+            return _str(session.sid)
     except (AssertionError, AttributeError):
         # request.session requires SessionMiddleware in Starlette/FastAPI
         # Skip if not available
         pass
 
     # Check cookies for common session cookie names
-    if hasattr(request, "cookies"):
+    try:
         cookies = request.cookies
-        for cookie_name in ["sessionid", "session_id", "session", "_session"]:
-            if cookie_name in cookies and cookies[cookie_name]:
-                return str(cookies[cookie_name])
+    except AttributeError:
+        return None
+    # Most requests carry none of the session cookies; one set check rules them all out
+    if _SESSION_COOKIE_NAME_SET.isdisjoint(cookies):
+        return None
+    for cookie_name in _SESSION_COOKIE_NAMES:
+        value = cookies.get(cookie_name)
+        if value:
+            return _str(value)
 
     return None
@@ -1,8 +1,46 @@
+import os
+import warnings
+
 from setuptools import setup, find_packages
+from setuptools.command.build_ext import build_ext
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Modules on the per-request path that can be compiled with Cython. The
+# .py sources are always installed, so the pure-Python module is used when
+# compilation is off or fails.
+COMPILED_MODULES = ["observability_client/utils/context.py"]
+
+
+class OptionalBuildExt(build_ext):
+    """Build the compiled modules, falling back to pure Python on failure."""
+
+    def run(self):
+        try:
+            super().run()
+        except Exception as e:
+            warnings.warn(f"Compiled modules not built, using pure Python: {e}")
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as e:
+            warnings.warn(f"{ext.name} not built, using pure Python: {e}")
+
+
+def compiled_extensions():
+    """Get the Cython extensions, if OBSERVABILITY_CLIENT_COMPILE=1 and Cython is installed."""
+    if os.environ.get("OBSERVABILITY_CLIENT_COMPILE") != "1":
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        warnings.warn("OBSERVABILITY_CLIENT_COMPILE=1 but Cython is not installed")
+        return []
+    return cythonize(COMPILED_MODULES, compiler_directives={"language_level": "3"})
+
+
 setup(
     name="observability-client",
     version="1.0.0",
@@ -13,28 +51,29 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/your-org/ai-observability",
     packages=find_packages(exclude=["tests*", "examples*"]),
+    ext_modules=compiled_extensions(),
+    cmdclass={"build_ext": OptionalBuildExt},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
-        "httpx>=0.24.0",
-        "pydantic>=2.0.0",
+        "httpx[http2]>=0.24.0",
+        "orjson>=3.9.0",
     ],
     extras_require={
         "fastapi": ["fastapi>=0.100.0", "starlette>=0.27.0"],
         "flask": ["flask>=2.0.0"],
         "django": ["django>=4.0.0"],
+        "uvloop": ["uvloop>=0.17.0; sys_platform != 'win32'"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
@@ -0,0 +1,72 @@
+"""Tests for the track_error decorator."""
+
+import pytest
+from unittest.mock import patch
+
+from observability_client.decorators import track_error
+
+
+def test_track_error_queues_exception():
+    """Test that a raised exception is queued with its metadata."""
+    @track_error(extract_metadata=lambda value: {"value": value}, reraise=False)
+    def fail(value):
+        raise ValueError("boom")
+
+    with patch("observability_client.decorators.track_error.track_service_error_nowait") as mock_track:
+        fail(1)
+
+    kwargs = mock_track.call_args.kwargs
+    assert kwargs["error_type"] == "ValueError"
+    assert kwargs["error_message"] == "boom"
+    assert isinstance(kwargs["stack_trace"], ValueError)
+    assert kwargs["metadata"] == {"value": 1, "function": "fail"}
+
+
+def test_track_error_cache_key_memoizes_extractors():
+    """Test that extractor results are reused for the same cache key."""
+    calls = []
+
+    def extract_metadata(value):
+        calls.append(value)
+        return {"operation": "process"}
+
+    @track_error(extract_metadata=extract_metadata, cache_key=lambda value: value)
+    def fail(value):
+        raise ValueError("boom")
+
+    with patch("observability_client.decorators.track_error.track_service_error_nowait"):
+        for value in (1, 1, 2):
+            with pytest.raises(ValueError):
+                fail(value)
+
+    assert calls == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_track_error_async_function():
+    """Test that exceptions from coroutine functions are tracked and re-raised."""
+    @track_error()
+    async def fail():
+        raise KeyError("missing")
+
+    with patch("observability_client.decorators.track_error.track_service_error_nowait") as mock_track:
+        with pytest.raises(KeyError):
+            await fail()
+
+    assert mock_track.call_args.kwargs["error_type"] == "KeyError"
+    assert mock_track.call_args.kwargs["metadata"] == {"function": "fail"}
+
+
+def test_dev_mode_enabled_after_decoration(caplog):
+    """Test that extraction failures are logged when dev mode is set after decorating."""
+    from observability_client import ObservabilityConfig, set_config
+
+    @track_error(extract_metadata=lambda: 1 / 0, reraise=False)
+    def fail():
+        raise ValueError("boom")
+
+    set_config(ObservabilityConfig(dev_mode=True, test_mode=True))
+    with patch("observability_client.decorators.track_error.track_service_error_nowait"):
+        fail()
+
+    assert "Failed to extract metadata" in caplog.text
@@ -0,0 +1,92 @@
+"""Tests for the track_event decorator."""
+
+import pytest
+from unittest.mock import patch
+
+from observability_client.decorators import track_event
+
+
+def test_track_event_sync_function_without_loop():
+    """Test that decorated sync functions queue events without an event loop."""
+    @track_event("item_created", extract_metadata=lambda item: {"name": item["name"]})
+    def create_item(item):
+        return item
+
+    with patch("observability_client.decorators.track_event.track_event_nowait") as mock_track:
+        result = create_item({"name": "Widget"})
+
+    assert result == {"name": "Widget"}
+    mock_track.assert_called_once_with(
+        event_type="item_created",
+        category="user_action",
+        metadata={"name": "Widget"},
+        user_id=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_track_event_async_without_extractors():
+    """Test that decorated async functions queue an event without metadata."""
+    @track_event("item_listed", category="api")
+    async def list_items():
+        return []
+
+    with patch("observability_client.decorators.track_event.track_event_nowait") as mock_track:
+        assert await list_items() == []
+
+    mock_track.assert_called_once_with(
+        event_type="item_listed",
+        category="api",
+        metadata=None,
+        user_id=None,
+    )
+
+
+def test_track_event_preserves_function_metadata():
+    """Test that the wrapper keeps the wrapped function's name, docs and signature."""
+    import inspect
+
+    def create_item(item: dict, user_id: int = 0) -> dict:
+        """Create an item."""
+        return item
+
+    wrapped = track_event("item_created")(create_item)
+
+    assert wrapped.__name__ == "create_item"
+    assert wrapped.__qualname__ == create_item.__qualname__
+    assert wrapped.__doc__ == "Create an item."
+    assert wrapped.__wrapped__ is create_item
+    assert inspect.signature(wrapped) == inspect.signature(create_item)
+
+
+def test_track_event_combined_extractor():
+    """Test that a single extractor supplies both metadata and user_id."""
+    @track_event("item_created", extract=lambda item, user_id: ({"name": item["name"]}, user_id))
+    def create_item(item, user_id):
+        return item
+
+    with patch("observability_client.decorators.track_event.track_event_nowait") as mock_track:
+        create_item({"name": "Widget"}, 7)
+
+    mock_track.assert_called_once_with(
+        event_type="item_created",
+        category="user_action",
+        metadata={"name": "Widget"},
+        user_id=7,
+    )
+
+
+def test_track_event_still_tracked_when_extraction_fails():
+    """Test that a failing extractor falls back to no metadata and no user_id."""
+    def fail(*args, **kwargs):
+        raise ValueError("bad")
+
+    @track_event("item_created", extract_metadata=fail, extract_user_id=lambda item: 1)
+    def create_item(item):
+        return item
+
+    with patch("observability_client.decorators.track_event.track_event_nowait") as mock_track:
+        create_item({})
+
+    assert mock_track.call_args.kwargs["metadata"] is None
+    assert mock_track.call_args.kwargs["user_id"] is None
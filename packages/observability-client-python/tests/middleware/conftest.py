@@ -0,0 +1,11 @@
+"""Fixtures for middleware tests."""
+
+import pytest
+
+from observability_client import ObservabilityConfig, set_config
+
+
+@pytest.fixture(autouse=True)
+def middleware_test_mode():
+    """Run middleware in test mode so creating it doesn't warm up a real client."""
+    set_config(ObservabilityConfig(test_mode=True))
@@ -0,0 +1,90 @@
+"""Tests for the Django middleware."""
+
+from unittest.mock import patch
+
+import pytest
+
+django = pytest.importorskip("django")
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(DEBUG=True, ALLOWED_HOSTS=["*"])
+    django.setup()
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from observability_client.middleware.django import ObservabilityMiddleware
+
+
+def test_response_tracked_without_event_loop():
+    """Test that responses are queued from the sync WSGI path."""
+    middleware = ObservabilityMiddleware(lambda request: HttpResponse("ok"))
+    request = RequestFactory().get("/items")
+
+    with patch("observability_client.client.ObservabilityClient.track_event_nowait") as mock_track:
+        response = middleware(request)
+
+    assert response.status_code == 200
+    metadata = mock_track.call_args.kwargs["metadata"]
+    assert metadata["request_method"] == "GET"
+    assert metadata["status_code"] == 200
+
+
+def test_disabled_middleware_is_not_used():
+    """Test that Django drops the middleware when tracking is disabled."""
+    from django.core.exceptions import MiddlewareNotUsed
+    from django.test import override_settings
+
+    with override_settings(OBSERVABILITY_TRACK_REQUESTS=False, OBSERVABILITY_TRACK_ERRORS=False):
+        with pytest.raises(MiddlewareNotUsed):
+            ObservabilityMiddleware(lambda request: HttpResponse("ok"))
+
+
+def test_context_extracted_once_on_error():
+    """Test that process_exception and process_response share one context."""
+    middleware = ObservabilityMiddleware(lambda request: HttpResponse("ok"))
+    request = RequestFactory().get("/fail")
+    middleware.process_request(request)
+
+    with patch(
+        "observability_client.middleware.django.get_request_context", return_value={}
+    ) as mock_context, patch(
+        "observability_client.client.ObservabilityClient.track_service_error_nowait"
+    ), patch("observability_client.client.ObservabilityClient.track_event_nowait"):
+        middleware.process_exception(request, RuntimeError("boom"))
+        middleware.process_response(request, HttpResponse(status=500))
+
+    mock_context.assert_called_once()
+
+
+def test_client_errors_not_tracked():
+    """Test that Http404 and PermissionDenied are not queued as service errors."""
+    from django.core.exceptions import PermissionDenied
+    from django.http import Http404
+
+    middleware = ObservabilityMiddleware(lambda request: HttpResponse("ok"))
+    request = RequestFactory().get("/missing")
+
+    with patch("observability_client.client.ObservabilityClient.track_service_error_nowait") as mock_track:
+        assert middleware.process_exception(request, Http404("missing")) is None
+        assert middleware.process_exception(request, PermissionDenied()) is None
+
+    mock_track.assert_not_called()
+
+
+def test_non_integer_session_user_id_ignored():
+    """Test that a non-integer user_id in the session doesn't break the response."""
+    from django.contrib.sessions.backends.signed_cookies import SessionStore
+
+    middleware = ObservabilityMiddleware(lambda request: HttpResponse("ok"))
+    request = RequestFactory().get("/items")
+    request.session = SessionStore()
+    request.session["user_id"] = "8f3a-uuid"
+
+    with patch("observability_client.client.ObservabilityClient.track_event_nowait") as mock_track:
+        response = middleware(request)
+
+    assert response.status_code == 200
+    assert "user_id" not in mock_track.call_args.kwargs["metadata"]
@@ -0,0 +1,52 @@
+"""Tests for the native async Django middleware."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+django = pytest.importorskip("django")
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(DEBUG=True, ALLOWED_HOSTS=["*"])
+    django.setup()
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from observability_client.middleware.django_async import ObservabilityMiddleware
+
+
+def test_async_chain_is_awaited_directly():
+    """Test that an async chain makes the middleware itself a coroutine."""
+
+    async def get_response(request):
+        return HttpResponse("ok", status=201)
+
+    middleware = ObservabilityMiddleware(get_response)
+    request = RequestFactory().get("/items")
+
+    assert asyncio.iscoroutinefunction(middleware)
+    with patch("observability_client.client.ObservabilityClient.track_event_nowait") as mock_track:
+        response = asyncio.run(middleware(request))
+
+    assert response.status_code == 201
+    metadata = mock_track.call_args.kwargs["metadata"]
+    assert metadata["request_path"] == "/items"
+    assert metadata["status_code"] == 201
+    assert isinstance(metadata["duration_us"], int)
+
+
+def test_sync_chain_tracked():
+    """Test that the middleware also works in a sync chain."""
+    middleware = ObservabilityMiddleware(lambda request: HttpResponse("ok"))
+    request = RequestFactory().get("/items")
+
+    assert not asyncio.iscoroutinefunction(middleware)
+    with patch("observability_client.client.ObservabilityClient.track_event_nowait") as mock_track:
+        response = middleware(request)
+
+    assert response.status_code == 200
+    assert mock_track.call_args.kwargs["metadata"]["status_code"] == 200
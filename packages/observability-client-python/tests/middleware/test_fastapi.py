@@ -0,0 +1,80 @@
+"""Tests for the FastAPI middleware."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+fastapi = pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+
+from observability_client.middleware.fastapi import ObservabilityMiddleware
+
+
+def test_request_tracked_with_status_code():
+    """Test that the status code is captured from the ASGI response start."""
+    app = fastapi.FastAPI()
+    app.add_middleware(ObservabilityMiddleware)
+
+    @app.get("/items")
+    async def items():
+        return fastapi.responses.JSONResponse({"ok": True}, status_code=201)
+
+    with patch("observability_client.client.ObservabilityClient.track_event_nowait") as mock_track:
+        response = TestClient(app).get("/items")
+
+    assert response.status_code == 201
+    kwargs = mock_track.call_args.kwargs
+    assert kwargs["event_type"] == "request"
+    assert kwargs["metadata"]["request_path"] == "/items"
+    assert kwargs["metadata"]["request_method"] == "GET"
+    assert kwargs["metadata"]["status_code"] == 201
+    assert isinstance(kwargs["metadata"]["duration_us"], int)
+
+
+def test_error_tracked_and_reraised():
+    """Test that unhandled errors are tracked and propagate."""
+    app = fastapi.FastAPI()
+    app.add_middleware(ObservabilityMiddleware)
+
+    @app.get("/fail")
+    async def fail():
+        raise RuntimeError("boom")
+
+    with patch("observability_client.client.ObservabilityClient.track_service_error_nowait") as mock_track:
+        with pytest.raises(RuntimeError):
+            TestClient(app).get("/fail")
+
+    mock_track.assert_called_once()
+    kwargs = mock_track.call_args.kwargs
+    assert kwargs["error_type"] == "RuntimeError"
+    assert kwargs["request_path"] == "/fail"
+
+
+def test_client_http_exceptions_not_tracked():
+    """Test that 4xx HTTPExceptions propagate without being tracked."""
+    from starlette.exceptions import HTTPException
+
+    async def app(scope, receive, send):
+        raise HTTPException(status_code=404)
+
+    middleware = ObservabilityMiddleware(app)
+    scope = {"type": "http", "method": "GET", "path": "/missing", "headers": [], "query_string": b""}
+
+    async def call():
+        await middleware(scope, None, None)
+
+    with patch("observability_client.client.ObservabilityClient.track_service_error_nowait") as mock_track:
+        with pytest.raises(HTTPException):
+            asyncio.run(call())
+
+    mock_track.assert_not_called()
+
+
+def test_middleware_has_no_instance_dict():
+    """Test that the middleware keeps its settings in slots."""
+    middleware = ObservabilityMiddleware(lambda scope, receive, send: None)
+
+    assert not hasattr(middleware, "__dict__")
+    assert middleware._enabled
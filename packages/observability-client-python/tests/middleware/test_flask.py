@@ -0,0 +1,58 @@
+"""Tests for the Flask middleware."""
+
+from unittest.mock import patch
+
+import pytest
+
+flask = pytest.importorskip("flask")
+
+from observability_client.middleware.flask import ObservabilityMiddleware
+
+
+def test_request_tracked_with_integer_duration():
+    """Test that requests are queued with their duration in microseconds."""
+    app = flask.Flask(__name__)
+    ObservabilityMiddleware(app)
+
+    @app.route("/items")
+    def items():
+        return "ok"
+
+    with patch("observability_client.client.ObservabilityClient.track_event_nowait") as mock_track:
+        response = app.test_client().get("/items")
+
+    assert response.status_code == 200
+    kwargs = mock_track.call_args.kwargs
+    assert kwargs["event_type"] == "request"
+    assert kwargs["category"] == "api_request"
+    assert kwargs["metadata"]["status_code"] == 200
+    assert isinstance(kwargs["metadata"]["duration_us"], int)
+
+
+def test_error_tracked_without_event_loop():
+    """Test that unhandled errors are queued from the sync WSGI path."""
+    app = flask.Flask(__name__)
+    ObservabilityMiddleware(app)
+
+    @app.route("/fail")
+    def fail():
+        raise RuntimeError("boom")
+
+    with patch("observability_client.client.ObservabilityClient.track_service_error_nowait") as mock_track:
+        # The middleware re-raises, so Flask ends up with an internal server error
+        with pytest.raises(Exception):
+            app.test_client().get("/fail")
+
+    mock_track.assert_called_once()
+    kwargs = mock_track.call_args.kwargs
+    assert kwargs["error_type"] == "RuntimeError"
+    assert isinstance(kwargs["stack_trace"], RuntimeError)
+
+
+def test_disabled_middleware_adds_no_hooks():
+    """Test that no request hooks are registered when tracking is disabled."""
+    app = flask.Flask(__name__)
+    ObservabilityMiddleware(app, track_requests=False, track_errors=False)
+
+    assert not app.before_request_funcs
+    assert not app.after_request_funcs
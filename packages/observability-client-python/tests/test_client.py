@@ -1,10 +1,18 @@
 """Tests for client module."""
 
+import ast
+import asyncio
+import gzip
+import traceback
+from pathlib import Path
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
+import orjson
 
-from observability_client import ObservabilityClient, ObservabilityConfig
+from observability_client import ObservabilityClient
+from observability_client._runtime import get_runtime
 
 
 @pytest.mark.asyncio
@@ -14,6 +22,7 @@ async def test_client_initialization(test_config):
     assert client.config == test_config
     assert client._http_client is None
     assert client._service_healthy is True
+    assert not hasattr(client, "__dict__")
 
 
 @pytest.mark.asyncio
@@ -65,6 +74,25 @@ async def test_check_health_success(test_config):
     await client.close()
 
 
+@pytest.mark.asyncio
+async def test_check_health_cached(test_config):
+    """Test that a healthy result is reused until the service fails."""
+    test_config.test_mode = False
+    client = ObservabilityClient(test_config)
+
+    with patch.object(client, "_http_client", new_callable=AsyncMock) as mock_client:
+        mock_client.get.return_value = MagicMock(status_code=200)
+
+        assert await client.check_health() is True
+        assert await client.check_health() is True
+        assert mock_client.get.call_count == 1
+
+        # A failed request invalidates the cached result
+        client._service_healthy = False
+        assert await client.check_health() is True
+        assert mock_client.get.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_check_health_failure(test_config):
     """Test health check with failed response."""
@@ -178,3 +206,365 @@ async def test_send_request_max_retries_exceeded(test_config):
         assert result is None
         assert mock_client.post.call_count == 3  # Initial + 2 retries
         assert client._service_healthy is False
+
+
+@pytest.mark.asyncio
+async def test_track_event_is_queued(test_config):
+    """Test that events are buffered instead of sent immediately."""
+    test_config.test_mode = False
+    client = ObservabilityClient(test_config)
+
+    with patch.object(client, "_http_client", new_callable=AsyncMock) as mock_client:
+        result = await client.track_event(event_type="queued_event")
+
+        assert result == {"status": "queued"}
+        assert client._event_queue.qsize() == 1
+        mock_client.post.assert_not_called()
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_sends_bulk_batches(test_config):
+    """Test that flush drains the queue in batches of batch_size."""
+    test_config.test_mode = False
+    test_config.batch_size = 2
+    client = ObservabilityClient(test_config)
+
+    with patch.object(client, "_http_client", new_callable=AsyncMock) as mock_client:
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"status": "success"}
+        mock_client.post.return_value = mock_response
+
+        for i in range(3):
+            await client.track_event(event_type=f"event_{i}")
+        await client.flush()
+
+        assert mock_client.post.call_count == 2
+        first_url = mock_client.post.call_args_list[0].args[0]
+        first_body = orjson.loads(mock_client.post.call_args_list[0].kwargs["content"])
+        assert first_url == "http://localhost:8006/events/bulk"
+        assert [e["event_type"] for e in first_body["events"]] == ["event_0", "event_1"]
+        assert client._event_queue.empty()
+
+    await client.close()
+
+
+def test_track_event_nowait_without_loop(test_config):
+    """Test that events queued from sync code are handed to the telemetry thread."""
+    test_config.test_mode = False
+    client = ObservabilityClient(test_config)
+    runtime = get_runtime()
+
+    assert client.track_event_nowait(event_type="sync_event") is True
+
+    # The callback runs on the background loop; wait for it to be processed
+    runtime.run_coroutine(asyncio.sleep(0)).result(timeout=5)
+    assert client._event_queue.qsize() == 1
+    assert client._flusher_task is not None
+
+    runtime.run_coroutine(client.close()).result(timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_and_reports(test_config):
+    """Test drop_old policy and the dropped-count meta-event on flush."""
+    test_config.test_mode = False
+    test_config.queue_max_size = 2
+    test_config.on_full = "drop_old"
+    client = ObservabilityClient(test_config)
+
+    with patch.object(client, "_http_client", new_callable=AsyncMock) as mock_client:
+        mock_client.post.return_value = MagicMock()
+
+        for i in range(3):
+            assert await client.track_event(event_type=f"event_{i}") == {"status": "queued"}
+        assert client._dropped_events == 1
+
+        await client.flush()
+
+        body = orjson.loads(mock_client.post.call_args.kwargs["content"])
+        assert [e["event_type"] for e in body["events"]] == [
+            "observability_events_dropped",
+            "event_1",
+            "event_2",
+        ]
+        assert body["events"][0]["event_metadata"] == {"_dropped_since_last_flush": 1}
+        assert client._dropped_events == 0
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_send_request_client_error_not_retried(test_config):
+    """Test that 4xx responses are not retried."""
+    test_config.test_mode = False
+    client = ObservabilityClient(test_config)
+
+    with patch.object(client, "_http_client", new_callable=AsyncMock) as mock_client:
+        request = httpx.Request("POST", "http://localhost:8006/test")
+        mock_client.post.return_value = httpx.Response(422, request=request)
+
+        result = await client._send_request("/test", {"data": "test"})
+
+        assert result is None
+        assert mock_client.post.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_exception_stack_trace_formatted_on_flush(test_config):
+    """Test that an exception passed as stack_trace is formatted only when sent."""
+    test_config.test_mode = False
+    client = ObservabilityClient(test_config)
+
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        error = e
+
+    with patch.object(client, "_http_client", new_callable=AsyncMock) as mock_client:
+        mock_client.post.return_value = MagicMock()
+
+        await client.track_service_error("ValueError", "boom", stack_trace=error)
+        assert client._error_queue._queue[0]["error_metadata"]["stack_trace"] is error
+
+        await client.flush()
+        await client.close()
+
+        payload = orjson.loads(mock_client.post.call_args.kwargs["content"])
+        stack_trace = payload["errors"][0]["error_metadata"]["stack_trace"]
+        assert stack_trace.startswith("Traceback")
+        assert "ValueError: boom" in stack_trace
+
+
+@pytest.mark.asyncio
+async def test_send_request_retries_reuse_body(test_config):
+    """Test that every retry sends the same pre-encoded body."""
+    test_config.test_mode = False
+    test_config.max_retries = 2
+    test_config.retry_backoff = 0.1
+    client = ObservabilityClient(test_config)
+
+    with patch.object(client, "_http_client", new_callable=AsyncMock) as mock_client:
+        mock_client.post.side_effect = httpx.ConnectError("Connection failed")
+
+        with patch("observability_client.client.orjson.dumps", wraps=orjson.dumps) as dumps:
+            await client._send_request("/test", {"data": "test"})
+
+        assert dumps.call_count == 1
+        bodies = {call.kwargs["content"] for call in mock_client.post.call_args_list}
+        assert len(bodies) == 1
+
+
+@pytest.mark.asyncio
+async def test_send_request_gzips_large_bodies(test_config):
+    """Test that bodies over gzip_min_size are compressed."""
+    test_config.test_mode = False
+    test_config.gzip_min_size = 1024
+    client = ObservabilityClient(test_config)
+
+    with patch.object(client, "_http_client", new_callable=AsyncMock) as mock_client:
+        mock_client.post.return_value = MagicMock()
+
+        await client._send_request("/test", {"data": "small"})
+        assert "content-encoding" not in mock_client.post.call_args.kwargs["headers"]
+
+        large = {"events": [{"event_type": "test_event"}] * 100}
+        await client._send_request("/test", large)
+        kwargs = mock_client.post.call_args.kwargs
+        assert kwargs["headers"]["content-encoding"] == "gzip"
+        assert orjson.loads(gzip.decompress(kwargs["content"])) == large
+
+
+def test_format_exception_limits_frames():
+    """Test that formatted stack traces keep only the innermost frames."""
+    from observability_client.client import _format_exception
+
+    def recurse(depth):
+        if depth == 0:
+            raise ValueError("deep")
+        recurse(depth - 1)
+
+    try:
+        recurse(30)
+    except ValueError as e:
+        error = e
+
+    limited = _format_exception(error, 5)
+    assert "raise ValueError" in limited
+    assert "recurse(30)" not in limited
+    assert "recurse(30)" in _format_exception(error)
+
+
+def test_flush_at_exit_sends_pending_events(test_config):
+    """Test that the exit hook flushes buffered events without a running loop."""
+    from observability_client import client as client_module
+
+    test_config.test_mode = False
+    client = ObservabilityClient(test_config)
+    client._event_queue.put_nowait(client._build_event("test_event", None, None, None, "test"))
+
+    mock_client = AsyncMock()
+    mock_client.post.return_value = MagicMock()
+    mock_client.get.return_value = MagicMock()
+
+    with patch.object(client_module, "_client", client), \
+            patch("observability_client.client.httpx.AsyncClient", return_value=mock_client):
+        client_module._flush_at_exit()
+
+    url = mock_client.post.call_args.args[0]
+    assert url == "http://localhost:8006/events/bulk"
+    assert client._event_queue.empty()
+
+
+def test_format_exception_reuses_cached_stack():
+    """Test that errors raised from the same frames share one formatted stack."""
+    from observability_client.client import _format_exception
+
+    def fail(message):
+        raise ValueError(message)
+
+    formatted = []
+    with patch("observability_client.client.traceback.format_tb", wraps=traceback.format_tb) as format_tb:
+        for message in ("first", "second"):
+            try:
+                fail(message)
+            except ValueError as e:
+                formatted.append(_format_exception(e))
+
+    assert format_tb.call_count == 1
+    assert formatted[0].endswith("ValueError: first\n")
+    assert formatted[1].endswith("ValueError: second\n")
+
+
+@pytest.mark.asyncio
+async def test_schedule_warmup_creates_global_client():
+    """Test that warm-up creates the global client on the running loop."""
+    from observability_client import client as client_module
+    from observability_client.utils import async_utils
+
+    with patch.object(ObservabilityClient, "check_health", new_callable=AsyncMock) as mock_health:
+        client_module._schedule_warmup(use_runtime=False)
+        await asyncio.gather(*async_utils._background_tasks)
+
+    mock_health.assert_awaited_once()
+    assert client_module._client is not None
+    await client_module._client.close()
+
+
+@pytest.mark.asyncio
+async def test_recovers_after_failed_health_check(test_config):
+    """Test that events are sent again once a failed health check has expired."""
+    from observability_client import client as client_module
+
+    test_config.test_mode = False
+    client = ObservabilityClient(test_config)
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path == "/health":
+            raise httpx.ConnectError("Connection refused", request=request)
+        return httpx.Response(200, json={"status": "success"})
+
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    # The service is down when the client starts
+    assert await client.check_health() is False
+
+    # Within the TTL, requests are skipped
+    await client.track_event(event_type="skipped")
+    await client.flush()
+    assert requests == ["/health"]
+
+    # Once it expires the next flush is attempted and goes through
+    client._health_checked_at -= client_module._HEALTH_CHECK_TTL
+    for i in range(3):
+        await client.track_event(event_type=f"event_{i}")
+    await client.flush()
+
+    assert requests == ["/health", "/events/bulk"]
+    assert client._service_healthy is True
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_single_endpoints(test_config):
+    """Test that payloads are posted one at a time to a service without bulk endpoints."""
+    test_config.test_mode = False
+    client = ObservabilityClient(test_config)
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path.endswith("/bulk"):
+            return httpx.Response(404, json={"detail": "Not Found"})
+        return httpx.Response(200, json={"status": "success"})
+
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    await client.track_event(event_type="first")
+    await client.track_event(event_type="second")
+    await client.track_service_error(error_type="ValueError", error_message="bad")
+    await client.flush()
+
+    assert requests == ["/events/bulk", "/events", "/events", "/errors/services"]
+
+    # Later flushes skip the bulk endpoints
+    requests.clear()
+    await client.track_event(event_type="third")
+    await client.flush()
+
+    assert requests == ["/events"]
+    await client.close()
+
+
+def test_client_created_in_thread_without_loop(test_config):
+    """Test that a client created in a worker thread can run on the telemetry loop."""
+    import threading
+
+    test_config.test_mode = False
+    clients = []
+    thread = threading.Thread(target=lambda: clients.append(ObservabilityClient(test_config)))
+    thread.start()
+    thread.join()
+    client = clients[0]
+    runtime = get_runtime()
+
+    assert client.track_event_nowait(event_type="worker_event") is True
+    runtime.run_coroutine(asyncio.sleep(0)).result(timeout=5)
+    assert client._event_queue.qsize() == 1
+
+    runtime.run_coroutine(client.close()).result(timeout=5)
+
+
+def _service_model_fields(model_name):
+    """Field names of a pydantic model declared in the service's main.py."""
+    main_py = Path(__file__).resolve().parents[3] / "services" / "observability-service" / "main.py"
+    if not main_py.exists():
+        pytest.skip("observability service source not available")
+    for node in ast.parse(main_py.read_text()).body:
+        if isinstance(node, ast.ClassDef) and node.name == model_name:
+            return {
+                statement.target.id
+                for statement in node.body
+                if isinstance(statement, ast.AnnAssign)
+            }
+    raise AssertionError(f"{model_name} not found in {main_py}")
+
+
+def test_payload_keys_match_service_schema(test_config):
+    """Test that every payload key is a field of the service's ingest models.
+
+    The service ignores unknown fields, so a mismatch would silently drop data.
+    """
+    client = ObservabilityClient(test_config)
+    event = client._build_event("clicked", 1, "s1", {"a": 1}, "user_action")
+    error = client._build_error(
+        "ValueError", "boom", "Traceback...", "/items", "GET", 1, "s1", {"a": 1}
+    )
+
+    assert set(event) <= _service_model_fields("EventCreate")
+    assert set(error) <= _service_model_fields("ServiceErrorCreate")
+    assert error["endpoint"] == "/items"
+    assert error["error_metadata"] == {"a": 1, "stack_trace": "Traceback..."}
@@ -1,7 +1,6 @@
 """Tests for configuration module."""
 
 import pytest
-import os
 
 from observability_client.config import (
     ObservabilityConfig,
@@ -70,3 +69,20 @@ def test_global_config():
     reset_config()
     config3 = get_config()
     assert config3.service_url == "http://localhost:8006"
+
+
+def test_config_from_env_overrides(monkeypatch):
+    """Test that from_env reads the environment and applies overrides."""
+    monkeypatch.setenv("OBSERVABILITY_SERVICE_URL", "http://test:8080")
+    monkeypatch.setenv("OBSERVABILITY_DEV_MODE", "true")
+
+    config = ObservabilityConfig.from_env(dev_mode=False, timeout=3.0)
+    assert config.service_url == "http://test:8080"
+    assert config.dev_mode is False
+    assert config.timeout == 3.0
+
+
+def test_config_rejects_unknown_on_full():
+    """Test that an unknown queue overflow policy is rejected."""
+    with pytest.raises(ValueError):
+        ObservabilityConfig(on_full="block")
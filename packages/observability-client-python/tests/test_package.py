@@ -0,0 +1,16 @@
+"""Tests for the package entry point."""
+
+import subprocess
+import sys
+
+
+def test_import_is_lazy():
+    """Test that importing the package does not load the client or httpx."""
+    code = (
+        "import sys, observability_client\n"
+        "assert 'httpx' not in sys.modules\n"
+        "assert 'observability_client.client' not in sys.modules\n"
+        "observability_client.track_event\n"
+        "assert 'observability_client.client' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import patch, AsyncMock
 
-from observability_client.tracking import track_event, track_service_error
+from observability_client.tracking import track_event, track_event_nowait, track_service_error
 
 
 @pytest.mark.asyncio
@@ -82,3 +82,20 @@ async def test_track_service_error():
             session_id="session123",
             metadata={"additional": "info"},
         )
+
+
+def test_track_event_nowait():
+    """Test track_event_nowait queues through the global client without awaiting."""
+    with patch("observability_client.tracking.events.get_client_sync") as mock_get_client:
+        mock_get_client.return_value.track_event_nowait.return_value = True
+
+        result = track_event_nowait(event_type="test_event", user_id=123)
+
+        assert result is True
+        mock_get_client.return_value.track_event_nowait.assert_called_once_with(
+            event_type="test_event",
+            user_id=123,
+            session_id=None,
+            metadata=None,
+            category="user_action",
+        )
@@ -0,0 +1,24 @@
+"""Tests for asyncio helpers."""
+
+import asyncio
+
+import pytest
+
+from observability_client.utils import async_utils
+
+
+@pytest.mark.asyncio
+async def test_spawn_keeps_task_until_done():
+    """Test that spawned tasks are referenced only while running."""
+    event = asyncio.Event()
+
+    async def wait():
+        await event.wait()
+
+    task = async_utils.spawn(wait())
+    assert task in async_utils._background_tasks
+
+    event.set()
+    await task
+    await asyncio.sleep(0)  # let the done callback run
+    assert task not in async_utils._background_tasks
@@ -0,0 +1,97 @@
+"""Tests for request context extraction."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from observability_client.utils.context import (
+    extract_session_id,
+    extract_user_id,
+    get_request_context,
+)
+
+
+def test_starlette_style_request():
+    """Test that the path is read from request.url.path."""
+    request = SimpleNamespace(url=SimpleNamespace(path="/items"), method="GET", cookies={})
+
+    assert get_request_context(request) == {"request_path": "/items", "request_method": "GET"}
+
+
+def test_flask_style_request_with_string_url():
+    """Test that a string request.url falls back to request.path."""
+    request = SimpleNamespace(url="http://localhost/items", path="/items", method="POST", cookies={})
+
+    assert get_request_context(request) == {"request_path": "/items", "request_method": "POST"}
+
+
+def test_request_without_attributes():
+    """Test that missing attributes are skipped rather than raising."""
+    assert get_request_context(object()) == {}
+
+
+def test_session_cookie_names_checked_in_order():
+    """Test that the first non-empty session cookie wins."""
+    cookies = {"session": "second", "session_id": "", "_session": "third"}
+    request = SimpleNamespace(cookies=cookies)
+
+    assert extract_session_id(request) == "second"
+
+
+def test_user_id_from_session_and_cookie():
+    """Test user_id lookup from a dict session and from cookies."""
+    assert extract_user_id(SimpleNamespace(session={"userId": "7"})) == 7
+    assert extract_user_id(SimpleNamespace(cookies={"user_id": "9"})) == 9
+    assert extract_user_id(SimpleNamespace(cookies={"user_id": "x"})) is None
+
+
+def test_starlette_request_read_from_scope():
+    """Test that Starlette requests are read from the ASGI scope."""
+    requests = pytest.importorskip("starlette.requests")
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/items",
+        "query_string": b"",
+        "headers": [(b"cookie", b"sessionid=abc")],
+        "state": {},
+    }
+    request = requests.Request(scope)
+    request.state.user_id = "5"
+
+    assert get_request_context(request) == {
+        "request_path": "/items",
+        "request_method": "GET",
+        "user_id": 5,
+        "session_id": "abc",
+    }
+    assert extract_user_id(request) == 5
+    assert extract_session_id(request) == "abc"
+
+
+def test_context_cached_on_request():
+    """Test that the context is extracted once and can be invalidated."""
+    request = SimpleNamespace(path="/items", method="GET", cookies={})
+
+    context = get_request_context(request)
+    request.path = "/other"
+    assert get_request_context(request) is context
+
+    del request.__observability_ctx__
+    assert get_request_context(request)["request_path"] == "/other"
+
+
+def test_no_session_cookie():
+    """Test that unrelated cookies yield no session ID."""
+    assert extract_session_id(SimpleNamespace(cookies={"theme": "dark"})) is None
+
+
+def test_user_id_from_mapping_like_session():
+    """Test that sessions that aren't dicts but have .get are read too."""
+
+    class SessionStore:
+        def get(self, key, default=None):
+            return {"user_id": 3}.get(key, default)
+
+    assert extract_user_id(SimpleNamespace(session=SessionStore())) == 3
@@ -5,10 +5,13 @@ Use this if tables weren't created automatically on service startup.
 """
 import os
 import sys
-from sqlalchemy import create_engine, inspect
+from datetime import datetime
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
 from models import Base
+from database import sqlalchemy_url, is_partitioned, create_weekly_partitions, upgrade_schema
 # Import all models to ensure they're registered with Base
-from models import UserEvent, UserSession, UIEvent, UIError, ServiceError, RecordedSession
+from models import UserEvent, UserSession, UIEvent, UIError, ServiceError, RecordedSession, UIEventHourly, UIErrorHourly, ServiceErrorHourly
 
 DATABASE_URL = os.getenv(
     "DATABASE_URL",
@@ -18,24 +21,39 @@ DATABASE_URL = os.getenv(
 def create_tables():
     """Create all tables if they don't exist"""
     engine = create_engine(
-        DATABASE_URL,
+        sqlalchemy_url(DATABASE_URL),
         pool_pre_ping=True,
-        connect_args={"connect_timeout": 10}
     )
     
-    # Check existing tables
-    inspector = inspect(engine)
-    existing_tables = inspector.get_table_names()
+    # Create all tables (existing ones are skipped)
+    print("Creating tables...")
+    Base.metadata.create_all(bind=engine)
     
-    print(f"Existing tables: {existing_tables}")
+    # Column and index changes made to the models since the tables were
+    # created; the service also runs this on startup
+    print("Upgrading existing tables...")
+    with engine.begin() as conn:
+        upgrade_schema(conn)
     
-    # Create all tables
-    print("\nCreating tables...")
-    Base.metadata.create_all(bind=engine)
+    # Partitioned event tables need a partition for every row inserted
+    if engine.dialect.name == "postgresql":
+        print("Creating weekly partitions...")
+        with Session(engine) as db:
+            for table in Base.metadata.sorted_tables:
+                if is_partitioned(db, table.name):
+                    create_weekly_partitions(db, table.name, datetime.utcnow())
+            db.commit()
+    
+    # Index-only scans on the covering error indexes need an up to date
+    # visibility map; VACUUM can't run inside a transaction
+    if engine.dialect.name == "postgresql":
+        print("Vacuuming error tables...")
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            for table in ("ui_errors", "service_errors"):
+                conn.execute(text(f"VACUUM ANALYZE {table}"))
     
-    # Verify tables were created
-    inspector = inspect(engine)
-    new_tables = inspector.get_table_names()
+    # Verify tables were created; one catalog query covers every check below
+    new_tables = inspect(engine).get_table_names()
     
     print(f"\nTables after creation: {new_tables}")
     
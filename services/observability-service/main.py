@@ -1,15 +1,24 @@
-from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks
+from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.responses import JSONResponse, PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from pydantic import BaseModel
+from sqlalchemy import func, and_, or_, insert, literal_column, select, text, tuple_, update
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 import os
+import zlib
 import asyncio
+import threading
 from contextlib import asynccontextmanager
-from models import Base, UserEvent, UserSession, UIEvent, UIError, ServiceError, RecordedSession
-from database import get_db, engine
+from cachetools import TTLCache
+from models import Base, UserEvent, UserSession, UIEvent, UIError, ServiceError, RecordedSession, UIEventHourly, UIErrorHourly, ServiceErrorHourly, UTC_NOW, severity_for_status
+from database import (
+    get_db, engine, sync_engine, bulk_insert_rows, SessionLocal, SyncSessionLocal,
+    is_partitioned, create_weekly_partitions, drop_weekly_partitions_before, upgrade_schema
+)
 from otel_setup import setup_opentelemetry, instrument_fastapi, instrument_sqlalchemy
 from opentelemetry import trace
 import logging
@@ -22,76 +31,357 @@ logger = logging.getLogger(__name__)
 RETENTION_DAYS = int(os.getenv("EVENT_RETENTION_DAYS", "90"))  # Default: 90 days
 CLEANUP_INTERVAL_HOURS = int(os.getenv("CLEANUP_INTERVAL_HOURS", "24"))  # Default: daily
 ENABLE_AUTO_CLEANUP = os.getenv("ENABLE_AUTO_CLEANUP", "true").lower() == "true"
+# Coalesce single POST /ui-events requests into batched inserts (responds 202 without the row)
+BATCH_UI_EVENTS = os.getenv("BATCH_UI_EVENTS", "false").lower() == "true"
+BATCH_MAX_ROWS = int(os.getenv("BATCH_MAX_ROWS", "1000"))  # Rows per batched insert
+BATCH_MAX_MS = int(os.getenv("BATCH_MAX_MS", "100"))  # Max wait to fill a batch
+BATCH_QUEUE_SIZE = int(os.getenv("BATCH_QUEUE_SIZE", "10000"))  # Pending rows before inserting directly
+ENABLE_UI_EVENT_ROLLUP = os.getenv("ENABLE_UI_EVENT_ROLLUP", "true").lower() == "true"
+ROLLUP_INTERVAL_MINUTES = int(os.getenv("ROLLUP_INTERVAL_MINUTES", "5"))  # How often complete hours are rolled up
+STATS_CACHE_TTL_SECONDS = int(os.getenv("STATS_CACHE_TTL_SECONDS", "60"))  # How stale /stats, /analytics/summary and /errors/total may be
+MAX_ERROR_PAYLOAD_CHARS = int(os.getenv("MAX_ERROR_PAYLOAD_CHARS", "4096"))  # Longer service error bodies/headers are truncated
+MAX_GZIP_BODY_BYTES = int(os.getenv("MAX_GZIP_BODY_BYTES", str(10 * 1024 * 1024)))  # Larger gzip request bodies get a 413
+MAX_DECOMPRESSED_BODY_BYTES = int(os.getenv("MAX_DECOMPRESSED_BODY_BYTES", str(50 * 1024 * 1024)))  # Bodies that inflate past this get a 413
+
+# Results of /stats, /analytics/summary and /errors/total, keyed by route and query params
+stats_cache = TTLCache(maxsize=128, ttl=STATS_CACHE_TTL_SECONDS)
 
 # Initialize OpenTelemetry
 tracer, meter = setup_opentelemetry("observability-service")
 
-# Background cleanup task
-async def cleanup_old_events():
-    """Periodically clean up events older than retention period"""
+# Event tables partitioned by week on timestamp (see models.py)
+PARTITIONED_TABLES = (UserEvent, UIEvent, UIError, ServiceError)
+
+# Hourly rollup tables: the table each one aggregates, its grouping columns
+# and its count column
+HOURLY_ROLLUPS = {
+    UIEventHourly: (UIEvent, ("page_path", "element_type", "element_name", "interaction_type"), "event_count"),
+    UIErrorHourly: (UIError, ("error_type",), "error_count"),
+    ServiceErrorHourly: (ServiceError, ("error_type", "status_code", "service_name", "severity"), "error_count"),
+}
+
+def create_event_partitions(db: Session):
+    """Create this week's and upcoming weekly partitions of the event tables"""
+    now = datetime.utcnow()
+    for model in PARTITIONED_TABLES:
+        if is_partitioned(db, model.__tablename__):
+            create_weekly_partitions(db, model.__tablename__, now)
+
+async def create_partitions():
+    """Run create_event_partitions in a transaction of its own"""
+    async with SessionLocal() as db:
+        try:
+            await db.run_sync(create_event_partitions)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Partition maintenance error: {e}", exc_info=True)
+
+async def partition_maintenance_task():
+    """Keep weekly partitions created ahead of the events that go into them"""
+    while True:
+        try:
+            await asyncio.sleep(24 * 3600)
+            await create_partitions()
+        except asyncio.CancelledError:
+            break
+
+# Deletes the expired rows of every retained table in one statement (PostgreSQL
+# data-modifying CTEs), so cleanup is a single round trip
+CLEANUP_SQL = text("""
+    WITH user_events_deleted AS (
+        DELETE FROM user_events WHERE timestamp < :c RETURNING 1
+    ), ui_events_deleted AS (
+        DELETE FROM ui_events WHERE timestamp < :c RETURNING 1
+    ), ui_errors_deleted AS (
+        DELETE FROM ui_errors WHERE timestamp < :c RETURNING 1
+    ), service_errors_deleted AS (
+        DELETE FROM service_errors WHERE timestamp < :c RETURNING 1
+    ), recorded_sessions_deleted AS (
+        DELETE FROM recorded_sessions WHERE started_at < :c RETURNING 1
+    ), ui_event_hourly_deleted AS (
+        DELETE FROM ui_event_hourly WHERE hour < :c
+    ), ui_error_hourly_deleted AS (
+        DELETE FROM ui_error_hourly WHERE hour < :c
+    ), service_error_hourly_deleted AS (
+        DELETE FROM service_error_hourly WHERE hour < :c
+    )
+    SELECT
+        (SELECT count(*) FROM user_events_deleted),
+        (SELECT count(*) FROM ui_events_deleted),
+        (SELECT count(*) FROM ui_errors_deleted),
+        (SELECT count(*) FROM service_errors_deleted),
+        (SELECT count(*) FROM recorded_sessions_deleted)
+""")
+
+
+def delete_events_before(db: Session, cutoff_date: datetime) -> tuple:
+    """Delete user events, UI events, UI errors, service errors and recorded
+    sessions older than the cutoff, along with the expired hourly rollups.
+    The caller commits.
+    
+    On PostgreSQL, weekly partitions that lie entirely before the cutoff are
+    dropped rather than deleted from, and their rows are counted from the
+    planner's estimates.
+
+    Returns the number of deleted rows of each, in that order.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        dropped = [
+            drop_weekly_partitions_before(db, model.__tablename__, cutoff_date)
+            for model in PARTITIONED_TABLES
+        ] + [0]
+        deleted = db.execute(CLEANUP_SQL, {"c": cutoff_date}).one()
+        return tuple(d + n for d, n in zip(dropped, deleted))
+
+    # Other databases don't support DELETE in a CTE
+    for hourly_model in HOURLY_ROLLUPS:
+        db.query(hourly_model).filter(hourly_model.hour < cutoff_date).delete()
+    return (
+        db.query(UserEvent).filter(UserEvent.timestamp < cutoff_date).delete(),
+        db.query(UIEvent).filter(UIEvent.timestamp < cutoff_date).delete(),
+        db.query(UIError).filter(UIError.timestamp < cutoff_date).delete(),
+        db.query(ServiceError).filter(ServiceError.timestamp < cutoff_date).delete(),
+        db.query(RecordedSession).filter(RecordedSession.started_at < cutoff_date).delete(),
+    )
+
+async def count_rows_before(db: AsyncSession, column, cutoff_date: datetime, exact: bool = True) -> int:
+    """Count the rows of column's table with column older than the cutoff.
+    
+    A plain COUNT(*), so PostgreSQL can answer it from the column's index. With
+    exact=False on PostgreSQL, the planner's row estimate is returned instead,
+    without scanning anything.
+    """
+    if exact or engine.dialect.name != "postgresql":
+        return (await db.execute(
+            select(func.count()).select_from(column.table).where(column < cutoff_date)
+        )).scalar()
+    
+    plan = (await db.execute(
+        text(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {column.table.name} WHERE {column.name} < :c"),
+        {"c": cutoff_date}
+    )).scalar()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+# Background cleanup, on its own thread so the long DELETEs never block the event loop
+def run_cleanup():
+    """Delete events older than the retention period in one transaction"""
+    cutoff_date = datetime.utcnow() - timedelta(days=RETENTION_DAYS)
+    
+    db = SyncSessionLocal()
+    try:
+        (
+            deleted_user_events,
+            deleted_ui_events,
+            deleted_ui_errors,
+            deleted_service_errors,
+            deleted_recorded_sessions,
+        ) = delete_events_before(db, cutoff_date)
+        db.commit()
+        
+        total_deleted = deleted_user_events + deleted_ui_events + deleted_ui_errors + deleted_service_errors + deleted_recorded_sessions
+        if total_deleted > 0:
+            logger.info(f"Auto-cleanup: Deleted {deleted_user_events} user events, {deleted_ui_events} UI events, {deleted_ui_errors} UI errors, {deleted_service_errors} service errors, and {deleted_recorded_sessions} recorded sessions older than {RETENTION_DAYS} days")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Auto-cleanup error: {e}", exc_info=True)
+    finally:
+        db.close()
+
+def cleanup_scheduler(stop: threading.Event):
+    """Run run_cleanup every CLEANUP_INTERVAL_HOURS until stop is set"""
     # Wait before first cleanup to let service start
-    await asyncio.sleep(60)
+    if stop.wait(60):
+        return
     
     while True:
         try:
-            cutoff_date = datetime.utcnow() - timedelta(days=RETENTION_DAYS)
-            
-            db = next(get_db())
-            try:
-                deleted_user_events = db.query(UserEvent).filter(
-                    UserEvent.timestamp < cutoff_date
-                ).delete()
-                deleted_ui_events = db.query(UIEvent).filter(
-                    UIEvent.timestamp < cutoff_date
-                ).delete()
-                deleted_ui_errors = db.query(UIError).filter(
-                    UIError.timestamp < cutoff_date
-                ).delete()
-                deleted_service_errors = db.query(ServiceError).filter(
-                    ServiceError.timestamp < cutoff_date
-                ).delete()
-                deleted_recorded_sessions = db.query(RecordedSession).filter(
-                    RecordedSession.started_at < cutoff_date
-                ).delete()
-                db.commit()
-                
-                total_deleted = deleted_user_events + deleted_ui_events + deleted_ui_errors + deleted_service_errors + deleted_recorded_sessions
-                if total_deleted > 0:
-                    logger.info(f"Auto-cleanup: Deleted {deleted_user_events} user events, {deleted_ui_events} UI events, {deleted_ui_errors} UI errors, {deleted_service_errors} service errors, and {deleted_recorded_sessions} recorded sessions older than {RETENTION_DAYS} days")
-            except Exception as e:
-                db.rollback()
-                logger.error(f"Auto-cleanup error: {e}", exc_info=True)
-            finally:
-                db.close()
-            
-            # Wait for next cleanup cycle
-            await asyncio.sleep(CLEANUP_INTERVAL_HOURS * 3600)  # Convert hours to seconds
+            run_cleanup()
+            interval = CLEANUP_INTERVAL_HOURS * 3600  # Convert hours to seconds
+        except Exception as e:
+            logger.warning(f"Cleanup task error: {e}, retrying in 1 hour", exc_info=True)
+            interval = 3600  # Wait 1 hour before retrying on error
+        if stop.wait(interval):
+            return
+
+def floor_hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+def ceil_hour(value: datetime) -> datetime:
+    hour = floor_hour(value)
+    return hour if hour == value else hour + timedelta(hours=1)
+
+def rollup_hours(db: Session, hourly_model) -> Optional[datetime]:
+    """Aggregate the rows of the complete hours not yet in hourly_model.
+    
+    Hours are only rolled up a few minutes after they end, so rows still
+    being inserted (e.g. by the batch writer) are not missed. PostgreSQL only.
+    Returns the end of the rolled-up range, or None if there was nothing new.
+    """
+    model, columns, count_column = HOURLY_ROLLUPS[hourly_model]
+    
+    # Serialize rollups across workers; released at commit
+    db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:t))"), {"t": hourly_model.__tablename__})
+    
+    last_hour = db.query(func.max(hourly_model.hour)).scalar()
+    if last_hour is not None:
+        start = last_hour + timedelta(hours=1)
+    else:
+        first_row = db.query(func.min(model.timestamp)).scalar()
+        if first_row is None:
+            return None
+        start = floor_hour(first_row)
+    end = floor_hour(datetime.utcnow() - timedelta(minutes=5))
+    if start >= end:
+        return None
+    
+    # Inlined rather than bound, so SELECT and GROUP BY are the same expression
+    hour = func.date_trunc(literal_column("'hour'"), model.timestamp)
+    groups = (hour, *(getattr(model, column) for column in columns))
+    db.execute(insert(hourly_model).from_select(
+        ["hour", *columns, count_column],
+        select(*groups, func.count()).where(
+            model.timestamp >= start,
+            model.timestamp < end
+        ).group_by(*groups)
+    ))
+    return end
+
+def rollup_all(db: Session):
+    """Roll up new complete hours into every hourly rollup table"""
+    for hourly_model in HOURLY_ROLLUPS:
+        rollup_hours(db, hourly_model)
+
+async def run_ui_event_rollup():
+    """Roll up new complete hours of UI events and errors in one transaction"""
+    async with SessionLocal() as db:
+        try:
+            await db.run_sync(rollup_all)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Hourly rollup error: {e}", exc_info=True)
+
+async def rollup_ui_events_task():
+    """Periodically roll up complete hours of UI events and errors"""
+    while True:
+        try:
+            await run_ui_event_rollup()
+            await asyncio.sleep(ROLLUP_INTERVAL_MINUTES * 60)
         except asyncio.CancelledError:
             break
+
+
+# Pending UI event rows, created in lifespan when BATCH_UI_EVENTS is set
+ui_event_queue: Optional[asyncio.Queue] = None
+
+async def write_ui_event_batch(rows: List[Dict[str, Any]]):
+    """Insert a batch of queued UI event rows in one transaction"""
+    async with SessionLocal() as db:
+        try:
+            await bulk_insert_rows(db, UIEvent, rows)
+            await db.commit()
         except Exception as e:
-            logger.warning(f"Cleanup task error: {e}, retrying in 1 hour", exc_info=True)
-            await asyncio.sleep(3600)  # Wait 1 hour before retrying on error
+            await db.rollback()
+            logger.error(f"Batch insert of {len(rows)} UI events failed: {e}", exc_info=True)
+
+def drain_queue(queue: asyncio.Queue, limit: int) -> List[Dict[str, Any]]:
+    """Take up to limit rows that are already queued, without waiting"""
+    rows = []
+    while len(rows) < limit and not queue.empty():
+        rows.append(queue.get_nowait())
+    return rows
+
+async def ui_event_batch_writer(queue: asyncio.Queue):
+    """Collect queued UI events for up to BATCH_MAX_MS and insert them together"""
+    loop = asyncio.get_running_loop()
+    batch = []
+    try:
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + BATCH_MAX_MS / 1000
+            while len(batch) < BATCH_MAX_ROWS:
+                batch.extend(drain_queue(queue, BATCH_MAX_ROWS - len(batch)))
+                timeout = deadline - loop.time()
+                if len(batch) >= BATCH_MAX_ROWS or timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            rows, batch = batch, []
+            await write_ui_event_batch(rows)
+    except asyncio.CancelledError:
+        # Shutting down: don't lose a batch that was still being collected
+        if batch:
+            await write_ui_event_batch(batch)
+        raise
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Create tables and start cleanup task
-    Base.metadata.create_all(bind=engine)
+    # Startup: Create tables and upgrade the ones an earlier version created
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(upgrade_schema)
+    
+    # Create the weekly partitions before the first insert, then keep ahead
+    partition_task = None
+    if engine.dialect.name == "postgresql":
+        await create_partitions()
+        partition_task = asyncio.create_task(partition_maintenance_task())
     
-    # Start background cleanup task
-    cleanup_task = None
+    # Start background cleanup thread
+    cleanup_stop = None
     if ENABLE_AUTO_CLEANUP:
-        cleanup_task = asyncio.create_task(cleanup_old_events())
+        cleanup_stop = threading.Event()
+        threading.Thread(
+            target=cleanup_scheduler, args=(cleanup_stop,), name="event-cleanup", daemon=True
+        ).start()
         logger.info(f"Started auto-cleanup task (retention: {RETENTION_DAYS} days, interval: {CLEANUP_INTERVAL_HOURS} hours)")
     
+    # Start the hourly rollup task (date_trunc is PostgreSQL only)
+    rollup_task = None
+    if ENABLE_UI_EVENT_ROLLUP and engine.dialect.name == "postgresql":
+        rollup_task = asyncio.create_task(rollup_ui_events_task())
+        logger.info(f"Started hourly rollup task (interval: {ROLLUP_INTERVAL_MINUTES} minutes)")
+    
+    # Start the UI event batch writer
+    global ui_event_queue
+    batch_task = None
+    if BATCH_UI_EVENTS:
+        ui_event_queue = asyncio.Queue(maxsize=BATCH_QUEUE_SIZE)
+        batch_task = asyncio.create_task(ui_event_batch_writer(ui_event_queue))
+        logger.info(f"Started UI event batch writer (max rows: {BATCH_MAX_ROWS}, max wait: {BATCH_MAX_MS} ms)")
+    
     yield
     
-    # Shutdown: Cancel cleanup task
-    if cleanup_task:
-        cleanup_task.cancel()
+    # Shutdown: Stop the batch writer and insert what is still queued
+    if batch_task:
+        batch_task.cancel()
         try:
-            await cleanup_task
+            await batch_task
         except asyncio.CancelledError:
             pass
+        queue, ui_event_queue = ui_event_queue, None
+        remaining = drain_queue(queue, queue.qsize())
+        if remaining:
+            await write_ui_event_batch(remaining)
+    
+    # Shutdown: Stop the cleanup thread (a cleanup in progress is left to finish)
+    if cleanup_stop:
+        cleanup_stop.set()
+    
+    # Shutdown: Cancel rollup and partition tasks
+    for task in (rollup_task, partition_task):
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    
+    await engine.dispose()
 
 app = FastAPI(
     title="Observability Service",
@@ -114,15 +404,32 @@ app = FastAPI(
         {"name": "Analytics", "description": "Analytics and statistics"},
         {"name": "Health", "description": "Health check endpoints"}
     ],
+    # orjson encodes the (often large) list and analytics responses much faster
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Instrument FastAPI and SQLAlchemy with OpenTelemetry
 instrument_fastapi(app, "observability-service")
-instrument_sqlalchemy(engine)
+instrument_sqlalchemy(engine.sync_engine, sync_engine)
+
+class BrowserCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that skips requests without an ``Origin`` header.
+
+    Those don't come from a browser (the SDKs and backend services posting
+    events, errors and batches), so there's no CORS header to add; they go
+    straight to the app instead of through the response wrapper.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not any(name == b"origin" for name, _ in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 
 app.add_middleware(
-    CORSMiddleware,
+    BrowserCORSMiddleware,
     allow_origins=[
         "http://localhost:3000",
         "http://localhost:3001",
@@ -134,11 +441,94 @@ app.add_middleware(
         "http://127.0.0.1:5173",
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists: what the dashboard and browser SDK send (traceparent and
+    # tracestate come from the frontend's OpenTelemetry fetch instrumentation)
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Content-Type", "traceparent", "tracestate"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+
+class GzipRequestMiddleware:
+    """Decompress request bodies sent with ``Content-Encoding: gzip``.
+
+    The Python client gzips large batch payloads; every other request is
+    passed through untouched. Bodies over MAX_GZIP_BODY_BYTES, or that
+    decompress to more than MAX_DECOMPRESSED_BODY_BYTES, are rejected with
+    413 without being inflated further.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = scope["headers"]
+        if not any(name == b"content-encoding" and value.lower() == b"gzip" for name, value in headers):
+            await self.app(scope, receive, send)
+            return
+
+        chunks = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_GZIP_BODY_BYTES:
+                response = PlainTextResponse("Request body too large", status_code=413)
+                await response(scope, receive, send)
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        # wbits=31 reads the gzip format; one byte past the limit tells a body
+        # that fits exactly from one that doesn't
+        decompressor = zlib.decompressobj(wbits=31)
+        try:
+            body = decompressor.decompress(b"".join(chunks), MAX_DECOMPRESSED_BODY_BYTES + 1)
+        except zlib.error:
+            body = None
+        if body is not None and len(body) > MAX_DECOMPRESSED_BODY_BYTES:
+            response = PlainTextResponse("Decompressed request body too large", status_code=413)
+            await response(scope, receive, send)
+            return
+        if body is None or not decompressor.eof:
+            response = PlainTextResponse("Invalid gzip request body", status_code=400)
+            await response(scope, receive, send)
+            return
+
+        scope = dict(scope)
+        scope["headers"] = [
+            (name, value) for name, value in headers
+            if name not in (b"content-encoding", b"content-length")
+        ] + [(b"content-length", str(len(body)).encode())]
+
+        body_sent = False
+
+        async def receive_decompressed():
+            nonlocal body_sent
+            if body_sent:
+                # Body already delivered; later calls wait for disconnect
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(scope, receive_decompressed, send)
+
+
+app.add_middleware(GzipRequestMiddleware)
+
+# Ingest models are validated on every POST. Unknown fields (e.g. from newer
+# clients) are dropped rather than rejected or stored on the model.
+INGEST_MODEL_CONFIG = ConfigDict(extra="ignore", validate_assignment=False)
+
 class EventCreate(BaseModel):
+    model_config = INGEST_MODEL_CONFIG
+    
     user_id: Optional[int] = None
     session_id: Optional[str] = None
     event_type: str
@@ -156,13 +546,12 @@ class EventResponse(BaseModel):
     timestamp: datetime
     event_metadata: Optional[Dict[str, Any]]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 @app.post("/events", response_model=EventResponse, tags=["Events"], summary="Create event")
 async def create_event(
     event: EventCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a user behavior event"""
     logger.info(f"Creating event: {event.event_type} for user {event.user_id}")
@@ -179,21 +568,63 @@ async def create_event(
         timestamp=datetime.utcnow()
     )
     db.add(db_event)
-    db.commit()
-    db.refresh(db_event)
+    await db.commit()
     return db_event
 
+class BulkEventsCreate(BaseModel):
+    events: List[EventCreate]
+
+@app.post("/events/bulk", tags=["Events"], summary="Create events in bulk")
+async def create_events_bulk(
+    batch: BulkEventsCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """Create a batch of user behavior events in one insert (used by the Python client)"""
+    now = datetime.utcnow()
+    rows = [{**event.model_dump(), "timestamp": now} for event in batch.events]
+    inserted = await bulk_insert_rows(db, UserEvent, rows)
+    await db.commit()
+    return {"inserted": inserted}
+
+async def list_page(db: AsyncSession, query, model, limit: int, cursor: Optional[str], response: Response, timestamp=None):
+    """Newest rows of the query (a select() of model) first, starting after cursor if given.
+    
+    Pages are seeked on (timestamp, id), which is an index range scan however
+    far back the page is. timestamp defaults to model.timestamp. When the
+    page is full, the cursor of the next one ("<timestamp>,<id>" of its last
+    row) is sent in the X-Next-Cursor header.
+    """
+    if timestamp is None:
+        timestamp = model.timestamp
+    if cursor:
+        try:
+            before_ts, before_id = cursor.rsplit(",", 1)
+            before = (datetime.fromisoformat(before_ts), int(before_id))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(tuple_(timestamp, model.id) < before)
+    
+    rows = (await db.execute(
+        query.order_by(timestamp.desc(), model.id.desc()).limit(limit)
+    )).scalars().all()
+    if rows and len(rows) == limit:
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = f"{getattr(last, timestamp.key).isoformat()},{last.id}"
+    return rows
+
 @app.get("/events", response_model=List[EventResponse], tags=["Events"], summary="List events")
 async def get_events(
+    response: Response,
     user_id: Optional[int] = None,
     event_type: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,  # X-Next-Cursor of the previous page
+    db: AsyncSession = Depends(get_db)
 ):
-    """Query user events"""
-    query = db.query(UserEvent)
+    """Query user events (newest first, paged with cursor)"""
+    query = select(UserEvent)
     
     if user_id:
         query = query.filter(UserEvent.user_id == user_id)
@@ -204,52 +635,62 @@ async def get_events(
     if end_date:
         query = query.filter(UserEvent.timestamp <= end_date)
     
-    events = query.order_by(UserEvent.timestamp.desc()).limit(limit).all()
+    events = await list_page(db, query, UserEvent, limit, cursor, response)
     return events
 
 @app.get("/analytics/summary", tags=["Analytics"], summary="Get analytics summary")
 async def get_analytics_summary(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get analytics summary"""
+    """Get analytics summary
+    
+    Results are cached for STATS_CACHE_TTL_SECONDS. The dates are truncated
+    to the minute, so dashboards polling a moving window share cache entries.
+    """
     if not start_date:
         start_date = datetime.utcnow() - timedelta(days=7)
     if not end_date:
         end_date = datetime.utcnow()
+    start_date = start_date.replace(second=0, microsecond=0)
+    end_date = end_date.replace(second=0, microsecond=0)
     
-    query = db.query(UserEvent).filter(
-        UserEvent.timestamp >= start_date,
-        UserEvent.timestamp <= end_date
-    )
+    cache_key = ("/analytics/summary", start_date, end_date)
+    cached = stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
     
-    total_events = query.count()
-    unique_users = query.distinct(UserEvent.user_id).count()
+    # Plain select()s: only aggregates are read, no ORM entities
+    in_window = (UserEvent.timestamp >= start_date, UserEvent.timestamp <= end_date)
+    
+    total_events, unique_users = (await db.execute(
+        select(func.count(), func.count(func.distinct(UserEvent.user_id))).where(*in_window)
+    )).one()
     
     # Event types breakdown
-    from sqlalchemy import func
-    event_types = db.query(
-        UserEvent.event_type,
-        func.count(UserEvent.id).label('count')
-    ).filter(
-        UserEvent.timestamp >= start_date,
-        UserEvent.timestamp <= end_date
-    ).group_by(UserEvent.event_type).all()
+    event_types = (await db.execute(
+        select(UserEvent.event_type, func.count().label('count'))
+        .where(*in_window)
+        .group_by(UserEvent.event_type)
+    )).all()
     
-    return {
+    summary = {
         "total_events": total_events,
         "unique_users": unique_users,
         "event_types": {et: count for et, count in event_types},
         "start_date": start_date,
         "end_date": end_date
     }
+    stats_cache[cache_key] = summary
+    return summary
 
 @app.post("/cleanup", tags=["Events"], summary="Cleanup old events")
 async def cleanup_events(
     days: Optional[int] = None,
     dry_run: bool = False,
-    db: Session = Depends(get_db)
+    exact: bool = True,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Manually trigger cleanup of old events.
@@ -257,22 +698,18 @@ async def cleanup_events(
     Args:
         days: Number of days to retain (defaults to RETENTION_DAYS env var)
         dry_run: If True, only count events to be deleted without deleting
+        exact: With dry_run, if False report the query planner's row estimates
+            instead of counting (PostgreSQL only; fast on large tables)
     """
     retention_days = days or RETENTION_DAYS
     cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
     
-    user_events_query = db.query(UserEvent).filter(UserEvent.timestamp < cutoff_date)
-    ui_events_query = db.query(UIEvent).filter(UIEvent.timestamp < cutoff_date)
-    ui_errors_query = db.query(UIError).filter(UIError.timestamp < cutoff_date)
-    service_errors_query = db.query(ServiceError).filter(ServiceError.timestamp < cutoff_date)
-    recorded_sessions_query = db.query(RecordedSession).filter(RecordedSession.started_at < cutoff_date)
-    user_events_count = user_events_query.count()
-    ui_events_count = ui_events_query.count()
-    ui_errors_count = ui_errors_query.count()
-    service_errors_count = service_errors_query.count()
-    recorded_sessions_count = recorded_sessions_query.count()
-    
     if dry_run:
+        user_events_count = await count_rows_before(db, UserEvent.timestamp, cutoff_date, exact)
+        ui_events_count = await count_rows_before(db, UIEvent.timestamp, cutoff_date, exact)
+        ui_errors_count = await count_rows_before(db, UIError.timestamp, cutoff_date, exact)
+        service_errors_count = await count_rows_before(db, ServiceError.timestamp, cutoff_date, exact)
+        recorded_sessions_count = await count_rows_before(db, RecordedSession.started_at, cutoff_date, exact)
         return {
             "status": "dry_run",
             "user_events_to_delete": user_events_count,
@@ -281,16 +718,19 @@ async def cleanup_events(
             "service_errors_to_delete": service_errors_count,
             "recorded_sessions_to_delete": recorded_sessions_count,
             "total_events_to_delete": user_events_count + ui_events_count + ui_errors_count + service_errors_count + recorded_sessions_count,
+            "exact": exact or engine.dialect.name != "postgresql",
             "cutoff_date": cutoff_date.isoformat(),
             "retention_days": retention_days
         }
     
-    deleted_user_events = user_events_query.delete()
-    deleted_ui_events = ui_events_query.delete()
-    deleted_ui_errors = ui_errors_query.delete()
-    deleted_service_errors = service_errors_query.delete()
-    deleted_recorded_sessions = recorded_sessions_query.delete()
-    db.commit()
+    (
+        deleted_user_events,
+        deleted_ui_events,
+        deleted_ui_errors,
+        deleted_service_errors,
+        deleted_recorded_sessions,
+    ) = await db.run_sync(delete_events_before, cutoff_date)
+    await db.commit()
     
     return {
         "status": "success",
@@ -305,52 +745,46 @@ async def cleanup_events(
     }
 
 @app.get("/stats", tags=["Analytics"], summary="Get statistics")
-async def get_stats(db: Session = Depends(get_db)):
-    """Get database statistics"""
-    total_events = db.query(UserEvent).count()
-    total_ui_events = db.query(UIEvent).count()
-    total_ui_errors = db.query(UIError).count()
-    total_service_errors = db.query(ServiceError).count()
-    total_sessions = db.query(UserSession).count()
-    total_recorded_sessions = db.query(RecordedSession).count()
-    
-    # Oldest and newest events
-    oldest_event = db.query(func.min(UserEvent.timestamp)).scalar()
-    newest_event = db.query(func.max(UserEvent.timestamp)).scalar()
-    oldest_ui_event = db.query(func.min(UIEvent.timestamp)).scalar()
-    newest_ui_event = db.query(func.max(UIEvent.timestamp)).scalar()
-    oldest_ui_error = db.query(func.min(UIError.timestamp)).scalar()
-    newest_ui_error = db.query(func.max(UIError.timestamp)).scalar()
-    oldest_service_error = db.query(func.min(ServiceError.timestamp)).scalar()
-    newest_service_error = db.query(func.max(ServiceError.timestamp)).scalar()
+async def get_stats(db: AsyncSession = Depends(get_db)):
+    """Get database statistics (cached for STATS_CACHE_TTL_SECONDS)"""
+    cached = stats_cache.get(("/stats",))
+    if cached is not None:
+        return cached
     
-    # Events by category
-    from sqlalchemy import func
-    category_counts = db.query(
-        UserEvent.event_category,
-        func.count(UserEvent.id).label('count')
-    ).group_by(UserEvent.event_category).all()
-    
-    # Events older than retention period
     cutoff_date = datetime.utcnow() - timedelta(days=RETENTION_DAYS)
-    old_events_count = db.query(UserEvent).filter(
-        UserEvent.timestamp < cutoff_date
-    ).count()
-    old_ui_events_count = db.query(UIEvent).filter(
-        UIEvent.timestamp < cutoff_date
-    ).count()
-    old_ui_errors_count = db.query(UIError).filter(
-        UIError.timestamp < cutoff_date
-    ).count()
-    old_service_errors_count = db.query(ServiceError).filter(
-        ServiceError.timestamp < cutoff_date
-    ).count()
+
+    async def table_stats(model):
+        # Count, oldest, newest and expired count of a table in a single scan
+        return (await db.execute(select(
+            func.count(),
+            func.min(model.timestamp),
+            func.max(model.timestamp),
+            func.count().filter(model.timestamp < cutoff_date)
+        ))).one()
+
+    total_events, oldest_event, newest_event, old_events_count = await table_stats(UserEvent)
+    total_ui_events, oldest_ui_event, newest_ui_event, old_ui_events_count = await table_stats(UIEvent)
+    total_ui_errors, oldest_ui_error, newest_ui_error, old_ui_errors_count = await table_stats(UIError)
+    (
+        total_service_errors,
+        oldest_service_error,
+        newest_service_error,
+        old_service_errors_count,
+    ) = await table_stats(ServiceError)
+    total_sessions = (await db.execute(select(func.count()).select_from(UserSession))).scalar()
+    total_recorded_sessions = (await db.execute(select(func.count()).select_from(RecordedSession))).scalar()
+    
+    # Events by category
+    category_counts = (await db.execute(
+        select(UserEvent.event_category, func.count().label('count'))
+        .group_by(UserEvent.event_category)
+    )).all()
     
     # Estimate database size (rough calculation)
     # Average event size ~500 bytes, this is approximate
     estimated_size_mb = ((total_events + total_ui_events + total_ui_errors + total_service_errors) * 500) / (1024 * 1024)
     
-    return {
+    stats = {
         "total_events": total_events,
         "total_ui_events": total_ui_events,
         "total_ui_errors": total_ui_errors,
@@ -376,9 +810,13 @@ async def get_stats(db: Session = Depends(get_db)):
         "auto_cleanup_enabled": ENABLE_AUTO_CLEANUP,
         "cleanup_interval_hours": CLEANUP_INTERVAL_HOURS
     }
+    stats_cache[("/stats",)] = stats
+    return stats
 
 # UI Events endpoints
 class UIEventCreate(BaseModel):
+    model_config = INGEST_MODEL_CONFIG
+    
     user_id: Optional[int] = None
     session_id: Optional[str] = None
     interaction_type: str  # click, change, focus, blur, submit
@@ -414,15 +852,25 @@ class UIEventResponse(BaseModel):
     device_type: Optional[str]
     timestamp: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 @app.post("/ui-events", response_model=UIEventResponse, tags=["UI Events"], summary="Create UI event")
 async def create_ui_event(
     event: UIEventCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Create a UI interaction event (optimized for UI analytics)"""
+    """Create a UI interaction event (optimized for UI analytics)
+
+    With BATCH_UI_EVENTS enabled the event is queued for the batch writer and
+    the response is 202 {"status": "accepted"} instead of the stored row.
+    """
+    if ui_event_queue is not None:
+        try:
+            ui_event_queue.put_nowait({**event.model_dump(), "timestamp": datetime.utcnow()})
+            return JSONResponse(status_code=202, content={"status": "accepted"})
+        except asyncio.QueueFull:
+            pass  # Writer is behind; insert this one directly
+    
     db_event = UIEvent(
         user_id=event.user_id,
         session_id=event.session_id,
@@ -443,12 +891,27 @@ async def create_ui_event(
         timestamp=datetime.utcnow()
     )
     db.add(db_event)
-    db.commit()
-    db.refresh(db_event)
+    await db.commit()
     return db_event
 
+class BulkUIEventsCreate(BaseModel):
+    events: List[UIEventCreate]
+
+@app.post("/ui-events/bulk", tags=["UI Events"], summary="Create UI events in bulk")
+async def create_ui_events_bulk(
+    batch: BulkUIEventsCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """Create a batch of UI interaction events in one insert"""
+    now = datetime.utcnow()
+    rows = [{**event.model_dump(), "timestamp": now} for event in batch.events]
+    inserted = await bulk_insert_rows(db, UIEvent, rows)
+    await db.commit()
+    return {"inserted": inserted}
+
 @app.get("/ui-events", response_model=List[UIEventResponse], tags=["UI Events"], summary="List UI events")
 async def get_ui_events(
+    response: Response,
     user_id: Optional[int] = None,
     session_id: Optional[str] = None,
     interaction_type: Optional[str] = None,
@@ -458,10 +921,11 @@ async def get_ui_events(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,  # X-Next-Cursor of the previous page
+    db: AsyncSession = Depends(get_db)
 ):
-    """Query UI events with optimized filters"""
-    query = db.query(UIEvent)
+    """Query UI events with optimized filters (newest first, paged with cursor)"""
+    query = select(UIEvent)
     
     if user_id:
         query = query.filter(UIEvent.user_id == user_id)
@@ -480,95 +944,167 @@ async def get_ui_events(
     if end_date:
         query = query.filter(UIEvent.timestamp <= end_date)
     
-    events = query.order_by(UIEvent.timestamp.desc()).limit(limit).all()
+    events = await list_page(db, query, UIEvent, limit, cursor, response)
     return events
 
+async def rollup_range(db: AsyncSession, hourly_model, start_date: datetime, end_date: datetime):
+    """Complete hours of the window already rolled up into hourly_model.
+    
+    Returns (rollup_start, rollup_end), the hours [rollup_start, rollup_end),
+    or None if the rollup covers none of the window.
+    """
+    last_hour = (await db.execute(select(func.max(hourly_model.hour)))).scalar()
+    if last_hour is None:
+        return None
+    rollup_start = ceil_hour(start_date)
+    rollup_end = min(floor_hour(end_date), last_hour + timedelta(hours=1))
+    if rollup_start >= rollup_end:
+        return None
+    return rollup_start, rollup_end
+
+async def ui_event_breakdowns(db: AsyncSession, model, count, window, page_path: Optional[str] = None):
+    """Count UI events (or UIEventHourly rollups) in window by interaction type,
+    clicked button, page and element type.
+    
+    Only events on page_path, if given, are counted, except in the by-page
+    breakdown. count is the aggregate to use, e.g. func.count().
+    
+    On PostgreSQL all four breakdowns come from a single scan with GROUPING
+    SETS; other databases run one GROUP BY query each.
+    
+    Returns four lists of (value, count) rows, in that order.
+    """
+    on_page = [model.page_path == page_path] if page_path else []
+    clicked = [model.element_type == 'button', model.interaction_type == 'click']
+    columns = (model.interaction_type, model.element_name, model.page_path, model.element_type)
+    
+    if engine.dialect.name != "postgresql":
+        async def count_by(column, *conditions):
+            return (await db.execute(
+                select(column, count).where(window, *conditions).group_by(column)
+            )).all()
+        return (
+            await count_by(model.interaction_type, *on_page),
+            await count_by(model.element_name, *clicked, *on_page),
+            await count_by(model.page_path),
+            await count_by(model.element_type, *on_page),
+        )
+    
+    # GROUPING() is a bitmask of the columns a row is not grouped by
+    # (first column highest), so each grouping set has its own value. The
+    # page filter applies per aggregate rather than in WHERE, since the
+    # by-page counts cover every page.
+    on_page_count = count.filter(*on_page) if page_path else count
+    rows = (await db.execute(select(
+        func.grouping(*columns),
+        *columns,
+        count,
+        on_page_count,
+        count.filter(and_(*clicked, *on_page))
+    ).where(window).group_by(func.grouping_sets(*columns)))).all()
+    
+    interaction_types, buttons, pages, element_types = [], [], [], []
+    for grouping, interaction_type, element_name, page, element_type, total, on_page_total, clicks in rows:
+        if grouping == 0b0111:
+            interaction_types.append((interaction_type, on_page_total))
+        elif grouping == 0b1011:
+            buttons.append((element_name, clicks))
+        elif grouping == 0b1101:
+            pages.append((page, total))
+        else:
+            element_types.append((element_type, on_page_total))
+    return interaction_types, buttons, pages, element_types
+
 @app.get("/ui-events/analytics", tags=["Analytics"], summary="Get UI analytics")
 async def get_ui_analytics(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     page_path: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get UI event analytics with optimized queries"""
+    """Get UI event analytics with optimized queries
+    
+    Counts of the complete hours already in ui_event_hourly are read from the
+    rollup; only the rest of the window is aggregated from raw events. Unique
+    users and sessions can't be summed across hours and always come from raw
+    events.
+    """
     if not start_date:
         start_date = datetime.utcnow() - timedelta(days=7)
     if not end_date:
         end_date = datetime.utcnow()
     
-    query = db.query(UIEvent).filter(
+    query = select(
+        func.count(func.distinct(UIEvent.user_id)),
+        func.count(func.distinct(UIEvent.session_id))
+    ).where(
         UIEvent.timestamp >= start_date,
         UIEvent.timestamp <= end_date
     )
     
     if page_path:
-        query = query.filter(UIEvent.page_path == page_path)
+        query = query.where(UIEvent.page_path == page_path)
     
-    total_events = query.count()
-    unique_users = query.distinct(UIEvent.user_id).count()
-    unique_sessions = query.distinct(UIEvent.session_id).count()
+    unique_users, unique_sessions = (await db.execute(query)).one()
     
-    # Interactions by type
-    interaction_types = db.query(
-        UIEvent.interaction_type,
-        func.count(UIEvent.id).label('count')
-    ).filter(
-        UIEvent.timestamp >= start_date,
-        UIEvent.timestamp <= end_date
-    )
-    if page_path:
-        interaction_types = interaction_types.filter(UIEvent.page_path == page_path)
-    interaction_types = interaction_types.group_by(UIEvent.interaction_type).all()
-    
-    # Most clicked buttons
-    top_buttons = db.query(
-        UIEvent.element_name,
-        func.count(UIEvent.id).label('count')
-    ).filter(
-        UIEvent.timestamp >= start_date,
-        UIEvent.timestamp <= end_date,
-        UIEvent.element_type == 'button',
-        UIEvent.interaction_type == 'click'
-    )
-    if page_path:
-        top_buttons = top_buttons.filter(UIEvent.page_path == page_path)
-    top_buttons = top_buttons.group_by(UIEvent.element_name).order_by(func.count(UIEvent.id).desc()).limit(10).all()
-    
-    # Events by page
-    events_by_page = db.query(
-        UIEvent.page_path,
-        func.count(UIEvent.id).label('count')
-    ).filter(
-        UIEvent.timestamp >= start_date,
-        UIEvent.timestamp <= end_date
-    ).group_by(UIEvent.page_path).order_by(func.count(UIEvent.id).desc()).limit(10).all()
+    rollup = await rollup_range(db, UIEventHourly, start_date, end_date)
+    if rollup:
+        rollup_start, rollup_end = rollup
+        raw_window = or_(
+            and_(UIEvent.timestamp >= start_date, UIEvent.timestamp < rollup_start),
+            and_(UIEvent.timestamp >= rollup_end, UIEvent.timestamp <= end_date)
+        )
+        sources = [
+            (UIEvent, func.count(), raw_window),
+            (UIEventHourly, func.sum(UIEventHourly.event_count), and_(
+                UIEventHourly.hour >= rollup_start,
+                UIEventHourly.hour < rollup_end
+            )),
+        ]
+    else:
+        sources = [(UIEvent, func.count(), and_(
+            UIEvent.timestamp >= start_date,
+            UIEvent.timestamp <= end_date
+        ))]
     
-    # Events by element type
-    events_by_element = db.query(
-        UIEvent.element_type,
-        func.count(UIEvent.id).label('count')
-    ).filter(
-        UIEvent.timestamp >= start_date,
-        UIEvent.timestamp <= end_date
-    )
-    if page_path:
-        events_by_element = events_by_element.filter(UIEvent.page_path == page_path)
-    events_by_element = events_by_element.group_by(UIEvent.element_type).all()
+    # Counts by interaction type, clicked button, page and element type,
+    # summed over raw events and rollup
+    interaction_types: Dict[Any, int] = {}
+    button_clicks: Dict[Any, int] = {}
+    page_counts: Dict[Any, int] = {}
+    element_type_counts: Dict[Any, int] = {}
+    breakdowns = (interaction_types, button_clicks, page_counts, element_type_counts)
+    for model, count, window in sources:
+        for breakdown, rows in zip(breakdowns, await ui_event_breakdowns(db, model, count, window, page_path)):
+            for key, n in rows:
+                if n:
+                    breakdown[key] = breakdown.get(key, 0) + int(n)
+    
+    def top(counts: Dict[Any, int], limit: int = 10):
+        return sorted(counts.items(), key=lambda item: item[1], reverse=True)[:limit]
+    
+    # Every event has an interaction type, so they add up to the total
+    total_events = sum(interaction_types.values())
+    top_buttons = top(button_clicks)
+    events_by_page = top(page_counts)
+    events_by_element = element_type_counts
     
     return {
         "total_events": total_events,
         "unique_users": unique_users,
         "unique_sessions": unique_sessions,
-        "interaction_types": {it: count for it, count in interaction_types},
+        "interaction_types": interaction_types,
         "top_buttons": [{"name": name, "count": count} for name, count in top_buttons],
         "events_by_page": {page: count for page, count in events_by_page if page},
-        "events_by_element_type": {et: count for et, count in events_by_element if et},
+        "events_by_element_type": {et: count for et, count in events_by_element.items() if et},
         "start_date": start_date,
         "end_date": end_date
     }
 
 # Error tracking endpoints
 class UIErrorCreate(BaseModel):
+    model_config = INGEST_MODEL_CONFIG
+    
     user_id: Optional[int] = None
     session_id: Optional[str] = None
     error_message: str
@@ -600,10 +1136,19 @@ class UIErrorResponse(BaseModel):
     page_context: Optional[str]
     timestamp: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+def truncate_payload(value):
+    """Cut strings in a request/response body or headers dict to MAX_ERROR_PAYLOAD_CHARS"""
+    if isinstance(value, str) and len(value) > MAX_ERROR_PAYLOAD_CHARS:
+        return f"{value[:MAX_ERROR_PAYLOAD_CHARS]}...[truncated {len(value) - MAX_ERROR_PAYLOAD_CHARS} chars]"
+    if isinstance(value, dict):
+        return {key: truncate_payload(item) for key, item in value.items()}
+    return value
 
 class ServiceErrorCreate(BaseModel):
+    model_config = INGEST_MODEL_CONFIG
+    
     user_id: Optional[int] = None
     session_id: Optional[str] = None
     error_message: str
@@ -624,6 +1169,11 @@ class ServiceErrorCreate(BaseModel):
     error_metadata: Optional[Dict[str, Any]] = None
     user_agent: Optional[str] = None
     ip_address: Optional[str] = None
+    
+    # Bodies and headers can be many KB each and would dominate the row
+    _truncate_payloads = field_validator(
+        "request_headers", "request_body", "response_body", "response_headers"
+    )(truncate_payload)
 
 class ServiceErrorResponse(BaseModel):
     id: int
@@ -641,13 +1191,12 @@ class ServiceErrorResponse(BaseModel):
     error_code: Optional[str]
     timestamp: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 @app.post("/errors/ui", response_model=UIErrorResponse, tags=["Errors"], summary="Create UI error")
 async def create_ui_error(
     error: UIErrorCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a UI console error from the frontend"""
     db_error = UIError(
@@ -670,39 +1219,37 @@ async def create_ui_error(
         timestamp=datetime.utcnow()
     )
     db.add(db_error)
-    db.commit()
-    db.refresh(db_error)
+    await db.commit()
     return db_error
 
+class BulkUIErrorsCreate(BaseModel):
+    errors: List[UIErrorCreate]
+
+@app.post("/errors/ui/bulk", tags=["Errors"], summary="Create UI errors in bulk")
+async def create_ui_errors_bulk(
+    batch: BulkUIErrorsCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """Create a batch of UI console errors in one insert"""
+    now = datetime.utcnow()
+    rows = [{**error.model_dump(), "timestamp": now} for error in batch.errors]
+    inserted = await bulk_insert_rows(db, UIError, rows)
+    await db.commit()
+    return {"inserted": inserted}
+
 @app.post("/errors/services", response_model=ServiceErrorResponse, tags=["Errors"], summary="Create service error")
 async def create_service_error(
     error: ServiceErrorCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a service/network error"""
-    # Auto-determine severity from status_code if not provided
-    severity = error.severity
-    if not severity and error.status_code:
-        if 500 <= error.status_code < 600:
-            severity = "ERROR"
-        elif 400 <= error.status_code < 500:
-            # 404s might be INFO, others WARNING
-            if error.status_code == 404:
-                severity = "INFO"
-            else:
-                severity = "WARNING"
-        else:
-            severity = "INFO"
-    elif not severity:
-        severity = "ERROR"  # Default to ERROR if no status code
-    
     db_error = ServiceError(
         user_id=error.user_id,
         session_id=error.session_id,
         error_message=error.error_message,
         error_type=error.error_type,
         status_code=error.status_code,
-        severity=severity,
+        severity=error.severity or None,  # Derived from status_code by the column default
         request_url=error.request_url,
         request_method=error.request_method,
         request_headers=error.request_headers,
@@ -720,12 +1267,31 @@ async def create_service_error(
         timestamp=datetime.utcnow()
     )
     db.add(db_error)
-    db.commit()
-    db.refresh(db_error)
+    await db.commit()
     return db_error
 
+class BulkServiceErrorsCreate(BaseModel):
+    errors: List[ServiceErrorCreate]
+
+@app.post("/errors/services/bulk", tags=["Errors"], summary="Create service errors in bulk")
+async def create_service_errors_bulk(
+    batch: BulkServiceErrorsCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """Create a batch of service errors in one insert (used by the Python client)"""
+    now = datetime.utcnow()
+    # COPY skips column defaults, so the severity is filled in here
+    rows = [
+        {**error.model_dump(), "severity": error.severity or severity_for_status(error.status_code), "timestamp": now}
+        for error in batch.errors
+    ]
+    inserted = await bulk_insert_rows(db, ServiceError, rows)
+    await db.commit()
+    return {"inserted": inserted}
+
 @app.get("/errors/ui", response_model=List[UIErrorResponse], tags=["Errors"], summary="Get UI errors")
 async def get_ui_errors(
+    response: Response,
     user_id: Optional[int] = None,
     session_id: Optional[str] = None,
     error_type: Optional[str] = None,
@@ -733,10 +1299,11 @@ async def get_ui_errors(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,  # X-Next-Cursor of the previous page
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get UI console errors"""
-    query = db.query(UIError)
+    """Get UI console errors (newest first, paged with cursor)"""
+    query = select(UIError)
     
     if user_id:
         query = query.filter(UIError.user_id == user_id)
@@ -751,11 +1318,12 @@ async def get_ui_errors(
     if end_date:
         query = query.filter(UIError.timestamp <= end_date)
     
-    errors = query.order_by(UIError.timestamp.desc()).limit(limit).all()
+    errors = await list_page(db, query, UIError, limit, cursor, response)
     return errors
 
 @app.get("/errors/services", response_model=List[ServiceErrorResponse], tags=["Errors"], summary="Get service errors")
 async def get_service_errors(
+    response: Response,
     user_id: Optional[int] = None,
     session_id: Optional[str] = None,
     service_name: Optional[str] = None,
@@ -766,10 +1334,11 @@ async def get_service_errors(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,  # X-Next-Cursor of the previous page
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get service/network errors"""
-    query = db.query(ServiceError)
+    """Get service/network errors (newest first, paged with cursor)"""
+    query = select(ServiceError)
     
     if user_id:
         query = query.filter(ServiceError.user_id == user_id)
@@ -790,128 +1359,165 @@ async def get_service_errors(
     if end_date:
         query = query.filter(ServiceError.timestamp <= end_date)
     
-    errors = query.order_by(ServiceError.timestamp.desc()).limit(limit).all()
+    errors = await list_page(db, query, ServiceError, limit, cursor, response)
     return errors
 
+async def count_by_each(db: AsyncSession, count, columns, filters):
+    """Count the rows matching filters in total and by each of columns.
+    
+    count is the aggregate to use, e.g. func.count(). On PostgreSQL the total
+    and all the breakdowns come from a single scan with GROUPING SETS, the
+    empty set giving the total, and are streamed from a server-side cursor;
+    other databases run one GROUP BY query per column.
+    
+    Returns (total, counts), counts holding one {value: count} dict per
+    column, in order. NULL values are left out of the breakdowns by the
+    database; those rows still count toward the total.
+    """
+    if engine.dialect.name != "postgresql":
+        total = await db.scalar(select(count).where(*filters))
+        counts = []
+        for column in columns:
+            rows = (await db.execute(
+                select(column, count).where(*filters, column.isnot(None)).group_by(column)
+            )).all()
+            counts.append(dict(rows))
+        return total, counts
+    
+    # GROUPING() is a bitmask of the columns a row is not grouped by (first
+    # column highest), so the row of each grouping set has all bits but its
+    # own, and the total row has them all
+    all_columns = (1 << len(columns)) - 1
+    column_index = {all_columns ^ (1 << (len(columns) - 1 - i)): i for i in range(len(columns))}
+    total, counts = 0, [{} for _ in columns]
+    # A WHERE on one column would drop rows from the other sets, so the NULL
+    # groups are removed after grouping instead
+    # Streamed in batches, so high-cardinality columns (e.g. thousands of
+    # service names) aren't buffered as rows on top of the count dicts
+    rows = await db.stream(
+        select(func.grouping(*columns), *columns, count)
+        .where(*filters)
+        .group_by(func.grouping_sets(*columns, text("()")))
+        .having(and_(*(or_(func.grouping(column) == 1, column.isnot(None)) for column in columns)))
+        .execution_options(yield_per=1000)
+    )
+    async for grouping, *values, n in rows:
+        if grouping == all_columns:
+            total = n
+        else:
+            i = column_index[grouping]
+            counts[i][values[i]] = n
+    return total, counts
+
+async def count_errors_by_each(hourly_model, filters, start_date: datetime, end_date: datetime):
+    """Count the errors in the window matching filters in total and by each
+    grouping column of hourly_model, like count_by_each.
+    
+    Without filters, the complete hours already in the hourly rollup are
+    read from it, and only the rest of the window from raw errors. The rollup
+    has no user or session columns, so filtered counts scan raw errors. Runs
+    in a session of its own (an AsyncSession runs one statement at a time),
+    so the counts of both error tables can run concurrently.
+    """
+    model, columns, count_column = HOURLY_ROLLUPS[hourly_model]
+    async with SessionLocal() as db:
+        rollup = None if filters else await rollup_range(db, hourly_model, start_date, end_date)
+        if rollup is None:
+            return await count_by_each(
+                db,
+                func.count(),
+                [getattr(model, column) for column in columns],
+                [model.timestamp >= start_date, model.timestamp <= end_date, *filters]
+            )
+        
+        rollup_start, rollup_end = rollup
+        sources = [
+            (model, func.count(), or_(
+                and_(model.timestamp >= start_date, model.timestamp < rollup_start),
+                and_(model.timestamp >= rollup_end, model.timestamp <= end_date)
+            )),
+            (hourly_model, func.sum(getattr(hourly_model, count_column)), and_(
+                hourly_model.hour >= rollup_start,
+                hourly_model.hour < rollup_end
+            )),
+        ]
+        total, counts = 0, [{} for _ in columns]
+        for source, count, window in sources:
+            source_total, source_counts = await count_by_each(
+                db, count, [getattr(source, column) for column in columns], [window]
+            )
+            # SUM over no rows is NULL
+            total += int(source_total or 0)
+            for merged, part in zip(counts, source_counts):
+                for key, n in part.items():
+                    merged[key] = merged.get(key, 0) + int(n)
+        return total, counts
+
 @app.get("/errors/total", tags=["Errors"], summary="Get total errors")
 async def get_total_errors(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     user_id: Optional[int] = None,
     session_id: Optional[str] = None,
-    db: Session = Depends(get_db)
 ):
-    """Get total errors (UI + service errors) with summary statistics"""
+    """Get total errors (UI + service errors) with summary statistics
+    
+    Results are cached for STATS_CACHE_TTL_SECONDS. The dates are truncated
+    to the minute, so dashboards polling a moving window share cache entries.
+    """
     if not start_date:
         start_date = datetime.utcnow() - timedelta(days=7)
     if not end_date:
         end_date = datetime.utcnow()
+    start_date = start_date.replace(second=0, microsecond=0)
+    end_date = end_date.replace(second=0, microsecond=0)
     
-    # Base queries
-    ui_errors_query = db.query(UIError).filter(
-        UIError.timestamp >= start_date,
-        UIError.timestamp <= end_date
-    )
-    service_errors_query = db.query(ServiceError).filter(
-        ServiceError.timestamp >= start_date,
-        ServiceError.timestamp <= end_date
-    )
+    cache_key = ("/errors/total", start_date, end_date, user_id, session_id)
+    cached = stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    ui_filters = []
+    service_filters = []
     
     # Apply optional filters
     if user_id:
-        ui_errors_query = ui_errors_query.filter(UIError.user_id == user_id)
-        service_errors_query = service_errors_query.filter(ServiceError.user_id == user_id)
+        ui_filters.append(UIError.user_id == user_id)
+        service_filters.append(ServiceError.user_id == user_id)
     if session_id:
-        ui_errors_query = ui_errors_query.filter(UIError.session_id == session_id)
-        service_errors_query = service_errors_query.filter(ServiceError.session_id == session_id)
+        ui_filters.append(UIError.session_id == session_id)
+        service_filters.append(ServiceError.session_id == session_id)
+    
+    # The UI and service error counts run concurrently
+    (total_ui_errors, (ui_errors_by_type,)), (total_service_errors, (
+        service_errors_by_type,
+        service_errors_by_status,
+        service_errors_by_service,
+        service_errors_by_severity,
+    )) = await asyncio.gather(
+        count_errors_by_each(UIErrorHourly, ui_filters, start_date, end_date),
+        count_errors_by_each(ServiceErrorHourly, service_filters, start_date, end_date),
+    )
     
-    # Counts
-    total_ui_errors = ui_errors_query.count()
-    total_service_errors = service_errors_query.count()
     total_errors = total_ui_errors + total_service_errors
     
-    # UI errors by type
-    ui_errors_by_type = db.query(
-        UIError.error_type,
-        func.count(UIError.id).label('count')
-    ).filter(
-        UIError.timestamp >= start_date,
-        UIError.timestamp <= end_date
-    )
-    if user_id:
-        ui_errors_by_type = ui_errors_by_type.filter(UIError.user_id == user_id)
-    if session_id:
-        ui_errors_by_type = ui_errors_by_type.filter(UIError.session_id == session_id)
-    ui_errors_by_type = ui_errors_by_type.group_by(UIError.error_type).all()
-    
-    # Service errors by type
-    service_errors_by_type = db.query(
-        ServiceError.error_type,
-        func.count(ServiceError.id).label('count')
-    ).filter(
-        ServiceError.timestamp >= start_date,
-        ServiceError.timestamp <= end_date
-    )
-    if user_id:
-        service_errors_by_type = service_errors_by_type.filter(ServiceError.user_id == user_id)
-    if session_id:
-        service_errors_by_type = service_errors_by_type.filter(ServiceError.session_id == session_id)
-    service_errors_by_type = service_errors_by_type.group_by(ServiceError.error_type).all()
-    
-    # Service errors by status code
-    service_errors_by_status = db.query(
-        ServiceError.status_code,
-        func.count(ServiceError.id).label('count')
-    ).filter(
-        ServiceError.timestamp >= start_date,
-        ServiceError.timestamp <= end_date
-    )
-    if user_id:
-        service_errors_by_status = service_errors_by_status.filter(ServiceError.user_id == user_id)
-    if session_id:
-        service_errors_by_status = service_errors_by_status.filter(ServiceError.session_id == session_id)
-    service_errors_by_status = service_errors_by_status.group_by(ServiceError.status_code).all()
-    
-    # Service errors by service name
-    service_errors_by_service = db.query(
-        ServiceError.service_name,
-        func.count(ServiceError.id).label('count')
-    ).filter(
-        ServiceError.timestamp >= start_date,
-        ServiceError.timestamp <= end_date
-    )
-    if user_id:
-        service_errors_by_service = service_errors_by_service.filter(ServiceError.user_id == user_id)
-    if session_id:
-        service_errors_by_service = service_errors_by_service.filter(ServiceError.session_id == session_id)
-    service_errors_by_service = service_errors_by_service.group_by(ServiceError.service_name).order_by(func.count(ServiceError.id).desc()).limit(10).all()
-    
-    # Service errors by severity
-    service_errors_by_severity = db.query(
-        ServiceError.severity,
-        func.count(ServiceError.id).label('count')
-    ).filter(
-        ServiceError.timestamp >= start_date,
-        ServiceError.timestamp <= end_date
-    )
-    if user_id:
-        service_errors_by_severity = service_errors_by_severity.filter(ServiceError.user_id == user_id)
-    if session_id:
-        service_errors_by_severity = service_errors_by_severity.filter(ServiceError.session_id == session_id)
-    service_errors_by_severity = service_errors_by_severity.group_by(ServiceError.severity).all()
+    # Top 10 services by error count
+    top_services = sorted(service_errors_by_service.items(), key=lambda item: item[1], reverse=True)[:10]
     
-    return {
+    summary = {
         "total_errors": total_errors,
         "total_ui_errors": total_ui_errors,
         "total_service_errors": total_service_errors,
-        "ui_errors_by_type": {et: count for et, count in ui_errors_by_type if et},
-        "service_errors_by_type": {et: count for et, count in service_errors_by_type if et},
-        "service_errors_by_status_code": {sc: count for sc, count in service_errors_by_status if sc},
-        "service_errors_by_severity": {sv: count for sv, count in service_errors_by_severity if sv},
-        "service_errors_by_service": {sn: count for sn, count in service_errors_by_service if sn},
+        "ui_errors_by_type": ui_errors_by_type,
+        "service_errors_by_type": service_errors_by_type,
+        "service_errors_by_status_code": service_errors_by_status,
+        "service_errors_by_severity": service_errors_by_severity,
+        "service_errors_by_service": dict(top_services),
         "start_date": start_date,
         "end_date": end_date
     }
+    stats_cache[cache_key] = summary
+    return summary
 
 # Session recording endpoints
 class RecordedSessionCreate(BaseModel):
@@ -928,8 +1534,7 @@ class RecordedSessionResponse(BaseModel):
     notes: Optional[str]
     session_metadata: Optional[Dict[str, Any]]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class RecordedSessionUpdate(BaseModel):
     name: Optional[str] = None
@@ -939,73 +1544,74 @@ class RecordedSessionUpdate(BaseModel):
 @app.post("/sessions/record", response_model=RecordedSessionResponse, tags=["Sessions"], summary="Start recording a session")
 async def start_recording_session(
     session: RecordedSessionCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Start recording a new session"""
     db_session = RecordedSession(
         name=session.name,
         notes=session.notes,
-        session_metadata=session.session_metadata,
-        started_at=datetime.utcnow()
+        session_metadata=session.session_metadata
     )
     db.add(db_session)
-    db.commit()
-    db.refresh(db_session)
+    await db.commit()
     logger.info(f"Started recording session: ID={db_session.id}, name={session.name}")
     return db_session
 
 @app.post("/sessions/record/{session_id}/end", response_model=RecordedSessionResponse, tags=["Sessions"], summary="End recording a session")
 async def end_recording_session(
     session_id: int,
-    update: Optional[RecordedSessionUpdate] = None,
-    db: Session = Depends(get_db)
+    changes: Optional[RecordedSessionUpdate] = None,
+    db: AsyncSession = Depends(get_db)
 ):
-    """End recording a session"""
-    db_session = db.query(RecordedSession).filter(RecordedSession.id == session_id).first()
-    if not db_session:
-        raise HTTPException(status_code=404, detail="Session not found")
-    if db_session.ended_at:
-        raise HTTPException(status_code=400, detail="Session already ended")
+    """End recording a session
     
-    db_session.ended_at = datetime.utcnow()
-    duration = (db_session.ended_at - db_session.started_at).total_seconds()
-    db_session.duration_seconds = int(duration)
+    The session is ended with a single UPDATE ... RETURNING guarded by
+    ended_at IS NULL, so two concurrent requests can't both end it. Only
+    when no row matches is the session looked up, to tell 404 from 400.
+    """
+    values = {"ended_at": UTC_NOW}
+    if changes:
+        values.update(changes.model_dump(exclude_none=True))
     
-    if update:
-        if update.name is not None:
-            db_session.name = update.name
-        if update.notes is not None:
-            db_session.notes = update.notes
-        if update.session_metadata is not None:
-            db_session.session_metadata = update.session_metadata
+    db_session = (await db.execute(
+        update(RecordedSession)
+        .where(RecordedSession.id == session_id, RecordedSession.ended_at.is_(None))
+        .values(**values)
+        .returning(RecordedSession)
+    )).scalar_one_or_none()
+    if db_session is None:
+        if await db.get(RecordedSession, session_id) is None:
+            raise HTTPException(status_code=404, detail="Session not found")
+        raise HTTPException(status_code=400, detail="Session already ended")
     
-    db.commit()
-    db.refresh(db_session)
+    await db.commit()
     logger.info(f"Ended recording session: ID={session_id}, duration={db_session.duration_seconds}s")
     return db_session
 
 @app.get("/sessions/record", response_model=List[RecordedSessionResponse], tags=["Sessions"], summary="List recorded sessions")
 async def list_recorded_sessions(
+    response: Response,
     limit: int = 100,
     include_active: bool = True,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,  # X-Next-Cursor of the previous page
+    db: AsyncSession = Depends(get_db)
 ):
-    """List all recorded sessions"""
-    query = db.query(RecordedSession)
+    """List recorded sessions (most recently started first, paged with cursor)"""
+    query = select(RecordedSession)
     
     if not include_active:
         query = query.filter(RecordedSession.ended_at.isnot(None))
     
-    sessions = query.order_by(RecordedSession.started_at.desc()).limit(limit).all()
+    sessions = await list_page(db, query, RecordedSession, limit, cursor, response, RecordedSession.started_at)
     return sessions
 
 @app.get("/sessions/record/{session_id}", response_model=RecordedSessionResponse, tags=["Sessions"], summary="Get a recorded session")
 async def get_recorded_session(
     session_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get a specific recorded session"""
-    session = db.query(RecordedSession).filter(RecordedSession.id == session_id).first()
+    session = await db.get(RecordedSession, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     return session
@@ -1015,7 +1621,7 @@ async def health():
     return {"status": "ok", "service": "observability-service"}
 
 @app.get("/test-event", tags=["Health"], summary="Test event creation")
-async def test_event(db: Session = Depends(get_db)):
+async def test_event(db: AsyncSession = Depends(get_db)):
     """Test endpoint to verify event creation works"""
     try:
         test_event = UserEvent(
@@ -1026,8 +1632,7 @@ async def test_event(db: Session = Depends(get_db)):
             timestamp=datetime.utcnow()
         )
         db.add(test_event)
-        db.commit()
-        db.refresh(test_event)
+        await db.commit()
         logger.info(f"Test event created: ID={test_event.id}")
         return {
             "status": "success",
@@ -1041,5 +1646,5 @@ async def test_event(db: Session = Depends(get_db)):
         }
     except Exception as e:
         logger.error(f"Error creating test event: {e}", exc_info=True)
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create test event: {str(e)}")
\ No newline at end of file
@@ -1,19 +1,31 @@
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Text, Index, Boolean
+from sqlalchemy import Column, Computed, Integer, String, DateTime, Text, Index, Boolean, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
+from typing import Optional
 
 Base = declarative_base()
 
+# Event tables are range partitioned by week on timestamp (PostgreSQL), so
+# retention cleanup can drop whole partitions. The partition key has to be
+# part of the primary key, hence (id, timestamp). Partitions are created and
+# dropped by the service; see database.py.
+PARTITIONED_BY_WEEK = {"postgresql_partition_by": "RANGE (timestamp)"}
+
+# The database's current time as a naive UTC timestamp
+UTC_NOW = text("timezone('utc', now())")
+
 class UserEvent(Base):
     __tablename__ = "user_events"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=True, index=True)
-    session_id = Column(String(255), nullable=True, index=True)
-    event_type = Column(String(100), nullable=False, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, nullable=True)
+    session_id = Column(String(255), nullable=True)
+    event_type = Column(String(100), nullable=False)
     event_category = Column(String(50), nullable=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
-    event_metadata = Column(JSON, nullable=True)
+    timestamp = Column(DateTime, default=datetime.utcnow, primary_key=True)  # Leads the (timestamp, id) index
+    event_metadata = Column(JSONB, nullable=True)
     user_agent = Column(Text, nullable=True)
     ip_address = Column(String(45), nullable=True)
     service_name = Column(String(50), nullable=True)
@@ -22,6 +34,10 @@ class UserEvent(Base):
     __table_args__ = (
         Index('idx_user_events_user_timestamp', 'user_id', 'timestamp'),
         Index('idx_user_events_session_timestamp', 'session_id', 'timestamp'),
+        Index('idx_user_events_type_timestamp', 'event_type', 'timestamp'),
+        Index('idx_user_events_user_type_timestamp', 'user_id', 'event_type', 'timestamp'),
+        Index('idx_user_events_timestamp_id', 'timestamp', 'id'),  # Keyset pagination
+        PARTITIONED_BY_WEEK,
     )
 
 class UserSession(Base):
@@ -45,27 +61,27 @@ class UIEvent(Base):
     """
     __tablename__ = "ui_events"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=True, index=True)
-    session_id = Column(String(255), nullable=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, nullable=True)
+    session_id = Column(String(255), nullable=True)
     
     # UI-specific fields
-    interaction_type = Column(String(50), nullable=False, index=True)  # click, change, focus, blur, submit
-    element_type = Column(String(50), nullable=True, index=True)  # button, input, checkbox, select, form
+    interaction_type = Column(String(50), nullable=False)  # click, change, focus, blur, submit
+    element_type = Column(String(50), nullable=True)  # button, input, checkbox, select, form
     element_name = Column(String(255), nullable=True, index=True)  # name/id of the element
     element_id = Column(String(255), nullable=True)  # HTML id if available
     
     # Context
-    page_path = Column(String(500), nullable=True, index=True)  # Current route/page
-    page_context = Column(String(255), nullable=True, index=True)  # Component/page context
+    page_path = Column(String(500), nullable=True)  # Current route/page
+    page_context = Column(String(255), nullable=True)  # Component/page context
     route_name = Column(String(255), nullable=True, index=True)  # Named route if available
     
     # Event details
     event_value = Column(Text, nullable=True)  # For inputs: value (sanitized), for checkboxes: checked state
-    event_metadata = Column(JSON, nullable=True)  # Additional flexible metadata
+    event_metadata = Column(JSONB, nullable=True)  # Additional flexible metadata
     
     # Technical context
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime, default=datetime.utcnow, primary_key=True)  # Leads the (timestamp, id) index
     user_agent = Column(Text, nullable=True)
     viewport_width = Column(Integer, nullable=True)  # Screen width
     viewport_height = Column(Integer, nullable=True)  # Screen height
@@ -80,6 +96,12 @@ class UIEvent(Base):
         Index('idx_ui_events_page_element', 'page_path', 'element_type', 'element_name'),
         Index('idx_ui_events_interaction_type', 'interaction_type', 'timestamp'),
         Index('idx_ui_events_context', 'page_context', 'interaction_type'),
+        # Filter + ORDER BY timestamp DESC LIMIT N of GET /ui-events
+        Index('idx_ui_events_page_timestamp', 'page_path', 'timestamp'),
+        Index('idx_ui_events_element_type_timestamp', 'element_type', 'timestamp'),
+        Index('idx_ui_events_context_timestamp', 'page_context', 'timestamp'),
+        Index('idx_ui_events_timestamp_id', 'timestamp', 'id'),  # Keyset pagination
+        PARTITIONED_BY_WEEK,
     )
 
 class UIError(Base):
@@ -89,40 +111,61 @@ class UIError(Base):
     """
     __tablename__ = "ui_errors"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=True, index=True)
-    session_id = Column(String(255), nullable=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, nullable=True)
+    session_id = Column(String(255), nullable=True)
     
     # Error details
     error_message = Column(Text, nullable=False)  # The error message
-    error_type = Column(String(100), nullable=True, index=True)  # Error, TypeError, ReferenceError, etc.
+    error_type = Column(String(100), nullable=True)  # Error, TypeError, ReferenceError, etc.
     error_stack = Column(Text, nullable=True)  # Stack trace
     error_source = Column(String(500), nullable=True)  # Source file/URL where error occurred
     line_number = Column(Integer, nullable=True)  # Line number in source
     column_number = Column(Integer, nullable=True)  # Column number in source
     
     # Context
-    page_path = Column(String(500), nullable=True, index=True)  # Current route/page
+    page_path = Column(String(500), nullable=True)  # Current route/page
     page_context = Column(String(255), nullable=True)  # Component/page context
     route_name = Column(String(255), nullable=True)  # Named route if available
     
     # Additional metadata
-    error_metadata = Column(JSON, nullable=True)  # Additional flexible metadata
+    error_metadata = Column(JSONB, nullable=True)  # Additional flexible metadata
     user_agent = Column(Text, nullable=True)
     viewport_width = Column(Integer, nullable=True)
     viewport_height = Column(Integer, nullable=True)
     device_type = Column(String(50), nullable=True)
     
     # Timestamp
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime, default=datetime.utcnow, primary_key=True)  # Leads the (timestamp, id) index
     
     __table_args__ = (
         Index('idx_ui_errors_user_timestamp', 'user_id', 'timestamp'),
         Index('idx_ui_errors_session_timestamp', 'session_id', 'timestamp'),
         Index('idx_ui_errors_type_timestamp', 'error_type', 'timestamp'),
         Index('idx_ui_errors_page_timestamp', 'page_path', 'timestamp'),
+        Index('idx_ui_errors_timestamp_id', 'timestamp', 'id'),  # Keyset pagination
+        # Index-only scans for the /errors/total counts over a time range
+        Index('idx_ui_errors_ts_covering', 'timestamp',
+              postgresql_include=['error_type', 'user_id', 'session_id']),
+        PARTITIONED_BY_WEEK,
     )
 
+def severity_for_status(status_code: Optional[int]) -> str:
+    """Default severity of a service error with the given HTTP status code"""
+    if not status_code:
+        return "ERROR"  # Default to ERROR if no status code
+    if 500 <= status_code < 600:
+        return "ERROR"
+    if status_code == 404:
+        return "INFO"  # 404s might be INFO, other client errors WARNING
+    if 400 <= status_code < 500:
+        return "WARNING"
+    return "INFO"
+
+def default_severity(context) -> str:
+    """Column default of ServiceError.severity, set when the error has none"""
+    return severity_for_status(context.get_current_parameters().get("status_code"))
+
 class ServiceError(Base):
     """
     Table for storing service/network errors.
@@ -130,29 +173,31 @@ class ServiceError(Base):
     """
     __tablename__ = "service_errors"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=True, index=True)
-    session_id = Column(String(255), nullable=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, nullable=True)
+    session_id = Column(String(255), nullable=True)
     
     # Error details
     error_message = Column(Text, nullable=False)  # The error message
-    error_type = Column(String(100), nullable=True, index=True)  # NetworkError, HTTPError, TimeoutError, etc.
-    status_code = Column(Integer, nullable=True, index=True)  # HTTP status code (if applicable)
-    severity = Column(String(20), nullable=True, index=True)  # INFO, WARNING, ERROR - log level/severity
+    error_type = Column(String(100), nullable=True)  # NetworkError, HTTPError, TimeoutError, etc.
+    status_code = Column(Integer, nullable=True)  # HTTP status code (if applicable)
+    severity = Column(String(20), nullable=True, default=default_severity)  # INFO, WARNING, ERROR - log level/severity
     
     # Request details
     request_url = Column(String(1000), nullable=True, index=True)  # The URL that failed
     request_method = Column(String(10), nullable=True)  # GET, POST, PUT, DELETE, etc.
-    request_headers = Column(JSON, nullable=True)  # Request headers (sanitized)
-    request_body = Column(Text, nullable=True)  # Request body (sanitized)
+    # The payload columns are deferred: they're the widest in the row (often
+    # TOASTed) and the list endpoints never return them
+    request_headers = deferred(Column(JSONB, nullable=True))  # Request headers (sanitized)
+    request_body = deferred(Column(Text, nullable=True))  # Request body (sanitized)
     
     # Response details
-    response_body = Column(Text, nullable=True)  # Response body (if available)
-    response_headers = Column(JSON, nullable=True)  # Response headers
+    response_body = deferred(Column(Text, nullable=True))  # Response body (if available)
+    response_headers = deferred(Column(JSONB, nullable=True))  # Response headers
     
     # Service context
-    service_name = Column(String(100), nullable=True, index=True)  # Name of the service that failed
-    endpoint = Column(String(500), nullable=True, index=True)  # API endpoint
+    service_name = Column(String(100), nullable=True)  # Name of the service that failed
+    endpoint = Column(String(500), nullable=True)  # API endpoint
     request_id = Column(String(255), nullable=True, index=True)  # Request ID for tracing
     
     # Network details
@@ -160,12 +205,12 @@ class ServiceError(Base):
     timeout_ms = Column(Integer, nullable=True)  # Timeout duration if applicable
     
     # Additional metadata
-    error_metadata = Column(JSON, nullable=True)  # Additional flexible metadata
+    error_metadata = Column(JSONB, nullable=True)  # Additional flexible metadata
     user_agent = Column(Text, nullable=True)
     ip_address = Column(String(45), nullable=True)
     
     # Timestamp
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime, default=datetime.utcnow, primary_key=True)  # Leads the (timestamp, id) index
     
     __table_args__ = (
         Index('idx_service_errors_user_timestamp', 'user_id', 'timestamp'),
@@ -174,6 +219,13 @@ class ServiceError(Base):
         Index('idx_service_errors_status_timestamp', 'status_code', 'timestamp'),
         Index('idx_service_errors_type_timestamp', 'error_type', 'timestamp'),
         Index('idx_service_errors_severity_timestamp', 'severity', 'timestamp'),
+        Index('idx_service_errors_endpoint_timestamp', 'endpoint', 'timestamp'),
+        Index('idx_service_errors_timestamp_id', 'timestamp', 'id'),  # Keyset pagination
+        # Index-only scans for the /errors/total counts over a time range
+        Index('idx_service_errors_ts_covering', 'timestamp',
+              postgresql_include=['error_type', 'status_code', 'service_name', 'severity', 'user_id', 'session_id']),
+        Index('idx_service_errors_metadata_gin', 'error_metadata', postgresql_using='gin'),  # @> filters on metadata
+        PARTITIONED_BY_WEEK,
     )
 
 class RecordedSession(Base):
@@ -183,15 +235,69 @@ class RecordedSession(Base):
     """
     __tablename__ = "recorded_sessions"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=True)  # Optional name for the session
-    started_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    ended_at = Column(DateTime, nullable=True, index=True)
-    duration_seconds = Column(Integer, nullable=True)  # Calculated duration
+    # Stamped by the database clock (as naive UTC, like every timestamp here),
+    # so both ends of duration_seconds come from the same clock
+    started_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
+    ended_at = Column(DateTime, nullable=True)
+    # Generated by the database from started_at/ended_at in whole seconds
+    # (truncated, not rounded); NULL while recording
+    duration_seconds = Column(Integer, Computed("floor(EXTRACT(EPOCH FROM (ended_at - started_at)))::int", persisted=True))
     notes = Column(Text, nullable=True)  # Optional notes about the session
-    session_metadata = Column(JSON, nullable=True)  # Additional flexible metadata (renamed from 'metadata' to avoid SQLAlchemy reserved word)
+    session_metadata = Column(JSONB, nullable=True)  # Additional flexible metadata (renamed from 'metadata' to avoid SQLAlchemy reserved word)
     
     __table_args__ = (
-        Index('idx_recorded_sessions_started', 'started_at'),
         Index('idx_recorded_sessions_ended', 'ended_at'),
+        Index('idx_recorded_sessions_started_id', 'started_at', 'id'),  # Keyset pagination
     )
+    # Read started_at and duration_seconds back with RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+
+class UIEventHourly(Base):
+    """
+    Hourly rollup of ui_events, maintained by the service's rollup task.
+    One row per hour and page/element/interaction combination, so analytics
+    over long windows read a few rows per hour instead of every event.
+    """
+    __tablename__ = "ui_event_hourly"
+    
+    id = Column(Integer, primary_key=True)
+    hour = Column(DateTime, nullable=False, index=True)  # Start of the hour
+    page_path = Column(String(500), nullable=True)
+    element_type = Column(String(50), nullable=True)
+    element_name = Column(String(255), nullable=True)
+    interaction_type = Column(String(50), nullable=False)
+    event_count = Column(Integer, nullable=False)
+    
+    __table_args__ = (
+        Index('idx_ui_event_hourly_page_hour', 'page_path', 'hour'),
+    )
+
+class UIErrorHourly(Base):
+    """
+    Hourly rollup of ui_errors, maintained by the service's rollup task.
+    One row per hour and error type, for the error summary over long windows.
+    """
+    __tablename__ = "ui_error_hourly"
+    
+    id = Column(Integer, primary_key=True)
+    hour = Column(DateTime, nullable=False, index=True)  # Start of the hour
+    error_type = Column(String(100), nullable=True)
+    error_count = Column(Integer, nullable=False)
+
+class ServiceErrorHourly(Base):
+    """
+    Hourly rollup of service_errors, maintained by the service's rollup task.
+    One row per hour and error type/status code/service/severity combination,
+    for the error summary over long windows.
+    """
+    __tablename__ = "service_error_hourly"
+    
+    id = Column(Integer, primary_key=True)
+    hour = Column(DateTime, nullable=False, index=True)  # Start of the hour
+    error_type = Column(String(100), nullable=True)
+    status_code = Column(Integer, nullable=True)
+    service_name = Column(String(100), nullable=True)
+    severity = Column(String(20), nullable=True)
+    error_count = Column(Integer, nullable=False)
@@ -14,9 +14,27 @@ from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+from grpc import Compression
 import os
 import logging
 
+# Batch sizes for the span and log processors, larger than the SDK defaults
+# (queue 2048, batches of 512 every 5s) so bursts aren't dropped and each
+# export carries more records. The standard OTEL_BSP_*/OTEL_BLRP_* variables
+# still override them.
+SPAN_BATCH_SETTINGS = dict(
+    max_queue_size=int(os.getenv("OTEL_BSP_MAX_QUEUE_SIZE", "8192")),
+    max_export_batch_size=int(os.getenv("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "2048")),
+    schedule_delay_millis=int(os.getenv("OTEL_BSP_SCHEDULE_DELAY", "1000")),
+    export_timeout_millis=int(os.getenv("OTEL_BSP_EXPORT_TIMEOUT", "30000")),
+)
+LOG_BATCH_SETTINGS = dict(
+    max_queue_size=int(os.getenv("OTEL_BLRP_MAX_QUEUE_SIZE", "8192")),
+    max_export_batch_size=int(os.getenv("OTEL_BLRP_MAX_EXPORT_BATCH_SIZE", "2048")),
+    schedule_delay_millis=int(os.getenv("OTEL_BLRP_SCHEDULE_DELAY", "1000")),
+    export_timeout_millis=int(os.getenv("OTEL_BLRP_EXPORT_TIMEOUT", "30000")),
+)
+
 def setup_opentelemetry(service_name: str, otel_collector_url: str = None):
     """
     Initialize OpenTelemetry for the observability service
@@ -42,19 +60,21 @@ def setup_opentelemetry(service_name: str, otel_collector_url: str = None):
     # Export traces to OTEL Collector
     otlp_trace_exporter = OTLPSpanExporter(
         endpoint=otel_collector_url,
-        insecure=True
+        insecure=True,
+        compression=Compression.Gzip
     )
-    span_processor = BatchSpanProcessor(otlp_trace_exporter)
+    span_processor = BatchSpanProcessor(otlp_trace_exporter, **SPAN_BATCH_SETTINGS)
     tracer_provider.add_span_processor(span_processor)
     
     # Setup Metrics
     otlp_metric_exporter = OTLPMetricExporter(
         endpoint=otel_collector_url,
-        insecure=True
+        insecure=True,
+        compression=Compression.Gzip
     )
     metric_reader = PeriodicExportingMetricReader(
         otlp_metric_exporter,
-        export_interval_millis=5000
+        export_interval_millis=10000
     )
     metrics.set_meter_provider(MeterProvider(
         resource=resource,
@@ -67,9 +87,10 @@ def setup_opentelemetry(service_name: str, otel_collector_url: str = None):
     
     otlp_log_exporter = OTLPLogExporter(
         endpoint=otel_collector_url,
-        insecure=True
+        insecure=True,
+        compression=Compression.Gzip
     )
-    log_provider.add_log_record_processor(BatchLogRecordProcessor(otlp_log_exporter))
+    log_provider.add_log_record_processor(BatchLogRecordProcessor(otlp_log_exporter, **LOG_BATCH_SETTINGS))
     
     # Configure Python logging to use OpenTelemetry
     handler = LoggingHandler(logger_provider=log_provider)
@@ -86,7 +107,7 @@ def instrument_fastapi(app, service_name: str):
     """Auto-instrument FastAPI application"""
     FastAPIInstrumentor.instrument_app(app)
 
-def instrument_sqlalchemy(engine):
-    """Auto-instrument SQLAlchemy"""
-    SQLAlchemyInstrumentor().instrument(engine=engine)
+def instrument_sqlalchemy(*engines):
+    """Auto-instrument SQLAlchemy engines (pass an AsyncEngine's sync_engine)"""
+    SQLAlchemyInstrumentor().instrument(engines=list(engines))
 